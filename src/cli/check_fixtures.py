@@ -3,26 +3,40 @@ Perform sanity checks on the framework's pydantic serialization and
 deserialization using generated json fixtures files.
 """
 
+import json
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Generator
+from typing import Generator, Iterator, List, Optional, Tuple
 
 import click
 from rich.progress import BarColumn, Progress, TaskProgressColumn, TextColumn, TimeElapsedColumn
 
 from ethereum_test_base_types import to_json
+from ethereum_test_fixtures.base import fixture_json_hash
 from ethereum_test_fixtures.file import Fixtures
+from ethereum_test_fixtures.store import STORE_DIR_NAME, FixtureStore
 from ethereum_test_specs.base import HashMismatchExceptionError
 
 
 def count_json_files_exclude_index(start_path: Path) -> int:
     """
     Return the number of json files in the specified directory, excluding
-    index.json files.
+    index.json files and the files in .meta and .store directories.
     """
-    json_file_count = sum(1 for file in start_path.rglob("*.json") if file.name != "index.json")
+    json_file_count = sum(1 for file in start_path.rglob("*.json") if is_fixture_file(file))
     return json_file_count
 
 
+def is_fixture_file(json_file_path: Path) -> bool:
+    """Return True if the json file is a fixture file, not an index, metadata or store file."""
+    return (
+        json_file_path.name != "index.json"
+        and ".meta" not in json_file_path.parts
+        and STORE_DIR_NAME not in json_file_path.parts
+    )
+
+
 def check_json(json_file_path: Path):
     """
     Check all fixtures in the specified json file:
@@ -36,7 +50,10 @@ def check_json(json_file_path: Path):
         a. Compare the newly calculated hashes from step 2. and 3. and
         b. If present, compare info["hash"] with the calculated hash from step 2.
     """
-    fixtures: Fixtures = Fixtures.model_validate_json(json_file_path.read_text())
+    fixtures: Fixtures = Fixtures.model_validate_json(
+        json_file_path.read_text(),
+        context={"fixture_store": FixtureStore.find(json_file_path)},
+    )
     fixtures_json = to_json(fixtures)
     fixtures_deserialized: Fixtures = Fixtures.model_validate(fixtures_json)
     for fixture_name, fixture in fixtures.items():
@@ -57,6 +74,80 @@ def check_json(json_file_path: Path):
             )
 
 
+def check_json_hashes(json_file_path: Path):
+    """
+    Check that the info["hash"] of every fixture in the specified json file
+    matches the hash of the fixture's raw json, without loading the fixtures
+    into pydantic models. References to a fixture store are replaced by the
+    stored values first.
+    """
+    with open(json_file_path, "r") as f:
+        fixtures = json.load(f)
+    store = FixtureStore.find(json_file_path)
+    for fixture_name, fixture in fixtures.items():
+        if store is not None:
+            fixture = store.inflate(fixture)
+        info = fixture.pop("_info", {})
+        json_hash = fixture_json_hash(fixture)
+        if "hash" in info and info["hash"] != json_hash:
+            raise HashMismatchExceptionError(
+                json_hash,
+                info["hash"],
+                message=f"Fixture info['hash'] does not match calculated hash for {fixture_name}:"
+                f"'{info['hash']}' != '{json_hash}'",
+            )
+
+
+def check_file(json_file_path: Path, hash_only: bool) -> Optional[str]:
+    """Check a json fixture file and return the error message, if any."""
+    try:
+        if hash_only:
+            check_json_hashes(json_file_path)
+        else:
+            check_json(json_file_path)
+    except Exception as e:
+        return str(e)
+    return None
+
+
+def check_files(
+    json_file_paths: List[Path], hash_only: bool, jobs: Optional[int], stop_on_error: bool
+) -> Iterator[Tuple[Path, Optional[str]]]:
+    """
+    Check the json fixture files, in a pool of `jobs` processes unless `jobs` is 1, and yield
+    each file with its error message, if any, in the order of the files.
+
+    If `stop_on_error` is set, the checks still pending are cancelled on the first failing file
+    and it is checked again in this process to raise the original exception.
+    """
+    check = partial(check_file, hash_only=hash_only)
+
+    def raise_error(json_file_path: Path):
+        if hash_only:
+            check_json_hashes(json_file_path)
+        else:
+            check_json(json_file_path)
+
+    if jobs == 1:
+        for json_file_path in json_file_paths:
+            error = check(json_file_path)
+            if error is not None and stop_on_error:
+                raise_error(json_file_path)
+            yield json_file_path, error
+        return
+    executor = ProcessPoolExecutor(max_workers=jobs)
+    try:
+        futures = [executor.submit(check, path) for path in json_file_paths]
+        for json_file_path, future in zip(json_file_paths, futures, strict=True):
+            error = future.result()
+            if error is not None and stop_on_error:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise_error(json_file_path)
+            yield json_file_path, error
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
 @click.command()
 @click.option(
     "--input",
@@ -85,7 +176,28 @@ def check_json(json_file_path: Path):
     expose_value=True,
     help="Stop and raise any exceptions encountered while checking fixtures.",
 )
-def check_fixtures(input_str: str, quiet_mode: bool, stop_on_error: bool):
+@click.option(
+    "--hash-only",
+    "hash_only",
+    is_flag=True,
+    default=False,
+    expose_value=True,
+    help=(
+        "Only check that the hash in the info of each fixture matches the hash of its raw json, "
+        "without loading the fixtures into pydantic models."
+    ),
+)
+@click.option(
+    "--jobs",
+    "-j",
+    "jobs",
+    type=int,
+    default=1,
+    help="Number of processes used to check the fixture files; 0 for the number of CPUs.",
+)
+def check_fixtures(
+    input_str: str, quiet_mode: bool, stop_on_error: bool, hash_only: bool, jobs: int
+):
     """Perform some checks on the fixtures contained in the specified directory."""
     input_path = Path(input_str)
     success = True
@@ -100,7 +212,9 @@ def check_fixtures(input_str: str, quiet_mode: bool, stop_on_error: bool):
         if input_path.is_file():
             yield input_path
         else:
-            yield from input_path.rglob("*.json")
+            for json_file_path in input_path.rglob("*.json"):
+                if is_fixture_file(json_file_path):
+                    yield json_file_path
 
     with Progress(
         TextColumn(
@@ -113,26 +227,21 @@ def check_fixtures(input_str: str, quiet_mode: bool, stop_on_error: bool):
         disable=quiet_mode,
     ) as progress:  # type: Progress
         task_id = progress.add_task("Checking fixtures", total=file_count, filename="...")
-        for json_file_path in get_input_files():
-            if json_file_path.name == "index.json":
-                continue
-
+        json_file_paths = list(get_input_files())
+        for json_file_path, error in check_files(
+            json_file_paths, hash_only=hash_only, jobs=jobs or None, stop_on_error=stop_on_error
+        ):
             display_filename = json_file_path.name
             if len(display_filename) > filename_display_width:
                 display_filename = display_filename[: filename_display_width - 3] + "..."
             else:
                 display_filename = display_filename.ljust(filename_display_width)
 
-            try:
-                progress.update(task_id, advance=1, filename=f"Checking {display_filename}")
-                check_json(json_file_path)
-            except Exception as e:
+            progress.update(task_id, advance=1, filename=f"Checking {display_filename}")
+            if error is not None:
                 success = False
-                if stop_on_error:
-                    raise e
-                else:
-                    progress.console.print(f"\nError checking {json_file_path}:")
-                    progress.console.print(f"  {e}")
+                progress.console.print(f"\nError checking {json_file_path}:")
+                progress.console.print(f"  {error}")
 
         reward_string = "🦄" if success else "🐢"
         progress.update(
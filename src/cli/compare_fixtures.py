@@ -9,13 +9,23 @@ both of the folders. Used within the coverage workflow.
 import json
 import shutil
 import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Set
+from typing import Dict, List, Set, Tuple
 
 import click
 
 from ethereum_test_base_types import HexNumber
-from ethereum_test_fixtures.consume import IndexFile, TestCaseIndexFile
+from ethereum_test_fixtures.consume import (
+    INDEX_DATABASE_FILE_NAME,
+    IndexDatabase,
+    IndexFile,
+    TestCaseIndexFile,
+)
+from ethereum_test_fixtures.file import iter_fixture_file_spans
+
+from .hasher import HashableItem
 
 
 def get_index_path(folder: Path) -> Path:
@@ -49,40 +59,79 @@ def find_duplicates(base_hashes: Set[HexNumber], patch_hashes: Set[HexNumber]) -
     return base_hashes & patch_hashes
 
 
-def pop_by_hash(index: IndexFile, fixture_hash: HexNumber) -> TestCaseIndexFile:
-    """Pops a single test case from an index file by its hash."""
-    for i in range(len(index.test_cases)):
-        if index.test_cases[i].fixture_hash == fixture_hash:
-            return index.test_cases.pop(i)
-    raise Exception(f"Hash {fixture_hash} not found in index.")
+def pop_by_hashes(index: IndexFile, fixture_hashes: Set[HexNumber]) -> List[TestCaseIndexFile]:
+    """
+    Pop the first test case with each of the given hashes from an index file, in a single pass
+    over its test cases.
+    """
+    remaining_hashes = set(fixture_hashes)
+    popped: List[TestCaseIndexFile] = []
+    kept: List[TestCaseIndexFile] = []
+    for test_case in index.test_cases:
+        if test_case.fixture_hash in remaining_hashes:
+            remaining_hashes.remove(test_case.fixture_hash)
+            popped.append(test_case)
+        else:
+            kept.append(test_case)
+    if remaining_hashes:
+        raise Exception(f"Hash {next(iter(remaining_hashes))} not found in index.")
+    index.test_cases = kept
+    return popped
 
 
-def remove_fixture_from_file(file: Path, test_case_id: str):
-    """Remove a single fixture by its ID from a generic fixture file."""
+def remove_fixtures_from_file(file: Path, test_case_ids: List[str]) -> Dict[str, Tuple[int, int]]:
+    """
+    Remove fixtures by their IDs from a generic fixture file, rewriting the file once.
+
+    Return the byte offset and length of each remaining fixture in the rewritten file.
+    """
     try:
         # Load from json to a dict
         full_file = json.loads(file.read_text())
-        full_file.pop(test_case_id)
-        file.write_text(json.dumps(full_file, indent=2))
+        for test_case_id in test_case_ids:
+            full_file.pop(test_case_id)
+        file.write_text(json.dumps(full_file, indent=4))
     except FileNotFoundError:
         raise FileNotFoundError(f"Fixture file not found: {file}") from None
-    except KeyError:
-        raise KeyError(f"Test case {test_case_id} not found in {file}") from None
+    except KeyError as e:
+        raise KeyError(f"Test case {e.args[0]} not found in {file}") from None
+    return {name: (offset, length) for name, offset, length in iter_fixture_file_spans(file)}
 
 
-def remove_fixture(
+def remove_fixtures(
     folder: Path,
     index: IndexFile,
-    fixture_hash: HexNumber,
+    fixture_hashes: Set[HexNumber],
     dry_run: bool,
+    executor: ProcessPoolExecutor | None = None,
 ):
-    """Remove a single fixture from a folder that matches the given hash."""
-    test_case = pop_by_hash(index, fixture_hash)
-    test_case_file = folder / test_case.json_path
+    """
+    Remove the fixtures that match the given hashes from a folder.
+
+    The removals are grouped by fixture file so that each affected file is rewritten exactly once,
+    in the given process pool if any, and the byte spans of the remaining fixtures of the
+    rewritten files are updated in the index.
+    """
+    removals: Dict[Path, List[str]] = defaultdict(list)
+    for test_case in pop_by_hashes(index, fixture_hashes):
+        removals[test_case.json_path].append(test_case.id)
     if dry_run:
-        print(f"Remove {test_case.id} from {test_case_file}")
+        for json_path, removed_ids in removals.items():
+            for test_case_id in removed_ids:
+                print(f"Remove {test_case_id} from {folder / json_path}")
+        return
+
+    json_paths = list(removals)
+    files = [folder / json_path for json_path in json_paths]
+    test_case_ids = [removals[json_path] for json_path in json_paths]
+    if executor is None:
+        file_spans = list(map(remove_fixtures_from_file, files, test_case_ids))
     else:
-        remove_fixture_from_file(test_case_file, test_case.id)
+        file_spans = list(executor.map(remove_fixtures_from_file, files, test_case_ids))
+    spans = dict(zip(json_paths, file_spans, strict=True))
+    for test_case in index.test_cases:
+        if test_case.json_path in spans:
+            test_case.offset, test_case.length = spans[test_case.json_path][test_case.id]
 
 
 def rewrite_index(folder: Path, index: IndexFile, dry_run: bool):
@@ -93,8 +142,14 @@ def rewrite_index(folder: Path, index: IndexFile, dry_run: bool):
     if len(index.test_cases) > 0:
         # Just rewrite the index
         if not dry_run:
-            with open(get_index_path(folder), "w") as f:
+            index.test_count = len(index.test_cases)
+            index.root_hash = HexNumber(HashableItem.from_folder_cached(folder_path=folder).hash())
+            index_path = get_index_path(folder)
+            with open(index_path, "w") as f:
                 f.write(index.model_dump_json(exclude_none=False, indent=2))
+            database_path = index_path.with_name(INDEX_DATABASE_FILE_NAME)
+            if database_path.exists():
+                IndexDatabase.write(database_path, index)
         else:
             print(f"Would rewrite index for {folder}")
     else:
@@ -144,10 +199,10 @@ def main(
             click.echo("Patch folder would be empty after fixture removal.")
             sys.exit(0)
 
-        for duplicate_hash in duplicate_hashes:
-            # Remove from both folders
-            remove_fixture(base, base_index, duplicate_hash, dry_run)
-            remove_fixture(patch, patch_index, duplicate_hash, dry_run)
+        # Remove from both folders, rewriting each affected file once
+        with ProcessPoolExecutor() as executor:
+            remove_fixtures(base, base_index, duplicate_hashes, dry_run, executor)
+            remove_fixtures(patch, patch_index, duplicate_hashes, dry_run, executor)
 
         # Rewrite indices if necessary
         rewrite_index(base, base_index, dry_run)
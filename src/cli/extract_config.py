@@ -22,6 +22,7 @@ from ethereum_test_fixtures import BlockchainFixtureCommon
 from ethereum_test_fixtures.blockchain import FixtureHeader
 from ethereum_test_fixtures.file import Fixtures
 from ethereum_test_fixtures.pre_alloc_groups import PreAllocGroup
+from ethereum_test_fixtures.store import FixtureStore
 from ethereum_test_forks import Fork
 from pytest_plugins.consume.simulators.helpers.ruleset import ruleset
 
@@ -96,9 +97,11 @@ def create_genesis_from_fixture(fixture_path: Path) -> Tuple[FixtureHeader, Allo
         fixture_json = json.load(f)
 
     if "_info" in fixture_json:
-        fixture = Fixtures.model_validate(fixture_json)
-        # Load the fixture
-        fixtures = Fixtures.model_validate_json(fixture_path.read_text())
+        # Load the fixture; only the genesis, pre-allocation and config are validated.
+        fixtures = Fixtures.model_validate(
+            fixture_json,
+            context={"lazy": True, "fixture_store": FixtureStore.find(fixture_path)},
+        )
 
         # Get the first fixture (assuming single fixture file)
         fixture_id = list(fixtures.keys())[0]
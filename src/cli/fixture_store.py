@@ -0,0 +1,98 @@
+"""
+Move the large fields shared by many fixtures of a fixture directory to a content-addressed
+store, or move them back into the fixtures.
+
+`dedup` writes the `pre`, `postState` and `genesisRLP` values of the fixtures once to the
+`.store` directory of the fixture directory and replaces them with references; `inflate`
+reverts it, e.g. to hand the fixtures to tools that do not resolve the references.
+"""
+
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Callable, List, Optional
+
+import click
+
+from ethereum_test_fixtures.store import (
+    STORE_DIR_NAME,
+    dedup_fixture_file,
+    inflate_fixture_file,
+)
+
+from .gen_index import generate_fixtures_index, list_json_files_exclude_index
+
+
+def process_fixture_files(
+    fixtures_dir: Path,
+    process_file: Callable[[Path, Path], int],
+    jobs: Optional[int],
+) -> int:
+    """
+    Apply `process_file` to every fixture file of a fixture directory in a pool of `jobs`
+    processes, regenerate its index if it has one, and return the total count of processed
+    fields.
+
+    The byte spans of the fixtures in the rewritten files change, so the index is regenerated
+    even though the fixture hashes do not.
+    """
+    files: List[Path] = list_json_files_exclude_index(fixtures_dir)
+    process = partial(_process_fixture_file, process_file, fixtures_dir / STORE_DIR_NAME)
+    if jobs == 1:
+        count = sum(map(process, files))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            count = sum(executor.map(process, files, chunksize=16))
+    if (fixtures_dir / ".meta" / "index.json").exists():
+        generate_fixtures_index(fixtures_dir, quiet_mode=True, force_flag=True, jobs=jobs)
+    return count
+
+
+def _process_fixture_file(
+    process_file: Callable[[Path, Path], int], store_path: Path, file_path: Path
+) -> int:
+    return process_file(file_path, store_path)
+
+
+@click.group(context_settings={"help_option_names": ["-h", "--help"]})
+def main() -> None:
+    """Move the large fields of the fixtures of a directory to or from its fixture store."""
+    pass
+
+
+jobs_option = click.option(
+    "--jobs",
+    "-j",
+    "jobs",
+    type=int,
+    default=None,
+    help="Number of worker processes (default: number of CPUs).",
+)
+
+
+@main.command()
+@click.argument("fixtures_dir", type=click.Path(exists=True, file_okay=False, path_type=Path))
+@jobs_option
+def dedup(fixtures_dir: Path, jobs: Optional[int]) -> None:
+    """Move the large `pre`, `postState` and `genesisRLP` values to the fixture store."""
+    moved = process_fixture_files(fixtures_dir, dedup_fixture_file, jobs)
+    click.echo(f"Moved {moved} fields to {fixtures_dir / STORE_DIR_NAME}.")
+
+
+@main.command()
+@click.argument("fixtures_dir", type=click.Path(exists=True, file_okay=False, path_type=Path))
+@jobs_option
+def inflate(fixtures_dir: Path, jobs: Optional[int]) -> None:
+    """Replace the references to the fixture store by their values and remove the store."""
+    if not (fixtures_dir / STORE_DIR_NAME).is_dir():
+        click.echo(f"No fixture store found in {fixtures_dir}.", err=True)
+        sys.exit(1)
+    replaced = process_fixture_files(fixtures_dir, inflate_fixture_file, jobs)
+    shutil.rmtree(fixtures_dir / STORE_DIR_NAME)
+    click.echo(f"Replaced {replaced} references to {fixtures_dir / STORE_DIR_NAME}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""
+Create and apply delta archives between two releases of a fixture directory.
+
+A delta archive holds the files that were added or changed between a base and a target fixture
+directory and the list of the removed files, so that the target can be rebuilt from the base
+without downloading the full target release.
+
+The changed fixture files are found by walking the hasher Merkle trees of the two directories,
+which skips the folders whose hashes are equal; the other files, such as the `.meta` files or
+the fixture store, are compared byte by byte.
+"""
+
+import filecmp
+import os
+import shutil
+from pathlib import Path
+from typing import List, Optional, Set, Tuple
+
+import click
+from pydantic import BaseModel
+
+from ethereum_test_fixtures.archive import FixtureTarballWriter, open_fixture_tarball
+
+from .hasher import HashableItem
+from .stat_cache import FixtureStatCache
+
+DELTA_MANIFEST_NAME = "delta.json"
+
+
+class FixturesDeltaError(Exception):
+    """Raised when a delta does not apply to a fixture directory."""
+
+
+class FixturesDelta(BaseModel):
+    """Manifest of a delta archive, stored as `delta.json` at its root."""
+
+    directory: str
+    """Name of the directory that holds the added and changed files in the delta archive."""
+    base_hash: str
+    """Hasher root hash of the fixture directory the delta applies to."""
+    target_hash: str
+    """Hasher root hash of the fixture directory obtained by applying the delta."""
+    removed: List[str]
+    """Paths of the files removed from the base directory, relative to it."""
+
+
+def hex_root_hash(folder: Path, jobs: Optional[int] = None) -> str:
+    """Return the hasher root hash of a fixture directory, using its stat cache."""
+    return f"0x{HashableItem.from_folder_cached(folder_path=folder, jobs=jobs).hash().hex()}"
+
+
+def list_files(folder: Path) -> Set[Path]:
+    """Return the paths, relative to the folder, of the release files of a folder."""
+    return {path.relative_to(folder) for path in folder.rglob("*") if path.is_file()}
+
+
+def diff_fixture_folders(
+    base: Path, target: Path, jobs: Optional[int] = None
+) -> Tuple[List[Path], List[Path]]:
+    """
+    Return the files added or changed, and the files removed, from `base` to `target`.
+
+    The JSON fixture files are compared by their hashes in the hasher Merkle trees of the two
+    directories, all other files by their content.
+    """
+    base_files, target_files = list_files(base), list_files(target)
+    fixture_files = {path.relative_to(target) for path in HashableItem.list_json_files(target)}
+    base_item = HashableItem.from_folder_cached(folder_path=base, jobs=jobs)
+    target_item = HashableItem.from_folder_cached(folder_path=target, jobs=jobs)
+    # The differing folders, files or tests ("<file>::<test>") of the two Merkle trees.
+    differing_paths = {
+        Path(item_path.partition("::")[0].lstrip("/"))
+        for item_path, _, _ in base_item.diff(target_item, path="")
+    }
+    changed: List[Path] = []
+    for path in sorted(target_files):
+        if path not in base_files:
+            changed.append(path)
+        elif path in fixture_files:
+            if path in differing_paths or not differing_paths.isdisjoint(path.parents):
+                changed.append(path)
+        elif not filecmp.cmp(base / path, target / path, shallow=False):
+            changed.append(path)
+    removed = sorted(base_files - target_files)
+    return changed, removed
+
+
+def write_fixtures_delta(
+    base: Path,
+    target: Path,
+    output: Path,
+    directory: str = "fixtures",
+    jobs: Optional[int] = None,
+) -> FixturesDelta:
+    """Write the delta archive from the `base` to the `target` fixture directory to `output`."""
+    changed, removed = diff_fixture_folders(base, target, jobs=jobs)
+    delta = FixturesDelta(
+        directory=directory,
+        base_hash=hex_root_hash(base, jobs=jobs),
+        target_hash=hex_root_hash(target, jobs=jobs),
+        removed=[path.as_posix() for path in removed],
+    )
+    with FixtureTarballWriter(output, threads=jobs) as writer:
+        writer.add_data(delta.model_dump_json(indent=2).encode(), Path(DELTA_MANIFEST_NAME))
+        for path in changed:
+            writer.add(target / path, arcname=Path(directory) / path)
+    return delta
+
+
+def link_fixture_folder(source: Path, destination: Path) -> None:
+    """
+    Copy a fixture directory, hard-linking the fixture files when possible.
+
+    The release files are only ever replaced, never modified in place, so they can be shared by
+    the two directories; the `.meta` files are copied since the index is rewritten in place.
+    Hard-linked files keep their inode and modification time, so the entries of the stat cache
+    of the source remain valid for them and it is copied to the destination.
+    """
+    for path in sorted(source.rglob("*")):
+        relative_path = path.relative_to(source)
+        if path.is_dir():
+            (destination / relative_path).mkdir(parents=True, exist_ok=True)
+            continue
+        (destination / relative_path).parent.mkdir(parents=True, exist_ok=True)
+        if ".meta" in relative_path.parts:
+            shutil.copy2(path, destination / relative_path)
+            continue
+        try:
+            os.link(path, destination / relative_path)
+        except OSError:
+            shutil.copy2(path, destination / relative_path)
+    FixtureStatCache.load(source).save(destination)
+
+
+def apply_fixtures_delta(
+    base: Path, delta_path: Path, output: Path, jobs: Optional[int] = None
+) -> None:
+    """
+    Build the target fixture directory at `output` from the `base` fixture directory and the
+    extracted delta archive at `delta_path`.
+
+    The root hashes of the base and of the result are checked against the manifest of the
+    delta; the extracted delta files are moved into `output`.
+    """
+    delta = FixturesDelta.model_validate_json((delta_path / DELTA_MANIFEST_NAME).read_bytes())
+    if (base_hash := hex_root_hash(base, jobs=jobs)) != delta.base_hash:
+        raise FixturesDeltaError(
+            f"The delta applies to the fixtures with root hash {delta.base_hash}, "
+            f"not to {base} ({base_hash})."
+        )
+    link_fixture_folder(base, output)
+    for removed_path in delta.removed:
+        (output / removed_path).unlink()
+    delta_files = delta_path / delta.directory
+    for path in sorted(delta_files.rglob("*")):
+        if path.is_file():
+            destination = output / path.relative_to(delta_files)
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(path, destination)
+    if (target_hash := hex_root_hash(output, jobs=jobs)) != delta.target_hash:
+        raise FixturesDeltaError(
+            f"Applying the delta resulted in the root hash {target_hash} instead of "
+            f"{delta.target_hash}."
+        )
+
+
+@click.group(context_settings={"help_option_names": ["-h", "--help"]})
+def main() -> None:
+    """Create and apply delta archives between fixture releases."""
+    pass
+
+
+jobs_option = click.option(
+    "--jobs",
+    "-j",
+    "jobs",
+    type=int,
+    default=None,
+    help="Number of processes used to hash the fixture files. Default: the number of CPUs.",
+)
+
+
+@main.command()
+@click.argument("base", type=click.Path(exists=True, file_okay=False, path_type=Path))
+@click.argument("target", type=click.Path(exists=True, file_okay=False, path_type=Path))
+@click.argument("output", type=click.Path(dir_okay=False, path_type=Path))
+@click.option(
+    "--directory",
+    "directory",
+    default="fixtures",
+    show_default=True,
+    help="Top-level directory of the release archives.",
+)
+@jobs_option
+def delta(base: Path, target: Path, output: Path, directory: str, jobs: Optional[int]) -> None:
+    """
+    Write the delta archive (.tar.gz or .tar.zst) OUTPUT from the fixture directory BASE to the
+    fixture directory TARGET.
+    """
+    fixtures_delta = write_fixtures_delta(base, target, output, directory=directory, jobs=jobs)
+    click.echo(
+        f"Wrote {output}: {fixtures_delta.base_hash} -> {fixtures_delta.target_hash}, "
+        f"{len(fixtures_delta.removed)} files removed."
+    )
+
+
+@main.command(name="apply-delta")
+@click.argument("base", type=click.Path(exists=True, file_okay=False, path_type=Path))
+@click.argument("delta_archive", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.argument("output", type=click.Path(file_okay=False, path_type=Path))
+@jobs_option
+def apply_delta(base: Path, delta_archive: Path, output: Path, jobs: Optional[int]) -> None:
+    """Build the fixture directory OUTPUT from the fixture directory BASE and DELTA_ARCHIVE."""
+    delta_path = output.with_name(f"{output.name}.delta")
+    try:
+        with open(delta_archive, "rb") as f, open_fixture_tarball(f) as tar:
+            tar.extractall(path=delta_path, filter="data")
+        apply_fixtures_delta(base, delta_path, output, jobs=jobs)
+    except FixturesDeltaError as e:
+        shutil.rmtree(output, ignore_errors=True)
+        raise click.ClickException(str(e)) from e
+    finally:
+        shutil.rmtree(delta_path, ignore_errors=True)
+    click.echo(f"Wrote {output}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,9 +2,12 @@
 
 import datetime
 import json
+import mmap
 import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, Iterator, List, Tuple
 
 import click
 import rich
@@ -18,25 +21,93 @@ from rich.progress import (
 )
 
 from ethereum_test_base_types import HexNumber
-from ethereum_test_fixtures.consume import IndexFile, TestCaseIndexFile
-from ethereum_test_fixtures.file import Fixtures
+from ethereum_test_fixtures import BaseFixture
+from ethereum_test_fixtures.consume import (
+    INDEX_DATABASE_FILE_NAME,
+    IndexDatabase,
+    IndexFile,
+    TestCaseIndexFile,
+)
+from ethereum_test_fixtures.file import iter_fixture_file_spans
+from ethereum_test_fixtures.store import STORE_DIR_NAME
 
 from .hasher import HashableItem
+from .stat_cache import FixtureIndexEntry, FixtureStatCache
 
 # Files and directories to exclude from index generation
 INDEX_EXCLUDED_FILES = frozenset({"index.json"})
-INDEX_EXCLUDED_PATH_PARTS = frozenset({".meta", "pre_alloc"})
+INDEX_EXCLUDED_PATH_PARTS = frozenset({".meta", STORE_DIR_NAME, "pre_alloc"})
 
 
-def count_json_files_exclude_index(start_path: Path) -> int:
-    """Return the number of fixture json files in the specified directory."""
-    json_file_count = sum(
-        1
+def list_json_files_exclude_index(start_path: Path) -> List[Path]:
+    """Return the fixture json files in the specified directory."""
+    return [
+        file
         for file in start_path.rglob("*.json")
         if file.name not in INDEX_EXCLUDED_FILES
         and not any(part in INDEX_EXCLUDED_PATH_PARTS for part in file.parts)
-    )
-    return json_file_count
+    ]
+
+
+FixtureJson = Tuple[str, Dict[str, Any], int | None, int | None]
+"""Fixture name, decoded fixture and byte offset and length of the fixture within its file."""
+
+
+def iter_fixture_file_json(file: Path, streaming: bool) -> Iterator[FixtureJson]:
+    """
+    Yield the name, the JSON object and the byte span of each fixture in a fixture file.
+
+    If `streaming` is set and the file was written by the filler (indented by four spaces), the
+    fixtures are decoded one at a time from a memory map of the file and their byte spans are
+    known; otherwise the whole file is decoded at once.
+    """
+    if streaming:
+        with open(file, "rb") as f:
+            first_lines = (f.readline(), f.readline())
+        if first_lines[0] == b"{\n" and first_lines[1].startswith(b'    "'):
+            with open(file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                for name, offset, length in iter_fixture_file_spans(file):
+                    yield name, json.loads(m[offset : offset + length]), offset, length
+            return
+    with open(file, "r") as json_file:
+        for name, fixture in json.load(json_file).items():
+            yield name, fixture, None, None
+
+
+def index_fixture_file(file: Path) -> List[FixtureIndexEntry]:
+    """
+    Extract the fields of the index of each fixture in a fixture file.
+
+    Only the fields required for the index are read from the decoded JSON; the fixtures are not
+    validated into their pydantic models.
+    """
+    try:
+        return _index_fixtures(iter_fixture_file_json(file, streaming=True))
+    except json.JSONDecodeError:
+        # Not indented as expected after all, e.g. a hand-written file.
+        return _index_fixtures(iter_fixture_file_json(file, streaming=False))
+
+
+def _index_fixtures(fixtures: Iterator[FixtureJson]) -> List[FixtureIndexEntry]:
+    entries: List[FixtureIndexEntry] = []
+    for fixture_name, fixture, offset, length in fixtures:
+        info = fixture.get("_info", {})
+        format_name = info.get("fixture-format") or info.get("fixture_format")
+        if format_name not in BaseFixture.formats:
+            raise ValueError(f"Unknown fixture format {format_name} of {fixture_name}")
+        fixture_format = BaseFixture.formats[format_name]
+        # eest uses hash; ethereum/tests uses generatedTestHash
+        fixture_hash = info.get("hash") or f"0x{info.get('generatedTestHash')}"
+        fork: str | None = None
+        if "network" in fixture:
+            fork = fixture["network"]
+        elif "post" in fixture or "result" in fixture:
+            forks = list(fixture.get("post", fixture.get("result", {})).keys())
+            assert len(forks) == 1, f"Expected fixture {fixture_name} with single fork"
+            fork = forks[0]
+        pre_hash = fixture.get("preHash") if "pre_hash" in fixture_format.model_fields else None
+        entries.append((fixture_name, format_name, fixture_hash, fork, pre_hash, offset, length))
+    return entries
 
 
 @click.command(
@@ -80,8 +151,20 @@ def count_json_files_exclude_index(start_path: Path) -> int:
     expose_value=True,
     help="Force re-generation of the index file, even if it already exists.",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    "jobs",
+    type=int,
+    default=None,
+    help="Number of processes used to read the fixture files. Default: the number of CPUs.",
+)
 def generate_fixtures_index_cli(
-    input_dir: str, quiet_mode: bool, force_flag: bool, disable_infer_format: bool
+    input_dir: str,
+    quiet_mode: bool,
+    force_flag: bool,
+    disable_infer_format: bool,
+    jobs: int | None,
 ):
     """CLI wrapper to an index of all the fixtures in the specified directory."""
     generate_fixtures_index(
@@ -89,6 +172,7 @@ def generate_fixtures_index_cli(
         quiet_mode=quiet_mode,
         force_flag=force_flag,
         disable_infer_format=disable_infer_format,
+        jobs=jobs,
     )
 
 
@@ -97,30 +181,46 @@ def generate_fixtures_index(
     quiet_mode: bool = False,
     force_flag: bool = False,
     disable_infer_format: bool = False,
+    jobs: int | None = None,
 ):
     """
     Generate an index file (index.json) of all the fixtures in the specified
     directory.
+
+    The fixture files are read in a pool of `jobs` processes (default: number of CPUs). The hash
+    and index entries of each file are kept in a stat cache in the user cache directory, so that
+    only the files that changed since the previous run are read again.
+
+    A SQLite copy of the index (index.sqlite) is written alongside it, which allows consume to
+    select test cases without loading the whole index. If the index is up-to-date, it is kept as
+    is and only its SQLite copy is written, if missing.
     """
-    total_files = 0
     if not os.path.isdir(input_path):  # caught by click if using via cli
         raise FileNotFoundError(f"The directory {input_path} does not exist.")
-    if not quiet_mode:
-        total_files = count_json_files_exclude_index(input_path)
 
     output_file = Path(f"{input_path}/.meta/index.json")
     output_file.parent.mkdir(parents=True, exist_ok=True)  # no meta dir in <=v3.0.0
+    stat_cache = FixtureStatCache.load(input_path)
     try:
-        root_hash = HashableItem.from_folder(folder_path=input_path).hash()
+        root_hash = HashableItem.from_folder(
+            folder_path=input_path, stat_cache=stat_cache, jobs=jobs
+        ).hash()
     except (KeyError, TypeError):
         root_hash = b""  # just regenerate a new index file
 
+    database_file = output_file.with_name(INDEX_DATABASE_FILE_NAME)
     if not force_flag and output_file.exists():
-        index_data: IndexFile
         try:
+            # Only the root hash is needed, skip validating the test cases of the index.
             with open(output_file, "r") as f:
-                index_data = IndexFile(**json.load(f))
-            if index_data.root_hash and index_data.root_hash == HexNumber(root_hash):
+                index_root_hash = json.load(f)["root_hash"]
+            if index_root_hash and HexNumber(index_root_hash) == HexNumber(root_hash):
+                if not database_file.exists() and os.access(output_file.parent, os.W_OK):
+                    # E.g. an index of a release without a database: derive it from the index.
+                    IndexDatabase.write(
+                        database_file, IndexFile.model_validate_json(output_file.read_text())
+                    )
+                stat_cache.save(input_path)
                 if not quiet_mode:
                     rich.print(f"Index file [bold cyan]{output_file}[/] is up-to-date.")
                 return
@@ -145,48 +245,65 @@ def generate_fixtures_index(
         expand=False,
         disable=quiet_mode,
     ) as progress:  # type: Progress
+        files = list_json_files_exclude_index(input_path)
+        total_files = len(files)
         task_id = progress.add_task("[cyan]Processing files...", total=total_files, filename="...")
         forks = set()
         fixture_formats = set()
         test_cases: List[TestCaseIndexFile] = []
-        for file in input_path.rglob("*.json"):
-            if file.name in INDEX_EXCLUDED_FILES or any(
-                part in INDEX_EXCLUDED_PATH_PARTS for part in file.parts
-            ):
-                continue
-
-            try:
-                fixtures: Fixtures = Fixtures.model_validate_json(file.read_text())
-            except Exception as e:
-                rich.print(f"[red]Error loading fixtures from {file}[/red]")
-                raise e
-
-            relative_file_path = Path(file).absolute().relative_to(Path(input_path).absolute())
-            for fixture_name, fixture in fixtures.items():
-                fixture_fork = fixture.get_fork()
-                test_cases.append(
-                    TestCaseIndexFile(
+        cached_files = [
+            stat_cache.get(file.relative_to(input_path).as_posix(), file.stat()) for file in files
+        ]
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            file_entries = executor.map(
+                index_fixture_file,
+                [
+                    file
+                    for file, cached in zip(files, cached_files, strict=True)
+                    if cached.index_entries is None
+                ],
+                chunksize=16,
+            )
+            for file, cached in zip(files, cached_files, strict=True):
+                if cached.index_entries is None:
+                    try:
+                        cached.index_entries = next(file_entries)
+                    except Exception as e:
+                        rich.print(f"[red]Error loading fixtures from {file}[/red]")
+                        raise e
+
+                relative_file_path = Path(file).absolute().relative_to(Path(input_path).absolute())
+                for (
+                    fixture_name,
+                    format_name,
+                    fixture_hash,
+                    fork,
+                    pre_hash,
+                    offset,
+                    length,
+                ) in cached.index_entries:
+                    test_case = TestCaseIndexFile(
                         id=fixture_name,
                         json_path=relative_file_path,
-                        # eest uses hash; ethereum/tests uses generatedTestHash
-                        fixture_hash=fixture.info.get("hash")
-                        or f"0x{fixture.info.get('generatedTestHash')}",
-                        fork=fixture_fork,
-                        format=fixture.__class__,
-                        pre_hash=getattr(fixture, "pre_hash", None),
+                        fixture_hash=fixture_hash,
+                        fork=fork,
+                        format=BaseFixture.formats[format_name],
+                        pre_hash=pre_hash,
+                        offset=offset,
+                        length=length,
                     )
-                )
-                if fixture_fork:
-                    forks.add(fixture_fork)
-                fixture_formats.add(fixture.format_name)
+                    test_cases.append(test_case)
+                    if test_case.fork:
+                        forks.add(test_case.fork)
+                    fixture_formats.add(format_name)
 
-            display_filename = file.name
-            if len(display_filename) > filename_display_width:
-                display_filename = display_filename[: filename_display_width - 3] + "..."
-            else:
-                display_filename = display_filename.ljust(filename_display_width)
+                display_filename = file.name
+                if len(display_filename) > filename_display_width:
+                    display_filename = display_filename[: filename_display_width - 3] + "..."
+                else:
+                    display_filename = display_filename.ljust(filename_display_width)
 
-            progress.update(task_id, advance=1, filename=display_filename)
+                progress.update(task_id, advance=1, filename=display_filename)
 
         progress.update(
             task_id,
@@ -203,8 +320,16 @@ def generate_fixtures_index(
         fixture_formats=list(fixture_formats),
     )
 
-    with open(output_file, "w") as f:
-        f.write(index.model_dump_json(exclude_none=False, indent=2))
+    # Replace the index atomically: consume processes may be reading the previous one.
+    with tempfile.NamedTemporaryFile(
+        "w", dir=output_file.parent, prefix=output_file.name, suffix=".tmp", delete=False
+    ) as index_tmp_file:
+        index_tmp_file.write(index.model_dump_json(exclude_none=False, indent=2))
+    os.replace(index_tmp_file.name, output_file)
+    IndexDatabase.write(database_file, index)
+
+    stat_cache.prune(input_path)
+    stat_cache.save(input_path)
 
 
 if __name__ == "__main__":
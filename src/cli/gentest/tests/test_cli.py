@@ -126,7 +126,7 @@ def test_tx_type(pytester, tmp_path, monkeypatch, tx_type, transaction_hash, def
         "--fork",
         "Cancun",
         "--t8n-server-url",
-        default_t8n.server_url,
+        default_t8n.managed_server_url,
     ]
     result = pytester.runpytest("-v", *args)
     assert result.ret == pytest.ExitCode.OK, f"Fill command failed:\n{result}"
@@ -2,13 +2,18 @@
 
 import hashlib
 import json
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from enum import IntEnum, auto
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import click
 
+from ethereum_test_fixtures.store import STORE_DIR_NAME
+
+from .stat_cache import FixtureStatCache
+
 
 class HashableItemType(IntEnum):
     """Represents the type of a hashable item."""
@@ -26,18 +31,20 @@ class HashableItem:
     parents: List[str] = field(default_factory=list)
     root: Optional[bytes] = None
     items: Optional[Dict[str, "HashableItem"]] = None
+    _hash: Optional[bytes] = field(default=None, repr=False, compare=False)
 
     def hash(self) -> bytes:
         """Return the hash of the item."""
         if self.root is not None:
             return self.root
-        if self.items is None:
-            raise ValueError("No items to hash")
-        all_hash_bytes = b""
-        for _, item in sorted(self.items.items()):
-            item_hash_bytes = item.hash()
-            all_hash_bytes += item_hash_bytes
-        return hashlib.sha256(all_hash_bytes).digest()
+        if self._hash is None:
+            if self.items is None:
+                raise ValueError("No items to hash")
+            digest = hashlib.sha256()
+            for _, item in sorted(self.items.items()):
+                digest.update(item.hash())
+            self._hash = digest.digest()
+        return self._hash
 
     def print(
         self, *, name: str, level: int = 0, print_type: Optional[HashableItemType] = None
@@ -56,10 +63,37 @@ class HashableItem:
             for key, item in sorted(self.items.items()):
                 item.print(name=key, level=next_level, print_type=print_type)
 
-    @classmethod
-    def from_json_file(cls, *, file_path: Path, parents: List[str]) -> "HashableItem":
-        """Create a hashable item from a JSON file."""
-        items = {}
+    def diff(
+        self, other: "HashableItem", *, path: str
+    ) -> Iterator[Tuple[str, Optional[bytes], Optional[bytes]]]:
+        """
+        Yield the path and the hashes of the differing sub-items of two items.
+
+        Sub-items with equal hashes are not walked; an item that exists in only one of the trees
+        is yielded with `None` as the hash of the other.
+        """
+        if self.hash() == other.hash():
+            return
+        if self.items is None or other.items is None:
+            yield path, self.hash(), other.hash()
+            return
+        separator = "::" if self.type == HashableItemType.FILE else "/"
+        for name in sorted(self.items.keys() | other.items.keys()):
+            item, other_item = self.items.get(name), other.items.get(name)
+            item_path = f"{path}{separator}{name}"
+            if item is None or other_item is None:
+                yield (
+                    item_path,
+                    item.hash() if item is not None else None,
+                    other_item.hash() if other_item is not None else None,
+                )
+            else:
+                yield from item.diff(other_item, path=item_path)
+
+    @staticmethod
+    def read_test_hashes(file_path: Path) -> Dict[str, bytes]:
+        """Read the hash of each test of a JSON fixture file."""
+        test_hashes = {}
         with file_path.open("r") as f:
             data = json.load(f)
         for key, item in sorted(data.items()):
@@ -76,35 +110,147 @@ class HashableItem:
             if not isinstance(hash_value, str):
                 raise TypeError(f"Expected hash to be a string in {key}, got {type(hash_value)}")
 
-            item_hash_bytes = bytes.fromhex(hash_value[2:])
-            items[key] = cls(
-                type=HashableItemType.TEST,
-                root=item_hash_bytes,
-                parents=parents + [file_path.name],
-            )
+            test_hashes[key] = bytes.fromhex(hash_value[2:])
+        return test_hashes
+
+    @classmethod
+    def from_test_hashes(
+        cls, *, test_hashes: Dict[str, bytes], file_name: str, parents: List[str]
+    ) -> "HashableItem":
+        """Create a hashable item of a file from the hashes of its tests."""
+        test_parents = parents + [file_name]
+        items = {
+            key: cls(type=HashableItemType.TEST, root=item_hash_bytes, parents=test_parents)
+            for key, item_hash_bytes in test_hashes.items()
+        }
         return cls(type=HashableItemType.FILE, items=items, parents=parents)
 
+    @classmethod
+    def from_json_file(
+        cls,
+        *,
+        file_path: Path,
+        parents: List[str],
+        stat_cache: Optional[FixtureStatCache] = None,
+        read_hashes: Optional[Dict[Path, Dict[str, bytes]]] = None,
+    ) -> "HashableItem":
+        """
+        Create a hashable item from a JSON file.
+
+        If a stat cache is given and the file is unchanged, the item only holds the cached hash of
+        the file, without the items of its tests; otherwise the hash is stored in the cache.
+
+        The hashes of the tests are taken from `read_hashes` if they were already read.
+        """
+        relative_path = "/".join(parents[1:] + [file_path.name])
+        cached = stat_cache.get(relative_path, file_path.stat()) if stat_cache else None
+        if cached is not None and cached.file_hash is not None:
+            return cls(
+                type=HashableItemType.FILE, root=bytes.fromhex(cached.file_hash), parents=parents
+            )
+        test_hashes = (read_hashes or {}).get(file_path)
+        item = cls.from_test_hashes(
+            test_hashes=test_hashes
+            if test_hashes is not None
+            else cls.read_test_hashes(file_path),
+            file_name=file_path.name,
+            parents=parents,
+        )
+        if cached is not None:
+            cached.file_hash = item.hash().hex()
+        return item
+
+    @staticmethod
+    def list_json_files(folder_path: Path) -> Iterator[Path]:
+        """Yield the JSON files of a folder and its sub-folders, in the order they are hashed."""
+        for file_path in sorted(folder_path.iterdir()):
+            if ".meta" in file_path.parts or STORE_DIR_NAME in file_path.parts:
+                continue
+            if file_path.is_file() and file_path.suffix == ".json":
+                yield file_path
+            elif file_path.is_dir():
+                yield from HashableItem.list_json_files(file_path)
+
     @classmethod
     def from_folder(
-        cls, *, folder_path: Path, parents: Optional[List[str]] = None
+        cls,
+        *,
+        folder_path: Path,
+        parents: Optional[List[str]] = None,
+        stat_cache: Optional[FixtureStatCache] = None,
+        jobs: Optional[int] = 1,
+        read_hashes: Optional[Dict[Path, Dict[str, bytes]]] = None,
     ) -> "HashableItem":
-        """Create a hashable item from a folder."""
+        """
+        Create a hashable item from a folder.
+
+        If a stat cache is given, only the files that changed since they were cached are read.
+        Unless `jobs` is 1, the files are read in a pool of `jobs` processes (default: number of
+        CPUs).
+        """
         if parents is None:
             parents = []
+        if read_hashes is None and jobs != 1:
+            files = [
+                file_path
+                for file_path in cls.list_json_files(folder_path)
+                if stat_cache is None
+                or stat_cache.get(
+                    file_path.relative_to(folder_path).as_posix(), file_path.stat()
+                ).file_hash
+                is None
+            ]
+            read_hashes = {}
+            if files:
+                with ProcessPoolExecutor(max_workers=jobs) as executor:
+                    read_hashes = dict(
+                        zip(
+                            files,
+                            executor.map(cls.read_test_hashes, files, chunksize=16),
+                            strict=True,
+                        )
+                    )
         items = {}
         for file_path in sorted(folder_path.iterdir()):
-            if ".meta" in file_path.parts:
+            if ".meta" in file_path.parts or STORE_DIR_NAME in file_path.parts:
                 continue
             if file_path.is_file() and file_path.suffix == ".json":
                 item = cls.from_json_file(
-                    file_path=file_path, parents=parents + [folder_path.name]
+                    file_path=file_path,
+                    parents=parents + [folder_path.name],
+                    stat_cache=stat_cache,
+                    read_hashes=read_hashes,
                 )
                 items[file_path.name] = item
             elif file_path.is_dir():
-                item = cls.from_folder(folder_path=file_path, parents=parents + [folder_path.name])
+                item = cls.from_folder(
+                    folder_path=file_path,
+                    parents=parents + [folder_path.name],
+                    stat_cache=stat_cache,
+                    jobs=jobs,
+                    read_hashes=read_hashes or {},
+                )
                 items[file_path.name] = item
         return cls(type=HashableItemType.FOLDER, items=items, parents=parents)
 
+    @classmethod
+    def from_folder_cached(
+        cls, *, folder_path: Path, use_cache: bool = True, jobs: Optional[int] = None
+    ) -> "HashableItem":
+        """
+        Create a hashable item from a folder, using and updating the stat cache of the folder
+        if `use_cache` is set.
+
+        The stat cache is kept in the user cache directory, so the hashed folder is only read.
+        """
+        if not use_cache:
+            return cls.from_folder(folder_path=folder_path, jobs=jobs)
+        stat_cache = FixtureStatCache.load(folder_path)
+        item = cls.from_folder(folder_path=folder_path, stat_cache=stat_cache, jobs=jobs)
+        stat_cache.prune(folder_path)
+        stat_cache.save(folder_path)
+        return item
+
 
 @click.command()
 @click.argument(
@@ -113,10 +259,58 @@ class HashableItem:
 @click.option("--files", "-f", is_flag=True, help="Print hash of files")
 @click.option("--tests", "-t", is_flag=True, help="Print hash of tests")
 @click.option("--root", "-r", is_flag=True, help="Only print hash of root folder")
-def main(folder_path_str: str, files: bool, tests: bool, root: bool) -> None:
+@click.option(
+    "--diff",
+    "-d",
+    "other_folder_path_str",
+    type=click.Path(exists=True, file_okay=False, dir_okay=True, readable=True),
+    default=None,
+    help=(
+        "Compare with another folder of JSON fixtures and only print the folders, files (and "
+        "tests, with --tests) whose hashes differ."
+    ),
+)
+@click.option(
+    "--jobs",
+    "-j",
+    "jobs",
+    type=int,
+    default=None,
+    help="Number of processes used to read the JSON files. Default: the number of CPUs.",
+)
+@click.option(
+    "--no-cache",
+    "no_cache",
+    is_flag=True,
+    help="Don't read or update the stat cache of file hashes in the user cache directory.",
+)
+def main(
+    folder_path_str: str,
+    files: bool,
+    tests: bool,
+    root: bool,
+    other_folder_path_str: Optional[str],
+    jobs: Optional[int],
+    no_cache: bool,
+) -> None:
     """Hash folders of JSON fixtures and print their hashes."""
     folder_path: Path = Path(folder_path_str)
-    item = HashableItem.from_folder(folder_path=folder_path)
+    # Cached files only hold the hash of the file, not of each of their tests.
+    use_cache = not no_cache and not tests and (root or files or other_folder_path_str is not None)
+    item = HashableItem.from_folder_cached(folder_path=folder_path, use_cache=use_cache, jobs=jobs)
+
+    if other_folder_path_str is not None:
+        other_folder_path = Path(other_folder_path_str)
+        other_item = HashableItem.from_folder_cached(
+            folder_path=other_folder_path, use_cache=use_cache, jobs=jobs
+        )
+        for path, item_hash, other_item_hash in item.diff(other_item, path=""):
+            print(
+                f"{path.lstrip('/')}: "
+                f"{f'0x{item_hash.hex()}' if item_hash is not None else 'missing'} != "
+                f"{f'0x{other_item_hash.hex()}' if other_item_hash is not None else 'missing'}"
+            )
+        return
 
     if root:
         print(f"0x{item.hash().hex()}")
@@ -48,6 +48,8 @@ def get_static_test_paths(command_name: str, is_hive: bool) -> List[Path]:
         static_test_paths = [
             base_path / "simulators" / "simulator_logic" / f"test_via_{command_name}.py"
         ]
+    elif command_name == "enginex":
+        static_test_paths = [base_path / "simulators" / "simulator_logic" / "test_via_engine.py"]
     elif command_name == "direct":
         static_test_paths = [base_path / "direct" / "test_via_direct.py"]
     else:
@@ -105,6 +107,12 @@ def engine() -> None:
     pass
 
 
+@consume_command(is_hive=True)
+def enginex() -> None:
+    """Client consumes Engine X fixtures via the Engine API, one client per pre-alloc group."""
+    pass
+
+
 @consume_command(is_hive=True)
 def hive() -> None:
     """Client consumes via all available hive methods (rlp, engine)."""
@@ -162,16 +162,16 @@ class FillCommand(PytestCommand):
         return args
 
     def _is_tarball_output(self, args: List[str]) -> bool:
-        """Check if output argument specifies a tarball (.tar.gz) path."""
+        """Check if output argument specifies a tarball (.tar.gz or .tar.zst) path."""
         from pathlib import Path
 
         for i, arg in enumerate(args):
             if arg.startswith("--output="):
                 output_path = Path(arg.split("=", 1)[1])
-                return str(output_path).endswith(".tar.gz")
+                return str(output_path).endswith((".tar.gz", ".tar.zst"))
             elif arg == "--output" and i + 1 < len(args):
                 output_path = Path(args[i + 1])
-                return str(output_path).endswith(".tar.gz")
+                return str(output_path).endswith((".tar.gz", ".tar.zst"))
         return False
 
 
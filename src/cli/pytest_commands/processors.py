@@ -103,6 +103,11 @@ class HiveEnvironmentProcessor(ArgumentProcessor):
             modified_args.extend(["-p", "pytest_plugins.consume.simulators.engine.conftest"])
         elif self.command_name == "rlp":
             modified_args.extend(["-p", "pytest_plugins.consume.simulators.rlp.conftest"])
+        elif self.command_name == "enginex":
+            modified_args.extend(["-p", "pytest_plugins.consume.simulators.enginex.conftest"])
+            # Run all the tests of a pre-allocation group on the worker that holds its client.
+            if self._has_parallelism_flag(modified_args) and not self._has_dist_flag(args):
+                modified_args.extend(["--dist", "loadgroup"])
         else:
             raise ValueError(f"Unknown command name: {self.command_name}")
         return modified_args
@@ -115,6 +120,10 @@ class HiveEnvironmentProcessor(ArgumentProcessor):
         """Check if args already contain parallelism flag."""
         return "-n" in args
 
+    def _has_dist_flag(self, args: List[str]) -> bool:
+        """Check if args already contain an xdist distribution mode."""
+        return any(arg == "--dist" or arg.startswith("--dist=") for arg in args)
+
 
 class ConsumeCommandProcessor(ArgumentProcessor):
     """Processes consume-specific command arguments."""
@@ -133,6 +142,16 @@ class ConsumeCommandProcessor(ArgumentProcessor):
         """Process consume-specific arguments."""
         if self.is_hive:
             return self._handle_timing_data_stdout(args)
+        return self._handle_grouped_distribution(args)
+
+    def _handle_grouped_distribution(self, args: List[str]) -> List[str]:
+        """
+        Run all the test cases of a fixture file on the xdist worker that consumes the file when
+        consuming the fixture files grouped.
+        """
+        has_dist_flag = any(arg == "--dist" or arg.startswith("--dist=") for arg in args)
+        if "--grouped" in args and "-n" in args and not has_dist_flag:
+            return args + ["--dist", "loadgroup"]
         return args
 
     def _handle_timing_data_stdout(self, args: List[str]) -> List[str]:
@@ -0,0 +1,103 @@
+"""
+Cache of the per-file data extracted from a directory of JSON fixtures, keyed by file stat.
+
+Hashing a fixture directory or generating its index requires reading every fixture file. The
+stat cache keeps the hash and the index entries of each file together with its size,
+modification time and inode, so that files that have not changed since the last run are not read
+again.
+
+The stat cache of a directory is stored in the user cache directory, keyed by the absolute path of
+the fixture directory, and never inside it: fixture directories may be read-only, shipped as
+releases or compared against each other.
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import platformdirs
+from pydantic import BaseModel, Field
+
+STAT_CACHE_DIRECTORY = (
+    Path(platformdirs.user_cache_dir("ethereum-execution-spec-tests")) / "stat_cache"
+)
+
+FixtureIndexEntry = Tuple[str, str, str | None, str | None, str | None, int | None, int | None]
+"""
+Fixture name, format name, fixture hash, fork name, pre-allocation group hash, and byte offset
+and length of the fixture within its file.
+"""
+
+
+class CachedFixtureFile(BaseModel):
+    """Data extracted from a fixture file, valid as long as the file stat is unchanged."""
+
+    size: int
+    mtime_ns: int
+    inode: int
+    file_hash: str | None = None
+    index_entries: List[FixtureIndexEntry] | None = None
+
+    def matches(self, stat: os.stat_result) -> bool:
+        """Return whether the cached data belongs to a file with the given stat."""
+        return (
+            self.size == stat.st_size
+            and self.mtime_ns == stat.st_mtime_ns
+            and self.inode == stat.st_ino
+        )
+
+
+class FixtureStatCache(BaseModel):
+    """Stat cache of all the fixture files of a directory, keyed by their relative path."""
+
+    files: Dict[str, CachedFixtureFile] = Field(default_factory=dict)
+
+    @staticmethod
+    def path(folder_path: Path) -> Path:
+        """Return the path of the stat cache file of a fixture directory."""
+        key = hashlib.sha256(str(folder_path.resolve()).encode()).hexdigest()[:32]
+        return STAT_CACHE_DIRECTORY / f"{key}.json"
+
+    @classmethod
+    def load(cls, folder_path: Path) -> "FixtureStatCache":
+        """Load the stat cache of a fixture directory, or return an empty one."""
+        try:
+            return cls.model_validate_json(cls.path(folder_path).read_bytes())
+        except Exception:
+            return cls()
+
+    def save(self, folder_path: Path) -> None:
+        """Save the stat cache of a fixture directory, if the cache directory is writable."""
+        cache_path = self.path(folder_path)
+        tmp_name = None
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", dir=cache_path.parent, prefix=cache_path.name, suffix=".tmp", delete=False
+            ) as f:
+                tmp_name = f.name
+                f.write(self.model_dump_json())
+            os.replace(tmp_name, cache_path)
+        except OSError:
+            if tmp_name is not None:
+                Path(tmp_name).unlink(missing_ok=True)
+
+    def get(self, relative_path: str, stat: os.stat_result) -> CachedFixtureFile:
+        """
+        Return the cached data of a file, discarding it first if the file has changed since it
+        was cached.
+        """
+        cached = self.files.get(relative_path)
+        if cached is None or not cached.matches(stat):
+            cached = CachedFixtureFile(
+                size=stat.st_size, mtime_ns=stat.st_mtime_ns, inode=stat.st_ino
+            )
+            self.files[relative_path] = cached
+        return cached
+
+    def prune(self, folder_path: Path) -> None:
+        """Remove the files that are no longer present in the fixture directory."""
+        for relative_path in [path for path in self.files if not (folder_path / path).is_file()]:
+            del self.files[relative_path]
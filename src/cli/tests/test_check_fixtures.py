@@ -0,0 +1,97 @@
+"""Test the check_fixtures CLI tool."""
+
+import json
+import shutil
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import pytest
+from click.testing import CliRunner
+
+from ethereum_test_specs.base import HashMismatchExceptionError
+
+from ..check_fixtures import check_files, check_fixtures
+
+FIXTURES_DIR = Path(__file__).parents[2] / "ethereum_test_specs" / "tests" / "fixtures"
+FIXTURE_FILES = [
+    "chainid_cancun_blockchain_test_tx_type_0.json",
+    "chainid_paris_blockchain_test_engine_tx_type_0.json",
+    "chainid_cancun_state_test_tx_type_0.json",
+]
+
+
+@pytest.fixture
+def fixtures_folder(tmp_path: Path) -> Path:
+    """Copy the fixture files into a temporary folder, with a metadata file in its `.meta`."""
+    for file_name in FIXTURE_FILES:
+        shutil.copy(FIXTURES_DIR / file_name, tmp_path / file_name)
+    (tmp_path / ".meta").mkdir()
+    (tmp_path / ".meta" / "stat_cache.json").write_text("{}")
+    return tmp_path
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+@pytest.mark.parametrize("hash_only", [False, True], ids=["full", "hash_only"])
+def test_check_fixtures(fixtures_folder: Path, hash_only: bool, jobs: str):
+    """Test that valid fixtures pass and that every fixture file with a wrong hash is reported."""
+    args = ["--input", str(fixtures_folder), "--quiet", "--jobs", jobs]
+    if hash_only:
+        args.append("--hash-only")
+    result = CliRunner().invoke(check_fixtures, args, standalone_mode=False)
+    assert result.exception is None, result.output
+    assert result.return_value is True
+
+    for file_name in FIXTURE_FILES[1:]:
+        fixture_file = fixtures_folder / file_name
+        fixtures = json.loads(fixture_file.read_text())
+        next(iter(fixtures.values()))["_info"]["hash"] = "0x" + "00" * 32
+        fixture_file.write_text(json.dumps(fixtures, indent=4))
+    result = CliRunner().invoke(check_fixtures, args, standalone_mode=False)
+    assert result.return_value is False
+    # The console may wrap the long file paths of the error messages.
+    output = "".join(result.output.split())
+    assert output.count("Errorchecking") == len(FIXTURE_FILES[1:])
+    assert all(file_name in output for file_name in FIXTURE_FILES[1:])
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_check_fixtures_stop_on_error(fixtures_folder: Path, jobs: str):
+    """Test that the first fixture file with a wrong hash raises its original exception."""
+    fixture_file = fixtures_folder / FIXTURE_FILES[0]
+    fixtures = json.loads(fixture_file.read_text())
+    next(iter(fixtures.values()))["_info"]["hash"] = "0x" + "00" * 32
+    fixture_file.write_text(json.dumps(fixtures, indent=4))
+    result = CliRunner().invoke(
+        check_fixtures,
+        ["--input", str(fixtures_folder), "--quiet", "--jobs", jobs, "--stop-on-error"],
+        standalone_mode=False,
+    )
+    assert isinstance(result.exception, HashMismatchExceptionError)
+
+
+def corrupt_fixture_file(fixture_file: Path):
+    """Write a wrong hash in the info of the first fixture of a fixture file."""
+    fixtures = json.loads(fixture_file.read_text())
+    next(iter(fixtures.values()))["_info"]["hash"] = "0x" + "00" * 32
+    fixture_file.write_text(json.dumps(fixtures, indent=4))
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_check_files_order(tmp_path: Path, jobs: int):
+    """Test that errors are reported, and stop the check, in the order of the files."""
+    json_file_paths = []
+    for i in range(12):
+        json_file_paths.append(tmp_path / f"{i:02}_{FIXTURE_FILES[i % len(FIXTURE_FILES)]}")
+        shutil.copy(FIXTURES_DIR / FIXTURE_FILES[i % len(FIXTURE_FILES)], json_file_paths[-1])
+    for i in (5, 11):
+        corrupt_fixture_file(json_file_paths[i])
+
+    results = list(check_files(json_file_paths, hash_only=True, jobs=jobs, stop_on_error=False))
+    assert [path for path, _ in results] == json_file_paths
+    assert [i for i, (_, error) in enumerate(results) if error is not None] == [5, 11]
+
+    checked: List[Tuple[Path, Optional[str]]] = []
+    with pytest.raises(HashMismatchExceptionError):
+        for result in check_files(json_file_paths, hash_only=True, jobs=jobs, stop_on_error=True):
+            checked.append(result)
+    assert checked == [(path, None) for path in json_file_paths[:5]]
@@ -0,0 +1,82 @@
+"""Test the removal of duplicate fixtures by compare_fixtures."""
+
+import json
+import shutil
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from ethereum_test_base_types import HexNumber
+from ethereum_test_fixtures.consume import INDEX_DATABASE_FILE_NAME, IndexDatabase, IndexFile
+from ethereum_test_fixtures.file import Fixtures
+
+from ..compare_fixtures import main
+from ..gen_index import generate_fixtures_index
+from ..hasher import HashableItem
+
+FIXTURES_DIR = Path(__file__).parents[2] / "ethereum_test_specs" / "tests" / "fixtures"
+SHARED_FILE = "chainid_cancun_state_test_tx_type_0.json"
+BASE_FILE = "chainid_shanghai_state_test_tx_type_0.json"
+PATCH_FILE = "chainid_paris_state_test_tx_type_0.json"
+
+
+def write_fixtures(folder: Path, file_names: list[str]):
+    """Copy fixture files into a folder and generate its index."""
+    for file_name in file_names:
+        destination = folder / "state_tests" / file_name
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        fixtures = json.loads((FIXTURES_DIR / file_name).read_text())
+        # Add a second fixture that is not a duplicate to the shared file.
+        fixture_name = next(iter(fixtures))
+        other_fixture = json.loads(json.dumps(fixtures[fixture_name]))
+        other_fixture["_info"]["hash"] = "0x" + folder.name.encode().hex().ljust(64, "0")
+        fixtures[f"{fixture_name}_{folder.name}"] = other_fixture
+        destination.write_text(json.dumps(dict(sorted(fixtures.items())), indent=4))
+    generate_fixtures_index(folder, quiet_mode=True, jobs=1)
+
+
+def load_index(folder: Path) -> IndexFile:
+    """Load the index of a fixture folder."""
+    return IndexFile.model_validate_json((folder / ".meta" / "index.json").read_text())
+
+
+def test_compare_fixtures_removes_duplicates(tmp_path: Path):
+    """Test that the duplicates are removed from both folders and their indexes are updated."""
+    base, patch = tmp_path / "base", tmp_path / "patch"
+    write_fixtures(base, [SHARED_FILE, BASE_FILE])
+    write_fixtures(patch, [SHARED_FILE, PATCH_FILE])
+    duplicate_ids = set(json.loads((FIXTURES_DIR / SHARED_FILE).read_text()))
+
+    result = CliRunner().invoke(main, [str(base), str(patch)])
+    assert result.exit_code == 0, result.output
+    assert result.output == f"Found {len(duplicate_ids)} duplicates.\n"
+
+    for folder in (base, patch):
+        shared_file = folder / "state_tests" / SHARED_FILE
+        assert not set(json.loads(shared_file.read_text())) & duplicate_ids
+        index = load_index(folder)
+        assert not {test_case.id for test_case in index.test_cases} & duplicate_ids
+        assert index.test_count == len(index.test_cases) == 3
+        assert index.root_hash == HexNumber(HashableItem.from_folder(folder_path=folder).hash())
+        for test_case in index.test_cases:
+            # The byte spans of the rewritten files match their new content.
+            fixtures = Fixtures.model_validate_json((folder / test_case.json_path).read_text())
+            assert test_case.load_fixture(folder) == fixtures[test_case.id]
+        index_database = IndexDatabase(folder / ".meta" / INDEX_DATABASE_FILE_NAME)
+        all_pairs = index_database.fork_format_pairs(["state_test"])
+        assert index_database.select_test_cases(all_pairs) == index.test_cases
+        index_database.close()
+
+
+def test_compare_fixtures_dry_run(tmp_path: Path):
+    """Test that a dry run does not modify any file."""
+    base, patch = tmp_path / "base", tmp_path / "patch"
+    write_fixtures(base, [SHARED_FILE])
+    write_fixtures(patch, [SHARED_FILE])
+    shutil.copytree(base, tmp_path / "base_copy")
+
+    result = CliRunner().invoke(main, [str(base), str(patch), "--dry-run"])
+    assert result.exit_code == 0, result.output
+    assert "Remove " in result.output
+    for path in (tmp_path / "base_copy").rglob("*.json"):
+        assert (base / path.relative_to(tmp_path / "base_copy")).read_text() == path.read_text()
@@ -0,0 +1,112 @@
+"""Test the fixture_store CLI tool and the loading of fixtures that reference a fixture store."""
+
+import json
+import shutil
+from pathlib import Path
+from typing import Dict
+
+import pytest
+from click.testing import CliRunner
+
+from ethereum_test_fixtures.consume import IndexFile
+from ethereum_test_fixtures.file import Fixtures
+from ethereum_test_fixtures.store import STORE_DIR_NAME, FixtureStore, is_store_reference
+
+from ..check_fixtures import check_fixtures
+from ..fixture_store import main
+from ..gen_index import generate_fixtures_index
+
+FIXTURES_DIR = Path(__file__).parents[2] / "ethereum_test_specs" / "tests" / "fixtures"
+FIXTURE_FILES = [
+    "chainid_cancun_blockchain_test_tx_type_0.json",
+    "chainid_paris_blockchain_test_engine_tx_type_0.json",
+    "chainid_cancun_state_test_tx_type_0.json",
+]
+
+
+@pytest.fixture
+def fixtures_folder(tmp_path: Path) -> Path:
+    """Copy the fixture files, twice, into an indexed temporary folder."""
+    for file_name in FIXTURE_FILES:
+        for sub_dir in ("a", "b"):
+            (tmp_path / sub_dir).mkdir(exist_ok=True)
+            shutil.copy(FIXTURES_DIR / file_name, tmp_path / sub_dir / file_name)
+    generate_fixtures_index(tmp_path, quiet_mode=True, jobs=1)
+    return tmp_path
+
+
+def file_contents(folder: Path) -> Dict[Path, str]:
+    """Return the contents of the fixture files of a folder."""
+    return {
+        path.relative_to(folder): path.read_text()
+        for path in folder.rglob("*.json")
+        if ".meta" not in path.parts and STORE_DIR_NAME not in path.parts
+    }
+
+
+def test_dedup_and_inflate(fixtures_folder: Path):
+    """Test that deduplicated fixtures load unchanged and that inflate restores the files."""
+    original_contents = file_contents(fixtures_folder)
+    original_fixtures = {
+        path: Fixtures.model_validate_json(contents)
+        for path, contents in original_contents.items()
+    }
+
+    result = CliRunner().invoke(main, ["dedup", str(fixtures_folder), "-j", "1"])
+    assert result.exit_code == 0, result.output
+    # Only the values large enough are stored, once for both copies of the files.
+    store_files = list((fixtures_folder / STORE_DIR_NAME).iterdir())
+    assert len(store_files) > 0
+    blockchain_test = json.loads(
+        (fixtures_folder / "a" / FIXTURE_FILES[0]).read_text(),
+    )
+    fixture_json = next(iter(blockchain_test.values()))
+    assert is_store_reference(fixture_json["pre"])
+    assert is_store_reference(fixture_json["genesisRLP"])
+    assert not is_store_reference(fixture_json["genesisBlockHeader"])
+    assert len(store_files) == sum(
+        is_store_reference(value)
+        for path in (fixtures_folder / "a").iterdir()
+        for fixture in json.loads(path.read_text()).values()
+        for value in fixture.values()
+    )
+
+    # The index is regenerated, so that the fixtures can be loaded from their byte spans.
+    index = IndexFile.model_validate_json((fixtures_folder / ".meta" / "index.json").read_text())
+    for test_case in index.test_cases:
+        fixture = test_case.load_fixture(fixtures_folder)
+        expected = original_fixtures[test_case.json_path][test_case.id]
+        assert fixture.hash == expected.hash
+        assert fixture == expected
+
+    store = FixtureStore.find(fixtures_folder / "a" / FIXTURE_FILES[0])
+    assert store is not None
+    loaded = Fixtures.model_validate_json(
+        (fixtures_folder / "a" / FIXTURE_FILES[0]).read_text(),
+        context={"fixture_store": store},
+    )
+    assert loaded == original_fixtures[Path("a") / FIXTURE_FILES[0]]
+
+    for hash_only in (False, True):
+        args = ["--input", str(fixtures_folder), "--quiet", "--jobs", "1"]
+        if hash_only:
+            args.append("--hash-only")
+        result = CliRunner().invoke(check_fixtures, args, standalone_mode=False)
+        assert result.exception is None, result.output
+        assert result.return_value is True
+
+    result = CliRunner().invoke(main, ["inflate", str(fixtures_folder), "-j", "1"])
+    assert result.exit_code == 0, result.output
+    assert not (fixtures_folder / STORE_DIR_NAME).exists()
+    assert {
+        path: Fixtures.model_validate_json(contents)
+        for path, contents in file_contents(fixtures_folder).items()
+    } == original_fixtures
+
+
+def test_missing_store(fixtures_folder: Path):
+    """Test that a reference cannot be resolved without a fixture store."""
+    result = CliRunner().invoke(main, ["dedup", str(fixtures_folder), "-j", "1"])
+    assert result.exit_code == 0, result.output
+    with pytest.raises(ValueError, match="fixture store"):
+        Fixtures.model_validate_json((fixtures_folder / "a" / FIXTURE_FILES[0]).read_text())
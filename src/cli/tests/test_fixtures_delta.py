@@ -0,0 +1,85 @@
+"""Test the fixtures delta CLI tool."""
+
+import json
+import shutil
+import tarfile
+from pathlib import Path
+from typing import Dict
+
+import pytest
+from click.testing import CliRunner
+
+from ..fixtures_delta import DELTA_MANIFEST_NAME, list_files, main
+from ..gen_index import generate_fixtures_index
+
+FIXTURES_DIR = Path(__file__).parents[2] / "ethereum_test_specs" / "tests" / "fixtures"
+FIXTURE_FILES = [
+    "chainid_cancun_blockchain_test_tx_type_0.json",
+    "chainid_paris_blockchain_test_engine_tx_type_0.json",
+    "chainid_cancun_state_test_tx_type_0.json",
+]
+
+
+def release_files(folder: Path) -> Dict[Path, bytes]:
+    """Return the content of the release files of a fixture folder."""
+    return {path: (folder / path).read_bytes() for path in list_files(folder)}
+
+
+@pytest.fixture
+def base(tmp_path: Path) -> Path:
+    """Return an indexed fixture folder."""
+    base = tmp_path / "base"
+    for file_name in FIXTURE_FILES:
+        (base / "tests").mkdir(parents=True, exist_ok=True)
+        shutil.copy(FIXTURES_DIR / file_name, base / "tests" / file_name)
+    generate_fixtures_index(base, quiet_mode=True, jobs=1)
+    return base
+
+
+@pytest.fixture
+def target(base: Path, tmp_path: Path) -> Path:
+    """Return the next release of the base folder: a fixture changed, one removed, one added."""
+    target = tmp_path / "target"
+    shutil.copytree(base, target)
+    changed_file = target / "tests" / FIXTURE_FILES[0]
+    fixtures = json.loads(changed_file.read_text())
+    next(iter(fixtures.values()))["_info"]["hash"] = "0x" + "11" * 32
+    changed_file.write_text(json.dumps(fixtures, indent=4))
+    (target / "tests" / FIXTURE_FILES[1]).unlink()
+    (target / "new_tests").mkdir()
+    shutil.copy(FIXTURES_DIR / FIXTURE_FILES[1], target / "new_tests" / FIXTURE_FILES[1])
+    generate_fixtures_index(target, quiet_mode=True, jobs=1)
+    return target
+
+
+def test_delta_and_apply(base: Path, target: Path, tmp_path: Path):
+    """Test that a delta only holds the changes and rebuilds the target from the base."""
+    delta_archive = tmp_path / "fixtures.delta.tar.gz"
+    result = CliRunner().invoke(main, ["delta", str(base), str(target), str(delta_archive)])
+    assert result.exit_code == 0, result.output
+
+    with tarfile.open(delta_archive) as tar:
+        delta = json.loads(tar.extractfile(DELTA_MANIFEST_NAME).read())  # type: ignore[union-attr]
+        assert sorted(tar.getnames()) == [
+            DELTA_MANIFEST_NAME,
+            "fixtures/.meta/index.json",
+            "fixtures/.meta/index.sqlite",
+            f"fixtures/new_tests/{FIXTURE_FILES[1]}",
+            f"fixtures/tests/{FIXTURE_FILES[0]}",
+        ]
+    assert delta["removed"] == [f"tests/{FIXTURE_FILES[1]}"]
+
+    output = tmp_path / "output"
+    result = CliRunner().invoke(main, ["apply-delta", str(base), str(delta_archive), str(output)])
+    assert result.exit_code == 0, result.output
+    assert release_files(output) == release_files(target)
+    # The base folder is left untouched.
+    assert (base / "tests" / FIXTURE_FILES[1]).exists()
+
+    # The delta does not apply to the target folder.
+    result = CliRunner().invoke(
+        main, ["apply-delta", str(target), str(delta_archive), str(tmp_path / "other")]
+    )
+    assert result.exit_code != 0
+    assert "root hash" in result.output
+    assert not (tmp_path / "other").exists()
@@ -0,0 +1,188 @@
+"""Test the fixture index generation."""
+
+import json
+import shutil
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from ethereum_test_base_types import HexNumber
+from ethereum_test_fixtures import BaseFixture
+from ethereum_test_fixtures.consume import (
+    INDEX_DATABASE_FILE_NAME,
+    IndexDatabase,
+    IndexFile,
+    TestCaseIndexFile,
+)
+from ethereum_test_fixtures.file import Fixtures
+
+from ..gen_index import generate_fixtures_index
+from ..hasher import HashableItem
+from ..stat_cache import FixtureStatCache
+
+FIXTURES_DIR = Path(__file__).parents[2] / "ethereum_test_specs" / "tests" / "fixtures"
+FIXTURE_FILES = [
+    "chainid_cancun_blockchain_test_tx_type_0.json",
+    "chainid_paris_blockchain_test_engine_tx_type_0.json",
+    "chainid_cancun_state_test_tx_type_0.json",
+    "chainid_shanghai_state_test_tx_type_0.json",
+    "tx_simple_type_0_shanghai.json",
+]
+
+
+def validated_test_cases(input_path: Path) -> List[TestCaseIndexFile]:
+    """Build the index test cases by fully validating each fixture file."""
+    test_cases = []
+    for file in input_path.rglob("*.json"):
+        if ".meta" in file.parts:
+            continue
+        fixtures = Fixtures.model_validate_json(file.read_text())
+        for fixture_name, fixture in fixtures.items():
+            test_cases.append(
+                TestCaseIndexFile(
+                    id=fixture_name,
+                    json_path=file.relative_to(input_path),
+                    fixture_hash=fixture.info.get("hash")
+                    or f"0x{fixture.info.get('generatedTestHash')}",
+                    fork=fixture.get_fork(),
+                    format=fixture.__class__,
+                    pre_hash=getattr(fixture, "pre_hash", None),
+                )
+            )
+    return test_cases
+
+
+@pytest.mark.parametrize("compact", [False, True], ids=["indented", "compact"])
+def test_generate_fixtures_index(tmp_path: Path, compact: bool):
+    """Test that the index matches the one built from the fully validated fixtures."""
+    for i, file_name in enumerate(FIXTURE_FILES):
+        destination = tmp_path / f"dir_{i % 2}" / file_name
+        destination.parent.mkdir(exist_ok=True)
+        if compact:
+            destination.write_text(json.dumps(json.loads((FIXTURES_DIR / file_name).read_text())))
+        else:
+            shutil.copy(FIXTURES_DIR / file_name, destination)
+
+    generate_fixtures_index(tmp_path, quiet_mode=True, jobs=2)
+
+    index = IndexFile.model_validate_json((tmp_path / ".meta" / "index.json").read_text())
+    expected_test_cases = validated_test_cases(tmp_path)
+    assert index.test_count == len(expected_test_cases) == len(FIXTURE_FILES)
+    assert [
+        test_case.model_dump_json(exclude={"offset", "length"}) for test_case in index.test_cases
+    ] == [
+        test_case.model_dump_json(exclude={"offset", "length"})
+        for test_case in expected_test_cases
+    ]
+    for test_case in index.test_cases:
+        # Files written by the filler are indexed with the byte span of each fixture.
+        assert (test_case.offset is None) == compact
+        fixtures = Fixtures.model_validate_json((tmp_path / test_case.json_path).read_text())
+        assert test_case.load_fixture(tmp_path) == fixtures[test_case.id]
+    assert set(index.forks or []) == {test_case.fork for test_case in expected_test_cases}
+    assert set(index.fixture_formats or []) == {
+        test_case.format.format_name for test_case in expected_test_cases
+    }
+
+
+def test_generate_fixtures_index_stat_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test that unchanged files are not read again and that changes refresh the index."""
+    for file_name in FIXTURE_FILES:
+        shutil.copy(FIXTURES_DIR / file_name, tmp_path / file_name)
+    generate_fixtures_index(tmp_path, quiet_mode=True, jobs=1)
+    # The stat cache is kept outside of the fixture directory.
+    assert sorted(path.name for path in (tmp_path / ".meta").iterdir()) == [
+        "index.json",
+        "index.sqlite",
+    ]
+    stat_cache = FixtureStatCache.load(tmp_path)
+    assert sorted(stat_cache.files) == sorted(FIXTURE_FILES)
+    assert all(cached.index_entries for cached in stat_cache.files.values())
+
+    def fail(file_path: Path):
+        raise AssertionError(f"unchanged file {file_path} was read")
+
+    # Warm cache: neither the root hash nor the index requires reading any file.
+    with monkeypatch.context() as m:
+        m.setattr(HashableItem, "read_test_hashes", staticmethod(fail))
+        generate_fixtures_index(tmp_path, quiet_mode=True, force_flag=True, jobs=1)
+        root_hash = HashableItem.from_folder(folder_path=tmp_path, stat_cache=stat_cache).hash()
+    assert root_hash == HashableItem.from_folder(folder_path=tmp_path).hash()
+
+    # Changing the hash of a fixture and removing a file refreshes the index.
+    changed_file = tmp_path / FIXTURE_FILES[0]
+    fixtures = json.loads(changed_file.read_text())
+    fixture_name = next(iter(fixtures))
+    fixtures[fixture_name]["_info"]["hash"] = "0x" + "00" * 32
+    changed_file.write_text(json.dumps(fixtures, indent=4))
+    (tmp_path / FIXTURE_FILES[1]).unlink()
+    generate_fixtures_index(tmp_path, quiet_mode=True, jobs=1)
+
+    index = IndexFile.model_validate_json((tmp_path / ".meta" / "index.json").read_text())
+    assert index.root_hash == HexNumber(HashableItem.from_folder(folder_path=tmp_path).hash())
+    assert {str(test_case.json_path) for test_case in index.test_cases} == set(
+        FIXTURE_FILES[:1] + FIXTURE_FILES[2:]
+    )
+    assert [
+        test_case.fixture_hash
+        for test_case in index.test_cases
+        if test_case.id == fixture_name and str(test_case.json_path) == FIXTURE_FILES[0]
+    ] == [HexNumber(0)]
+    assert FIXTURE_FILES[1] not in FixtureStatCache.load(tmp_path).files
+
+
+def test_generate_fixtures_index_database(tmp_path: Path):
+    """Test that the index database holds the test cases of the index and filters them."""
+    for file_name in FIXTURE_FILES:
+        shutil.copy(FIXTURES_DIR / file_name, tmp_path / file_name)
+    generate_fixtures_index(tmp_path, quiet_mode=True, jobs=1)
+    index = IndexFile.model_validate_json((tmp_path / ".meta" / "index.json").read_text())
+
+    index_database = IndexDatabase(tmp_path / ".meta" / INDEX_DATABASE_FILE_NAME)
+    assert sorted(index_database.forks) == sorted(str(fork) for fork in index.forks or [])
+    all_formats = [fixture_format.format_name for fixture_format in BaseFixture.formats.values()]
+    all_pairs = index_database.fork_format_pairs(all_formats)
+    assert index_database.select_test_cases(all_pairs) == index.test_cases
+
+    state_test_pairs = index_database.fork_format_pairs(["state_test"])
+    assert {fork for fork, _ in state_test_pairs} == {"Cancun", "Shanghai"}
+    shanghai_pairs = [pair for pair in state_test_pairs if pair[0] == "Shanghai"]
+    assert index_database.select_test_cases(shanghai_pairs) == [
+        test_case
+        for test_case in index.test_cases
+        if str(test_case.fork) == "Shanghai" and test_case.format.format_name == "state_test"
+    ]
+
+    selected_id = index.test_cases[0].id
+    assert index_database.select_test_cases(
+        all_pairs, id_filter=lambda test_case_id: test_case_id == selected_id
+    ) == [test_case for test_case in index.test_cases if test_case.id == selected_id]
+    assert index_database.select_test_cases([]) == []
+    index_database.close()
+
+
+def test_generate_fixtures_index_database_from_index(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that an up-to-date index without a database is kept and only its database added."""
+    for file_name in FIXTURE_FILES:
+        shutil.copy(FIXTURES_DIR / file_name, tmp_path / file_name)
+    generate_fixtures_index(tmp_path, quiet_mode=True, jobs=1)
+    index_file = tmp_path / ".meta" / "index.json"
+    database_file = tmp_path / ".meta" / INDEX_DATABASE_FILE_NAME
+    index_json = index_file.read_text()
+    database_file.unlink()
+
+    def fail(file_path: Path):
+        raise AssertionError(f"unchanged file {file_path} was indexed")
+
+    with monkeypatch.context() as m:
+        m.setattr("cli.gen_index.index_fixture_file", fail)
+        generate_fixtures_index(tmp_path, quiet_mode=True, jobs=1)
+    assert index_file.read_text() == index_json
+    index_database = IndexDatabase(database_file)
+    assert sorted(index_database.forks) == sorted(
+        str(fork) for fork in IndexFile.model_validate_json(index_json).forks or []
+    )
+    index_database.close()
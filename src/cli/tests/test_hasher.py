@@ -0,0 +1,94 @@
+"""Test the hasher CLI tool."""
+
+import hashlib
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from ..hasher import HashableItem, HashableItemType, main
+from ..stat_cache import FixtureStatCache
+
+FIXTURES_DIR = Path(__file__).parents[2] / "ethereum_test_specs" / "tests" / "fixtures"
+FIXTURE_FILES = [
+    "chainid_cancun_blockchain_test_tx_type_0.json",
+    "chainid_paris_blockchain_test_engine_tx_type_0.json",
+    "chainid_cancun_state_test_tx_type_0.json",
+    "chainid_shanghai_state_test_tx_type_0.json",
+]
+
+
+@pytest.fixture
+def fixtures_folder(tmp_path: Path) -> Path:
+    """Copy the fixture files into two sub-folders of a temporary folder."""
+    folder_path = tmp_path / "fixtures"
+    for i, file_name in enumerate(FIXTURE_FILES):
+        destination = folder_path / f"dir_{i % 2}" / file_name
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy(FIXTURES_DIR / file_name, destination)
+    return folder_path
+
+
+def test_hash_is_digest_of_concatenated_item_hashes():
+    """Test that the hash of an item is the digest of the sorted hashes of its items."""
+    items = {
+        name: HashableItem(type=HashableItemType.TEST, root=bytes([i]) * 32)
+        for i, name in enumerate(["b", "a", "c"])
+    }
+    item = HashableItem(type=HashableItemType.FILE, items=items)
+    expected = hashlib.sha256(bytes([1]) * 32 + bytes([0]) * 32 + bytes([2]) * 32).digest()
+    assert item.hash() == expected
+
+
+def test_from_folder_jobs_and_stat_cache(fixtures_folder: Path):
+    """Test that the root hash does not depend on the process pool or the stat cache."""
+    root_hash = HashableItem.from_folder(folder_path=fixtures_folder).hash()
+    assert HashableItem.from_folder(folder_path=fixtures_folder, jobs=2).hash() == root_hash
+
+    stat_cache = FixtureStatCache()
+    item = HashableItem.from_folder(folder_path=fixtures_folder, stat_cache=stat_cache, jobs=2)
+    assert item.hash() == root_hash
+    assert len(stat_cache.files) == len(FIXTURE_FILES)
+    assert all(cached.file_hash for cached in stat_cache.files.values())
+    cached_item = HashableItem.from_folder(
+        folder_path=fixtures_folder, stat_cache=stat_cache, jobs=2
+    )
+    assert cached_item.hash() == root_hash
+
+
+def test_diff(fixtures_folder: Path, tmp_path: Path):
+    """Test that only the differing files and tests are printed."""
+    other_folder = tmp_path / "other"
+    shutil.copytree(fixtures_folder, other_folder)
+    changed_file = other_folder / "dir_0" / FIXTURE_FILES[0]
+    fixtures = json.loads(changed_file.read_text())
+    fixture_name = next(iter(fixtures))
+    fixtures[fixture_name]["_info"]["hash"] = "0x" + "00" * 32
+    changed_file.write_text(json.dumps(fixtures, indent=4))
+    (other_folder / "dir_1" / FIXTURE_FILES[1]).unlink()
+
+    runner = CliRunner()
+    result = runner.invoke(main, [str(fixtures_folder), "--diff", str(other_folder), "-j", "1"])
+    assert result.exit_code == 0, result.output
+    lines = result.output.splitlines()
+    assert [line.split(":")[0] for line in lines] == [
+        f"dir_0/{FIXTURE_FILES[0]}",
+        f"dir_1/{FIXTURE_FILES[1]}",
+    ]
+    assert lines[1].endswith("!= missing")
+    # The stat cache is kept outside of the compared folders, which are only read.
+    assert not (fixtures_folder / ".meta").exists()
+    assert not (other_folder / ".meta").exists()
+
+    result = runner.invoke(
+        main, [str(fixtures_folder), "--diff", str(other_folder), "--tests", "-j", "1"]
+    )
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines()[0].startswith(f"dir_0/{FIXTURE_FILES[0]}::{fixture_name}: ")
+    assert result.output.splitlines()[0].endswith(f"!= 0x{'00' * 32}")
+
+    result = runner.invoke(main, [str(fixtures_folder), "--diff", str(fixtures_folder)])
+    assert result.exit_code == 0, result.output
+    assert result.output == ""
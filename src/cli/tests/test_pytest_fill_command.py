@@ -61,7 +61,7 @@ class TestHtmlReportFlags:
             "test_dup and state_test-DUP16",
             "--fork",
             "Frontier",
-            f"--t8n-server-url={default_t8n.server_url}",
+            f"--t8n-server-url={default_t8n.managed_server_url}",
         ]
 
     @pytest.fixture()
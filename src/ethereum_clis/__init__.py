@@ -9,7 +9,9 @@ from .clis.nethermind import Nethtest, NethtestFixtureConsumer
 from .clis.nimbus import NimbusTransitionTool
 from .ethereum_cli import CLINotFoundInPathError, UnknownCLIError
 from .fixture_consumer_tool import FixtureConsumerTool
+from .traces import TraceFilter, TransactionTrace
 from .transition_tool import TransitionTool
+from .transition_tool_session import TransitionToolSession, TransitionToolSessionError
 from .types import (
     BlockExceptionWithMessage,
     Result,
@@ -35,8 +37,12 @@ __all__ = (
     "NethtestFixtureConsumer",
     "NimbusTransitionTool",
     "Result",
+    "TraceFilter",
     "TransactionExceptionWithMessage",
+    "TransactionTrace",
     "TransitionTool",
     "TransitionToolOutput",
+    "TransitionToolSession",
+    "TransitionToolSessionError",
     "UnknownCLIError",
 )
@@ -1,7 +1,6 @@
 """Hyperledger Besu Transition tool frontend."""
 
 import json
-import os
 import re
 import subprocess
 import tempfile
@@ -9,8 +8,6 @@ import textwrap
 from pathlib import Path
 from typing import ClassVar, Dict, Optional
 
-import requests  # type: ignore
-
 from ethereum_test_exceptions import (
     BlockException,
     ExceptionBase,
@@ -19,6 +16,7 @@ from ethereum_test_exceptions import (
 )
 from ethereum_test_forks import Fork
 
+from ..daemon_pool import DaemonStartupError, TransitionToolDaemon
 from ..transition_tool import TransitionTool, dump_files_to_directory, model_dump_config
 from ..types import TransitionToolOutput
 
@@ -31,8 +29,8 @@ class BesuTransitionTool(TransitionTool):
     binary: Path
     cached_version: Optional[str] = None
     trace: bool
-    process: Optional[subprocess.Popen] = None
-    server_url: str
+    t8n_use_server: bool = True
+    supports_daemon: bool = True
     besu_trace_dir: Optional[tempfile.TemporaryDirectory]
 
     def __init__(
@@ -55,10 +53,10 @@ class BesuTransitionTool(TransitionTool):
         self.help_string = result.stdout
         self.besu_trace_dir = tempfile.TemporaryDirectory() if self.trace else None
 
-    def start_server(self):
+    def start_daemon(self) -> TransitionToolDaemon:
         """
-        Start the t8n-server process, extract the port, and leave it running
-        for future reuse.
+        Start a `t8n-server` process on an OS assigned port and wait until it reports that it
+        is listening.
         """
         args = [
             str(self.binary),
@@ -67,33 +65,36 @@ class BesuTransitionTool(TransitionTool):
         ]
 
         if self.trace:
+            assert self.besu_trace_dir is not None
             args.append("--trace")
             args.append(f"--output.basedir={self.besu_trace_dir.name}")
 
-        self.process = subprocess.Popen(
+        process = subprocess.Popen(
             args=args,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
         )
 
+        assert process.stdout is not None
         while True:
-            line = str(self.process.stdout.readline())
+            line = str(process.stdout.readline())
 
             if not line or "Failed to start transition server" in line:
-                raise Exception("Failed starting Besu subprocess\n" + line)
-            if "Transition server listening on" in line:
-                port = re.search("Transition server listening on (\\d+)", line).group(1)
-                self.server_url = f"http://localhost:{port}/"
-                break
+                process.kill()
+                raise DaemonStartupError("Failed starting Besu subprocess\n" + line)
+            match = re.search("Transition server listening on (\\d+)", line)
+            if match:
+                return TransitionToolDaemon(
+                    url=f"http://localhost:{match.group(1)}/", process=process
+                )
 
     def shutdown(self):
-        """Stop the t8n-server process if it was started."""
-        if self.process:
-            self.process.kill()
+        """Stop the t8n-server processes if they were started."""
+        super().shutdown()
         if self.besu_trace_dir:
             self.besu_trace_dir.cleanup()
 
-    def evaluate(
+    def _evaluate(
         self,
         *,
         transition_tool_data: TransitionTool.TransitionToolData,
@@ -101,9 +102,6 @@ class BesuTransitionTool(TransitionTool):
         slow_request: bool = False,
     ) -> TransitionToolOutput:
         """Execute `evm t8n` with the specified arguments."""
-        if not self.process:
-            self.start_server()
-
         input_json = transition_tool_data.to_input().model_dump(mode="json", **model_dump_config)
 
         state_json = {
@@ -140,11 +138,9 @@ class BesuTransitionTool(TransitionTool):
                 },
             )
 
-        response = requests.post(self.server_url, json=post_data, timeout=5)
+        response = self.ensure_server().post(data=post_data, timeout=5)
         response.raise_for_status()  # exception visible in pytest failure output
-        output: TransitionToolOutput = TransitionToolOutput.model_validate(
-            response.json(), context={"exception_mapper": self.exception_mapper}
-        )
+        output = self._validate_output(response.json())
 
         if debug_output_path:
             dump_files_to_directory(
@@ -176,9 +172,6 @@ class BesuTransitionTool(TransitionTool):
 
         if self.trace and self.besu_trace_dir:
             self.collect_traces(output.result.receipts, self.besu_trace_dir, debug_output_path)
-            for i, r in enumerate(output.result.receipts):
-                trace_file_name = f"trace-{i}-{r.transaction_hash}.jsonl"
-                os.remove(os.path.join(self.besu_trace_dir.name, trace_file_name))
 
         return output
 
@@ -4,10 +4,11 @@ Ethereum Specs EVM Resolver Transition Tool Interface.
 https://github.com/petertdavies/ethereum-spec-evm-resolver
 """
 
+import json
 import os
 import re
 import subprocess
-import time
+from importlib.metadata import PackageNotFoundError, distribution
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import ClassVar, Dict, List, Optional
@@ -20,9 +21,45 @@ from ethereum_test_exceptions import (
 )
 from ethereum_test_forks import Fork
 
+from ..daemon_pool import TransitionToolDaemon, wait_for_unix_socket
 from ..transition_tool import TransitionTool
 
-DAEMON_STARTUP_TIMEOUT_SECONDS = 5
+EDITABLE_DISTRIBUTION_NAMES = ("ethereum-spec-evm-resolver", "ethereum-execution")
+"""Distributions of the resolver and of EELS whose code can change without a version change."""
+
+
+def eels_resolutions_pinned(eels_resolutions: List[str]) -> bool:
+    """
+    Return whether the given EELS resolutions, JSON texts as found in `EELS_RESOLUTIONS` or
+    `EELS_RESOLUTIONS_FILE`, pin every fork to a git commit.
+
+    Resolutions to a local `path`, or to a `branch` without a `commit`, can change without the
+    resolutions changing, and so can the default resolutions of the resolver.
+    """
+    if not eels_resolutions:
+        return False
+    for eels_resolutions_text in eels_resolutions:
+        try:
+            resolutions = json.loads(eels_resolutions_text)
+        except json.JSONDecodeError:
+            return False
+        if not isinstance(resolutions, dict) or not all(
+            isinstance(resolution, dict) and ("same_as" in resolution or "commit" in resolution)
+            for resolution in resolutions.values()
+        ):
+            return False
+    return True
+
+
+def is_editable_install(distribution_name: str) -> bool:
+    """Return whether a distribution is installed in editable mode in the current environment."""
+    try:
+        direct_url = distribution(distribution_name).read_text("direct_url.json")
+    except PackageNotFoundError:
+        return False
+    if not direct_url:
+        return False
+    return bool(json.loads(direct_url).get("dir_info", {}).get("editable", False))
 
 
 class ExecutionSpecsTransitionTool(TransitionTool):
@@ -45,7 +82,7 @@ class ExecutionSpecsTransitionTool(TransitionTool):
     default_binary = Path("ethereum-spec-evm-resolver")
     detect_binary_pattern = re.compile(r"^ethereum-spec-evm-resolver\b")
     t8n_use_server: bool = True
-    server_dir: Optional[TemporaryDirectory] = None
+    supports_daemon: bool = True
     server_url: str | None = None
 
     def __init__(
@@ -75,38 +112,56 @@ class ExecutionSpecsTransitionTool(TransitionTool):
         self.help_string = result.stdout
         self.server_url = server_url
 
-    def start_server(self):
+    def start_daemon(self) -> TransitionToolDaemon:
         """
-        Start the t8n-server process, extract the port, and leave it running
-        for future reuse.
+        Start an `ethereum-spec-evm-resolver` daemon listening on a unix domain socket and
+        wait until it accepts connections.
         """
-        self.server_dir = TemporaryDirectory()
-        self.server_file_path = Path(self.server_dir.name) / "t8n.sock"
-        replaced_str = str(self.server_file_path).replace("/", "%2F")
-        self.server_url = f"http+unix://{replaced_str}/"
-        self.process = subprocess.Popen(
+        server_dir = TemporaryDirectory()
+        server_file_path = Path(server_dir.name) / "t8n.sock"
+        replaced_str = str(server_file_path).replace("/", "%2F")
+        process = subprocess.Popen(
             args=[
                 str(self.binary),
                 "daemon",
                 "--uds",
-                self.server_file_path,
+                server_file_path,
             ],
         )
-        start = time.time()
-        while True:
-            if self.server_file_path.exists():
-                break
-            if time.time() - start > DAEMON_STARTUP_TIMEOUT_SECONDS:
-                raise Exception("Failed starting ethereum-spec-evm subprocess")
-            time.sleep(0)  # yield to other processes
-
-    def shutdown(self):
-        """Stop the t8n-server process if it was started."""
-        if self.process:
-            self.process.terminate()
-        if self.server_dir:
-            self.server_dir.cleanup()
-            self.server_dir = None
+        try:
+            wait_for_unix_socket(process, server_file_path)
+        except Exception:
+            process.kill()
+            server_dir.cleanup()
+            raise
+        return TransitionToolDaemon(
+            url=f"http+unix://{replaced_str}/",
+            process=process,
+            temp_dir=server_dir,
+        )
+
+    def tool_identity(self) -> str | None:
+        """
+        Return a string that uniquely identifies the tool build being used.
+
+        The resolver fetches the EELS version for each fork at runtime, so the configured
+        resolutions are part of the identity in addition to the resolver binary itself. The
+        identity can only be pinned if every resolution is pinned to a commit, and neither the
+        resolver nor EELS are editable installs.
+        """
+        if self.cached_identity is None:
+            eels_resolutions = []
+            if eels_resolutions_env := os.environ.get("EELS_RESOLUTIONS"):
+                eels_resolutions.append(eels_resolutions_env)
+            eels_resolutions_file = os.environ.get("EELS_RESOLUTIONS_FILE")
+            if eels_resolutions_file and Path(eels_resolutions_file).exists():
+                eels_resolutions.append(Path(eels_resolutions_file).read_text())
+            if not eels_resolutions_pinned(eels_resolutions) or any(
+                is_editable_install(name) for name in EDITABLE_DISTRIBUTION_NAMES
+            ):
+                return None
+            self.cached_identity = f"{super().tool_identity()}:{''.join(eels_resolutions)}"
+        return self.cached_identity
 
     def is_fork_supported(self, fork: Fork) -> bool:
         """
@@ -105,7 +105,6 @@ class GethEvm(EthereumCLI):
         """Initialize the GethEvm class."""
         self.binary = binary if binary else self.default_binary
         self.trace = trace
-        self._info_metadata: Optional[Dict[str, Any]] = {}
 
     def _run_command(self, command: List[str]) -> subprocess.CompletedProcess:
         try:
@@ -193,14 +192,14 @@ class GethFixtureConsumer(
 ):
     """Geth's implementation of the fixture consumer."""
 
-    def consume_blockchain_test(
+    def consume_blockchain_test_file(
         self,
         fixture_path: Path,
         fixture_name: Optional[str] = None,
         debug_output_path: Optional[Path] = None,
-    ):
+    ) -> List[Dict[str, Any]]:
         """
-        Consume a single blockchain test.
+        Run `evm blocktest` on a fixture file and return the result of each executed test.
 
         The `evm blocktest` command takes the `--run` argument which can be used to select a
         specific fixture from the fixture file when executing.
@@ -236,7 +235,20 @@ class GethFixtureConsumer(
         result_json = json.loads(result.stdout)
         if not isinstance(result_json, list):
             raise Exception(f"Unexpected result from evm blocktest: {result_json}")
+        return result_json
 
+    def consume_blockchain_test(
+        self,
+        fixture_path: Path,
+        fixture_name: Optional[str] = None,
+        debug_output_path: Optional[Path] = None,
+    ):
+        """Consume a single blockchain test, or all the tests in the file if no name is given."""
+        result_json = self.consume_blockchain_test_file(
+            fixture_path=fixture_path,
+            fixture_name=fixture_name,
+            debug_output_path=debug_output_path,
+        )
         if any(not test_result["pass"] for test_result in result_json):
             exception_text = "Blockchain test failed: \n" + "\n".join(
                 f"{test_result['name']}: " + test_result["error"]
@@ -344,3 +356,30 @@ class GethFixtureConsumer(
             raise Exception(
                 f"Fixture format {fixture_format.format_name} not supported by {self.binary}"
             )
+
+    def consume_fixture_file(
+        self,
+        fixture_format: FixtureFormat,
+        fixture_path: Path,
+        fixture_names: List[str],
+        debug_output_path: Optional[Path] = None,
+    ) -> Dict[str, str | None]:
+        """
+        Execute all the fixtures of the file at `fixture_path` with a single `evm blocktest` or
+        `evm statetest` call and map the results back to the fixture names.
+        """
+        if fixture_format == BlockchainFixture:
+            results = self.consume_blockchain_test_file(
+                fixture_path=fixture_path,
+                debug_output_path=debug_output_path,
+            )
+        elif fixture_format == StateFixture:
+            results = self.consume_state_test_file(
+                fixture_path=fixture_path,
+                debug_output_path=debug_output_path,
+            )
+        else:
+            raise Exception(
+                f"Fixture format {fixture_format.format_name} not supported by {self.binary}"
+            )
+        return self.map_file_results(results, fixture_names)
@@ -0,0 +1,205 @@
+"""Pool of transition tool daemons (t8n-servers) with load balancing and crash recovery."""
+
+import socket
+import subprocess
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlencode
+
+from requests import Response
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests_unixsocket import Session  # type: ignore
+
+DAEMON_STARTUP_TIMEOUT_SECONDS = 5
+DAEMON_READINESS_POLL_SECONDS = 0.01
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+class DaemonStartupError(Exception):
+    """Exception raised when a transition tool daemon fails to start."""
+
+    pass
+
+
+def wait_for_unix_socket(
+    process: subprocess.Popen,
+    socket_path: Path,
+    timeout: float = DAEMON_STARTUP_TIMEOUT_SECONDS,
+) -> None:
+    """
+    Wait until the daemon accepts connections on the given unix domain socket.
+
+    Raises `DaemonStartupError` if the process exits or the socket does not accept connections
+    before the timeout.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        if process.poll() is not None:
+            raise DaemonStartupError(
+                f"t8n daemon exited with return code {process.returncode} during startup"
+            )
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+            try:
+                s.connect(str(socket_path))
+                return
+            except (FileNotFoundError, ConnectionRefusedError):
+                pass
+        if time.monotonic() > deadline:
+            raise DaemonStartupError(
+                f"t8n daemon did not accept connections on {socket_path} after {timeout}s"
+            )
+        time.sleep(DAEMON_READINESS_POLL_SECONDS)
+
+
+@dataclass
+class TransitionToolDaemon:
+    """A single running t8n-server along with a persistent (keep-alive) session to it."""
+
+    url: str
+    process: Optional[subprocess.Popen] = None
+    temp_dir: Optional[TemporaryDirectory] = None
+    session: Session = field(default_factory=Session)
+    in_flight: int = 0
+
+    def is_alive(self) -> bool:
+        """Return whether the daemon process is still running (external servers always are)."""
+        return self.process is None or self.process.poll() is None
+
+    def shutdown(self) -> None:
+        """Stop the daemon process and release its resources."""
+        self.session.close()
+        if self.process is not None and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=DAEMON_STARTUP_TIMEOUT_SECONDS)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        if self.temp_dir is not None:
+            self.temp_dir.cleanup()
+            self.temp_dir = None
+
+
+class TransitionToolDaemonPool:
+    """
+    Pool of t8n-server daemons.
+
+    Requests are dispatched to the daemon with the least requests in flight, using a persistent
+    session per daemon. Daemons that crash are transparently restarted and the request retried.
+    """
+
+    daemons: List[TransitionToolDaemon]
+    start_daemon: Optional[Callable[[], TransitionToolDaemon]]
+
+    def __init__(
+        self,
+        *,
+        start_daemon: Optional[Callable[[], TransitionToolDaemon]] = None,
+        size: int = 1,
+        daemons: Optional[List[TransitionToolDaemon]] = None,
+    ):
+        """
+        Initialize the pool by starting `size` daemons with `start_daemon`, or wrap a list of
+        already running daemons.
+        """
+        self.start_daemon = start_daemon
+        self._lock = threading.Lock()
+        if daemons is not None:
+            self.daemons = daemons
+        else:
+            assert start_daemon is not None, "either start_daemon or daemons must be provided"
+            assert size > 0, "daemon pool size must be positive"
+            self.daemons = []
+            try:
+                for _ in range(size):
+                    self.daemons.append(start_daemon())
+            except Exception:
+                self.shutdown()
+                raise
+
+    @classmethod
+    def from_url(cls, url: str) -> "TransitionToolDaemonPool":
+        """Create a pool with a single, externally managed t8n-server."""
+        return cls(daemons=[TransitionToolDaemon(url=url)])
+
+    @property
+    def url(self) -> str:
+        """Return the URL of the first daemon in the pool."""
+        return self.daemons[0].url
+
+    def select(self) -> TransitionToolDaemon:
+        """Return the daemon with the least requests in flight."""
+        with self._lock:
+            return min(self.daemons, key=lambda d: d.in_flight)
+
+    def _acquire(self, preferred: Optional[TransitionToolDaemon] = None) -> TransitionToolDaemon:
+        with self._lock:
+            if preferred is not None and preferred in self.daemons:
+                daemon = preferred
+            else:
+                daemon = min(self.daemons, key=lambda d: d.in_flight)
+            daemon.in_flight += 1
+            return daemon
+
+    def _release(self, daemon: TransitionToolDaemon) -> None:
+        with self._lock:
+            daemon.in_flight -= 1
+
+    def _restart(self, daemon: TransitionToolDaemon) -> None:
+        """Replace a crashed daemon with a freshly started one."""
+        assert self.start_daemon is not None
+        with self._lock:
+            if daemon not in self.daemons:  # already restarted by another thread
+                return
+            index = self.daemons.index(daemon)
+        daemon.shutdown()
+        new_daemon = self.start_daemon()
+        with self._lock:
+            self.daemons[index] = new_daemon
+
+    def post(
+        self,
+        data: Dict[str, Any] | bytes,
+        timeout: int,
+        url_args: Optional[Dict[str, List[str] | str]] = None,
+        retries: int = 5,
+        daemon: Optional[TransitionToolDaemon] = None,
+    ) -> Response:
+        """
+        Send a POST request to the least loaded daemon and return the response.
+
+        `data` is either a JSON serializable object or an already encoded JSON body. If `daemon`
+        is given, the request is sent to it instead, unless it has been replaced after a crash.
+        """
+        preferred = daemon
+        post_delay = 0.1
+        while True:
+            daemon = self._acquire(preferred)
+            url = daemon.url
+            if url_args:
+                url += f"?{urlencode(url_args, doseq=True)}"
+            try:
+                if isinstance(data, bytes):
+                    return daemon.session.post(
+                        url, data=data, headers=JSON_HEADERS, timeout=timeout
+                    )
+                return daemon.session.post(url, json=data, timeout=timeout)
+            except RequestsConnectionError as e:
+                retries -= 1
+                if retries == 0:
+                    raise e
+                if not daemon.is_alive() and self.start_daemon is not None:
+                    self._restart(daemon)
+                else:
+                    time.sleep(post_delay)
+                    post_delay *= 2
+            finally:
+                self._release(daemon)
+
+    def shutdown(self) -> None:
+        """Stop all daemons in the pool."""
+        for daemon in self.daemons:
+            daemon.shutdown()
@@ -8,10 +8,13 @@ from typing import Any, Dict
 from pydantic import BaseModel, RootModel
 
 
-def write_json_file(data: Dict[str, Any], file_path: str) -> None:
-    """Write a JSON file to the given path."""
+def write_json_file(data: Dict[str, Any], file_path: str, compact: bool = False) -> None:
+    """Write a JSON file to the given path, optionally without any whitespace."""
     with open(file_path, "w") as f:
-        dump(data, f, ensure_ascii=False, indent=4)
+        if compact:
+            dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        else:
+            dump(data, f, ensure_ascii=False, indent=4)
 
 
 def dump_files_to_directory(output_path: str, files: Dict[str, Any]) -> None:
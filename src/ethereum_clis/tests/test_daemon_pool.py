@@ -0,0 +1,105 @@
+"""Test the transition tool daemon pool."""
+
+import socket
+import subprocess
+import sys
+from pathlib import Path
+from typing import List
+
+import pytest
+from requests.exceptions import ConnectionError as RequestsConnectionError
+
+from ethereum_clis.daemon_pool import (
+    DaemonStartupError,
+    TransitionToolDaemon,
+    TransitionToolDaemonPool,
+    wait_for_unix_socket,
+)
+
+
+class FakeSession:
+    """Session that records posted URLs, optionally failing with a connection error."""
+
+    def __init__(self, fail: bool = False):
+        """Initialize the fake session."""
+        self.fail = fail
+        self.urls: List[str] = []
+
+    def post(self, url, json, timeout):
+        """Record the request."""
+        if self.fail:
+            raise RequestsConnectionError("connection refused")
+        self.urls.append(url)
+        return url
+
+    def close(self):
+        """Close the session."""
+        pass
+
+
+def fake_daemon(url: str, fail: bool = False) -> TransitionToolDaemon:
+    """Return a daemon object backed by a fake session."""
+    return TransitionToolDaemon(url=url, session=FakeSession(fail=fail))  # type: ignore
+
+
+def test_least_loaded_dispatch():
+    """Test that requests go to the daemon with the least requests in flight."""
+    daemons = [fake_daemon("http://a/"), fake_daemon("http://b/")]
+    pool = TransitionToolDaemonPool(daemons=daemons)
+    daemons[0].in_flight = 1
+    assert pool.post(data={}, timeout=1) == "http://b/"
+    daemons[0].in_flight = 0
+    daemons[1].in_flight = 2
+    assert pool.post(data={}, timeout=1, url_args={"arg": "--state-test"}) == (
+        "http://a/?arg=--state-test"
+    )
+    assert [d.in_flight for d in daemons] == [0, 2]
+
+
+def test_from_url():
+    """Test wrapping an externally managed server."""
+    pool = TransitionToolDaemonPool.from_url("http://localhost:1234/")
+    assert pool.url == "http://localhost:1234/"
+    assert pool.daemons[0].is_alive()
+
+
+def test_restart_crashed_daemon():
+    """Test that a daemon whose process has exited is replaced and the request retried."""
+    dead_process = subprocess.Popen([sys.executable, "-c", "pass"])
+    dead_process.wait()
+    started: List[TransitionToolDaemon] = [
+        TransitionToolDaemon(
+            url="http://crashed/",
+            process=dead_process,
+            session=FakeSession(fail=True),  # type: ignore
+        )
+    ]
+
+    def start_daemon() -> TransitionToolDaemon:
+        if started:
+            return started.pop()
+        return fake_daemon("http://restarted/")
+
+    pool = TransitionToolDaemonPool(start_daemon=start_daemon, size=1)
+    assert pool.url == "http://crashed/"
+    assert pool.post(data={}, timeout=1) == "http://restarted/"
+    assert pool.url == "http://restarted/"
+
+
+def test_wait_for_unix_socket(tmp_path: Path):
+    """Test the readiness handshake on a unix domain socket."""
+    socket_path = tmp_path / "t8n.sock"
+    process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    try:
+        with pytest.raises(DaemonStartupError, match="did not accept connections"):
+            wait_for_unix_socket(process, socket_path, timeout=0.05)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+            server.bind(str(socket_path))
+            server.listen()
+            wait_for_unix_socket(process, socket_path, timeout=1)
+    finally:
+        process.kill()
+        process.wait()
+
+    with pytest.raises(DaemonStartupError, match="exited"):
+        wait_for_unix_socket(process, tmp_path / "missing.sock", timeout=1)
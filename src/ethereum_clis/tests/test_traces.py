@@ -0,0 +1,56 @@
+"""Test the lazily loaded, filterable transition tool traces."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from ethereum_clis.traces import TraceFilter, TransactionTrace, parse_range
+
+STEPS = [
+    {"pc": 0, "op": 96, "opName": "PUSH1", "gas": "0x100", "depth": 1},
+    {"pc": 2, "op": 85, "opName": "SSTORE", "gas": "0xf0", "depth": 1},
+    {"pc": 0, "op": 84, "opName": "SLOAD", "gas": 80, "depth": 2},
+    {"output": "", "gasUsed": "0x20"},
+]
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [("1-2", (1, 2)), ("5-", (5, None)), ("-0x100", (None, 256)), ("3", (3, 3))],
+)
+def test_parse_range(value: str, expected):
+    """Test parsing inclusive ranges with optional bounds."""
+    assert parse_range(value) == expected
+
+
+def test_trace_filter_from_options():
+    """Test creating a trace filter from command line options."""
+    assert TraceFilter.from_options([]) is None
+    assert TraceFilter.from_options(["op=sstore, SLOAD", "depth=2-", "gas=-1000"]) == TraceFilter(
+        opcodes=frozenset({"SSTORE", "SLOAD"}), depth=(2, None), gas=(None, 1000)
+    )
+    with pytest.raises(ValueError, match="unknown trace filter key"):
+        TraceFilter.from_options(["pc=1"])
+    with pytest.raises(ValueError, match="expected 'key=value'"):
+        TraceFilter.from_options(["SSTORE"])
+
+
+@pytest.mark.parametrize(
+    "options,expected_steps",
+    [
+        ([], STEPS),
+        (["op=SSTORE,SLOAD"], STEPS[1:]),
+        (["depth=1"], STEPS[:2] + STEPS[3:]),
+        (["gas=0-0xf0"], STEPS[1:]),
+        (["op=SLOAD", "depth=1"], STEPS[3:]),
+    ],
+)
+def test_transaction_trace(tmp_path: Path, options, expected_steps):
+    """Test that a trace on disk is iterated lazily and filtered, keeping non-step lines."""
+    trace_path = tmp_path / "trace-0-0x00.jsonl"
+    trace_path.write_text("".join(json.dumps(step) + "\n" for step in STEPS))
+    trace = TransactionTrace(trace_path, trace_filter=TraceFilter.from_options(options))
+    assert list(trace) == expected_steps
+    # The trace can be iterated more than once.
+    assert list(trace) == expected_steps
@@ -1,11 +1,18 @@
 """Test the transition tool and subclasses."""
 
+import json
 import shutil
 import subprocess
+import sys
+import textwrap
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Type
+from typing import List, Type
 
 import pytest
+from requests import Response
+from requests.exceptions import HTTPError
 
 from ethereum_clis import (
     CLINotFoundInPathError,
@@ -15,6 +22,13 @@ from ethereum_clis import (
     NimbusTransitionTool,
     TransitionTool,
 )
+from ethereum_clis.daemon_pool import DaemonStartupError, TransitionToolDaemon
+from ethereum_clis.transition_tool_cache import TransitionToolCache
+from ethereum_clis.transition_tool_profile import TransitionToolProfile
+from ethereum_clis.transition_tool_session import TransitionToolSession
+from ethereum_test_base_types import Account, Address
+from ethereum_test_forks import Cancun
+from ethereum_test_types import Alloc, Environment
 
 
 def test_default_tool():
@@ -85,3 +99,272 @@ def test_unknown_binary_path():
     """
     with pytest.raises(CLINotFoundInPathError):
         TransitionTool.from_binary_path(binary_path=Path("unknown_binary_path"))
+
+
+FAKE_T8N_SCRIPT = """\
+import json, sys, time
+args = dict(zip(sys.argv[1::2], sys.argv[2::2]))
+with open(args["--log"], "a") as log:
+    log.write(f"start {time.monotonic()}\\n")
+time.sleep(0.2)
+with open(args["--input.alloc"]) as f:
+    alloc = json.load(f)
+zero = "0x" + "00" * 32
+result = {
+    "stateRoot": zero, "txRoot": zero, "receiptsRoot": zero, "logsHash": zero,
+    "logsBloom": "0x" + "00" * 256, "receipts": [], "gasUsed": "0x0",
+}
+basedir = args["--output.basedir"]
+for name, contents in (("--output.alloc", alloc), ("--output.result", result)):
+    with open(f"{basedir}/{args[name]}", "w") as f:
+        json.dump(contents, f)
+with open(args["--log"], "a") as log:
+    log.write(f"end {time.monotonic()}\\n")
+"""
+
+
+@pytest.fixture
+def fake_evmone_t8n(tmp_path: Path) -> Path:
+    """Return the path to a fake `evmone-t8n` that logs when each evaluation starts and ends."""
+    binary_path = tmp_path / "evmone-t8n"
+    binary_path.write_text(
+        f'#!/bin/sh\nexec {sys.executable} {tmp_path / "fake_t8n.py"} "$@" '
+        f"--log {tmp_path / 't8n.log'}\n"
+    )
+    binary_path.chmod(0o755)
+    (tmp_path / "fake_t8n.py").write_text(textwrap.dedent(FAKE_T8N_SCRIPT))
+    return binary_path
+
+
+def transition_tool_data(alloc: Alloc) -> TransitionTool.TransitionToolData:
+    """Return the data of a transition without transactions on top of the given alloc."""
+    return TransitionTool.TransitionToolData(
+        alloc=alloc,
+        txs=[],
+        env=Environment(),
+        fork=Cancun,
+        chain_id=1,
+        reward=0,
+        blob_schedule=None,
+    )
+
+
+def test_evaluate_runs_subprocesses_concurrently(fake_evmone_t8n: Path):
+    """Test that concurrent evaluations run concurrently, bounded by the tool's limit."""
+    t8n = EvmOneTransitionTool(binary=fake_evmone_t8n)
+    t8n.max_concurrent_evaluations = 2
+    allocs = [Alloc({Address(i + 1): Account(balance=i)}) for i in range(4)]
+    with ThreadPoolExecutor(max_workers=len(allocs)) as executor:
+        outputs = executor.map(
+            lambda alloc: t8n.evaluate(transition_tool_data=transition_tool_data(alloc)), allocs
+        )
+        assert [output.alloc for output in outputs] == allocs
+    t8n.shutdown()
+
+    in_flight = max_in_flight = 0
+    log_path = fake_evmone_t8n.parent / "t8n.log"
+    events = sorted(
+        (float(timestamp), event == "start")
+        for event, timestamp in (line.split() for line in log_path.read_text().splitlines())
+    )
+    for _, is_start in events:
+        in_flight += 1 if is_start else -1
+        max_in_flight = max(max_in_flight, in_flight)
+    assert max_in_flight == 2
+
+
+def test_evaluate_profile(fake_evmone_t8n: Path):
+    """Test that the phases of each evaluation are recorded per test, module and fork."""
+    t8n = EvmOneTransitionTool(binary=fake_evmone_t8n)
+    t8n.profile = TransitionToolProfile()
+    t8n.profile_test_id = "tests/test_module.py::test_function[fork_Cancun]"
+    alloc = Alloc({Address(1): Account(balance=1)})
+    t8n.evaluate(transition_tool_data=transition_tool_data(alloc))
+    t8n.evaluate(transition_tool_data=transition_tool_data(alloc))
+
+    total = t8n.profile.total
+    assert total.evaluations == 2
+    assert total.bytes_sent > 0 and total.bytes_received > 0
+    assert set(total.phases) == {
+        "request_dump",
+        "ipc",
+        "tool_exit",
+        "json_decode",
+        "model_validate",
+    }
+    assert total.phases["ipc"] >= 0.4
+    assert total.wall_time >= sum(total.phases.values())
+    assert t8n.profile.tests[t8n.profile_test_id] == total
+    assert t8n.profile.modules["tests/test_module.py"] == total
+    assert t8n.profile.forks["Cancun"] == total
+
+    merged = TransitionToolProfile()
+    merged.merge(t8n.profile)
+    merged.merge(t8n.profile)
+    assert merged.total.evaluations == 4
+    assert merged.forks["Cancun"].bytes_sent == 2 * total.bytes_sent
+
+
+def test_evaluate_scratch_dir(fake_evmone_t8n: Path, tmp_path: Path):
+    """Test that filesystem evaluations reuse a scratch directory tree with compact JSON."""
+    scratch_dir = tmp_path / "scratch"
+    t8n = EvmOneTransitionTool(binary=fake_evmone_t8n)
+    t8n.scratch_dir = scratch_dir
+    for i in range(3):
+        alloc = Alloc({Address(1): Account(balance=i)})
+        assert t8n.evaluate(transition_tool_data=transition_tool_data(alloc)).alloc == alloc
+
+    work_dirs = list(scratch_dir.glob("*/*"))
+    assert len(work_dirs) == 1
+    alloc_input = (work_dirs[0] / "input" / "alloc.json").read_text()
+    assert " " not in alloc_input and "\n" not in alloc_input
+
+    t8n.shutdown()
+    assert list(scratch_dir.iterdir()) == []
+
+    # The tool can be used again after shutdown, with a new scratch directory tree.
+    alloc = Alloc({Address(1): Account(balance=3)})
+    assert t8n.evaluate(transition_tool_data=transition_tool_data(alloc)).alloc == alloc
+    assert len(list(scratch_dir.glob("*/*"))) == 1
+    t8n.shutdown()
+
+
+def test_start_server_managed_pool(fake_evmone_t8n: Path, monkeypatch):
+    """Test that the pool started by the tool is tracked apart from an external server URL."""
+    t8n = EvmOneTransitionTool(binary=fake_evmone_t8n)
+    t8n.t8n_use_server = True
+    with pytest.raises(DaemonStartupError):
+        t8n.start_server()
+
+    started: List[TransitionToolDaemon] = []
+
+    def start_daemon() -> TransitionToolDaemon:
+        started.append(TransitionToolDaemon(url=f"http://localhost:{len(started) + 1}/"))
+        return started[-1]
+
+    t8n.supports_daemon = True
+    monkeypatch.setattr(t8n, "start_daemon", start_daemon)
+    t8n.start_server()
+    t8n.start_server()
+    assert len(started) == 1
+    assert t8n.managed_server_url == "http://localhost:1/"
+    assert t8n.server_url is None
+
+    t8n.shutdown()
+    assert t8n.managed_server_url is None
+    assert t8n.ensure_server().url == "http://localhost:2/"
+    t8n.shutdown()
+
+    t8n.server_url = "http://localhost:8080/"
+    assert t8n.ensure_server().url == t8n.server_url
+    assert t8n.managed_server_url is None
+    assert len(started) == 2
+    t8n.shutdown()
+
+
+class FakeDaemonPool:
+    """Daemon pool of a server that is never reached."""
+
+    def select(self):
+        """Return no daemon."""
+        return None
+
+
+def http_error(status_code: int) -> HTTPError:
+    """Return the error raised for a t8n-server response with the given status code."""
+    response = Response()
+    response.status_code = status_code
+    return HTTPError(response=response)
+
+
+def test_evaluate_server_info_metadata_per_thread(
+    fake_evmone_t8n: Path, monkeypatch, tmp_path: Path
+):
+    """Test that concurrent server evaluations each keep and cache their own `_info` metadata."""
+    t8n = EvmOneTransitionTool(binary=fake_evmone_t8n)
+    t8n.t8n_use_server = True
+    result_cache = TransitionToolCache(tmp_path / "cache")
+    t8n.result_cache = result_cache
+    allocs = [Alloc({Address(i + 1): Account(balance=i)}) for i in range(4)]
+    # Every evaluation sets its metadata before any of them stores its result in the cache.
+    barrier = threading.Barrier(len(allocs))
+    validate_output = t8n._validate_output
+    zero = "0x" + "00" * 32
+
+    def server_post(*, data, **kwargs):
+        response = Response()
+        response.status_code = 200
+        response._content = json.dumps(
+            {
+                "alloc": data["input"]["alloc"],
+                "result": {
+                    "stateRoot": zero,
+                    "txRoot": zero,
+                    "receiptsRoot": zero,
+                    "logsHash": zero,
+                    "logsBloom": "0x" + "00" * 256,
+                    "receipts": [],
+                    "gasUsed": "0x0",
+                },
+                "_info_metadata": {"alloc": data["input"]["alloc"]},
+            }
+        ).encode()
+        return response
+
+    def synchronized_validate_output(raw_output):
+        barrier.wait(timeout=10)
+        return validate_output(raw_output)
+
+    monkeypatch.setattr(t8n, "tool_identity", lambda: "t8n")
+    monkeypatch.setattr(t8n, "_server_post", server_post)
+    monkeypatch.setattr(t8n, "_validate_output", synchronized_validate_output)
+
+    def evaluate(alloc: Alloc):
+        data = transition_tool_data(alloc)
+        t8n.evaluate(transition_tool_data=data)
+        cache_key = TransitionToolCache.key(
+            tool_identity="t8n", request=data.get_request_data(), state_test=False
+        )
+        return t8n._info_metadata, result_cache.get(cache_key)
+
+    with ThreadPoolExecutor(max_workers=len(allocs)) as executor:
+        results = list(executor.map(evaluate, allocs))
+    for alloc, (info_metadata, cached_entry) in zip(allocs, results, strict=True):
+        expected = {"alloc": alloc.model_dump(mode="json", by_alias=True, exclude_none=True)}
+        assert info_metadata == expected
+        assert cached_entry is not None
+        assert cached_entry["info_metadata"] == expected
+
+
+@pytest.mark.parametrize(
+    "status_code,falls_back",
+    [
+        pytest.param(500, False, id="evaluation_error"),
+        pytest.param(501, True, id="sessions_unsupported"),
+    ],
+)
+def test_evaluate_server_session_errors(
+    fake_evmone_t8n: Path, monkeypatch, status_code: int, falls_back: bool
+):
+    """Test that only session errors make the tool stop using sessions."""
+    t8n = EvmOneTransitionTool(binary=fake_evmone_t8n)
+    t8n.t8n_use_session = True
+    fallback_output = object()
+
+    def server_post(**kwargs):
+        raise http_error(status_code)
+
+    monkeypatch.setattr(t8n, "ensure_server", lambda: FakeDaemonPool())
+    monkeypatch.setattr(t8n, "_server_post", server_post)
+    monkeypatch.setattr(t8n, "_evaluate_server", lambda **kwargs: fallback_output)
+    session = TransitionToolSession()
+    data = transition_tool_data(Alloc({Address(1): Account(balance=1)}))
+    if falls_back:
+        output = t8n._evaluate_server_session(t8n_data=data, session=session, timeout=1)
+        assert output is fallback_output
+        assert not t8n.t8n_use_session
+    else:
+        with pytest.raises(HTTPError):
+            t8n._evaluate_server_session(t8n_data=data, session=session, timeout=1)
+        assert t8n.t8n_use_session
+    assert not session.is_open
@@ -0,0 +1,100 @@
+"""Test the transition tool result cache."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from ethereum_clis.clis.execution_specs import eels_resolutions_pinned
+from ethereum_clis.transition_tool_cache import TransitionToolCache
+from ethereum_clis.types import (
+    TransitionToolContext,
+    TransitionToolInput,
+    TransitionToolRequest,
+)
+from ethereum_test_types import Alloc, Environment
+
+
+def make_request(*, fork: str = "Cancun", chain_id: int = 1) -> TransitionToolRequest:
+    """Create a minimal transition tool request."""
+    return TransitionToolRequest(
+        state=TransitionToolContext(fork=fork, chain_id=chain_id, reward=0, blob_schedule=None),
+        input=TransitionToolInput(alloc=Alloc(), txs=[], env=Environment()),
+    )
+
+
+def test_key_depends_on_request_and_tool():
+    """Test that every part of the request and the tool identity affect the key."""
+    key = TransitionToolCache.key(tool_identity="t8n", request=make_request(), state_test=False)
+    assert key == TransitionToolCache.key(
+        tool_identity="t8n", request=make_request(), state_test=False
+    )
+    assert key != TransitionToolCache.key(
+        tool_identity="t8n-2", request=make_request(), state_test=False
+    )
+    assert key != TransitionToolCache.key(
+        tool_identity="t8n", request=make_request(), state_test=True
+    )
+    assert key != TransitionToolCache.key(
+        tool_identity="t8n", request=make_request(fork="Prague"), state_test=False
+    )
+    assert key != TransitionToolCache.key(
+        tool_identity="t8n", request=make_request(chain_id=2), state_test=False
+    )
+
+
+def test_get_put(tmp_path: Path):
+    """Test storing and retrieving an entry."""
+    cache = TransitionToolCache(tmp_path)
+    assert cache.get("00" * 32) is None
+    cache.put("00" * 32, {"alloc": {}}, {"client": "t8n"})
+    assert cache.get("00" * 32) == {"output": {"alloc": {}}, "info_metadata": {"client": "t8n"}}
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # A second instance sharing the same directory sees the entry.
+    assert TransitionToolCache(tmp_path).get("00" * 32) is not None
+
+
+@pytest.mark.parametrize("max_size", [1, 2048])
+def test_eviction(tmp_path: Path, max_size: int):
+    """Test that the least recently used entries are evicted once the size limit is exceeded."""
+    cache = TransitionToolCache(tmp_path, max_size=max_size)
+    keys = [f"{i:02x}" * 32 for i in range(10)]
+    for i, key in enumerate(keys):
+        cache.put(key, {"data": "x" * 100}, None)
+        entry_path = tmp_path / key[:2] / f"{key}.json"
+        if entry_path.exists():
+            os.utime(entry_path, (i, i))
+
+    remaining = [key for key in keys if (tmp_path / key[:2] / f"{key}.json").exists()]
+    total_size = sum(entry.stat().st_size for entry in tmp_path.glob("*/*.json"))
+    assert total_size <= max_size
+    # Only the most recently written entries survive.
+    assert remaining == keys[len(keys) - len(remaining) :]
+
+
+@pytest.mark.parametrize(
+    "eels_resolutions,pinned",
+    [
+        pytest.param(
+            [
+                '{"Prague": {"git_url": "u", "branch": "b", "commit": "c"}, '
+                '"Osaka": {"same_as": "Prague"}}'
+            ],
+            True,
+            id="commit_and_same_as",
+        ),
+        pytest.param(['{"Prague": {"path": "/eels"}}'], False, id="path"),
+        pytest.param(['{"Prague": {"git_url": "u", "branch": "b"}}'], False, id="branch"),
+        pytest.param(
+            ['{"Prague": {"git_url": "u", "commit": "c"}}', '{"Osaka": {"path": "/eels"}}'],
+            False,
+            id="one_of_many",
+        ),
+        pytest.param(["{"], False, id="malformed"),
+        pytest.param([], False, id="resolver_defaults"),
+    ],
+)
+def test_eels_resolutions_pinned(eels_resolutions: list[str], pinned: bool):
+    """Test that the EELS resolver results are only cached if every fork is pinned to a commit."""
+    assert eels_resolutions_pinned(eels_resolutions) == pinned
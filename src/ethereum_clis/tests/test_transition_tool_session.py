@@ -0,0 +1,46 @@
+"""Test the state tracking of transition tool sessions."""
+
+from ethereum_clis.transition_tool_session import TransitionToolSession
+from ethereum_test_base_types import Account, Address
+from ethereum_test_types import Alloc
+
+ADDRESS_1 = Address(0x1000)
+ADDRESS_2 = Address(0x2000)
+ADDRESS_3 = Address(0x3000)
+
+
+def test_apply_touched_accounts():
+    """Test reconstructing the full post-state from the touched accounts."""
+    session = TransitionToolSession()
+    base = Alloc({ADDRESS_1: Account(balance=1), ADDRESS_2: Account(balance=2)})
+    touched = Alloc({ADDRESS_2: Account(balance=3), ADDRESS_3: Account(nonce=1)})
+    post = session.apply(base, touched, deleted=[ADDRESS_1])
+    assert isinstance(post, Alloc)
+    assert post == Alloc({ADDRESS_2: Account(balance=3), ADDRESS_3: Account(nonce=1)})
+    # The base state is not modified.
+    assert base == Alloc({ADDRESS_1: Account(balance=1), ADDRESS_2: Account(balance=2)})
+
+
+def test_diff():
+    """Test computing the difference between the server-side state and the next state."""
+    session = TransitionToolSession()
+    assert not session.is_open
+
+    server_alloc = Alloc({ADDRESS_1: Account(balance=1), ADDRESS_2: Account(balance=2)})
+    session.id = "session"
+    session.server_alloc = server_alloc
+    assert session.is_open
+
+    # Continuing from the post-state of the previous block.
+    assert session.diff(server_alloc) == (Alloc(), [])
+
+    # Continuing from a different state, e.g. after an invalid block.
+    updated, deleted = session.diff(
+        Alloc({ADDRESS_2: Account(balance=2), ADDRESS_3: Account(balance=3)})
+    )
+    assert updated == Alloc({ADDRESS_3: Account(balance=3)})
+    assert deleted == [ADDRESS_1]
+
+    session.reset()
+    assert not session.is_open
+    assert session.server_alloc is None
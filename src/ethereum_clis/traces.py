@@ -0,0 +1,101 @@
+"""Lazily loaded, filterable execution traces produced by the transition tools."""
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Tuple
+
+
+def parse_range(value: str) -> Tuple[int | None, int | None]:
+    """
+    Parse an inclusive `min-max` range where either bound can be omitted (e.g. `2-`, `-100`).
+
+    A single number is a range that only contains that number.
+    """
+    if "-" not in value:
+        number = int(value, 0)
+        return number, number
+    lower, upper = value.split("-", 1)
+    return (int(lower, 0) if lower else None, int(upper, 0) if upper else None)
+
+
+def _in_range(value: Any, bounds: Tuple[int | None, int | None] | None) -> bool:
+    if bounds is None:
+        return True
+    if isinstance(value, str):
+        value = int(value, 0)
+    lower, upper = bounds
+    return (lower is None or value >= lower) and (upper is None or value <= upper)
+
+
+@dataclass(frozen=True, kw_only=True)
+class TraceFilter:
+    """
+    Filter of the execution steps of a trace by opcode name, call depth and remaining gas.
+
+    Lines that are not execution steps (e.g. the final summary line of a transaction trace) are
+    never filtered out.
+    """
+
+    opcodes: FrozenSet[str] | None = None
+    depth: Tuple[int | None, int | None] | None = None
+    gas: Tuple[int | None, int | None] | None = None
+
+    @classmethod
+    def from_options(cls, options: List[str]) -> Optional["TraceFilter"]:
+        """
+        Create a filter from a list of `key=value` options, or return None if the list is empty.
+
+        Supported keys are `op` (comma separated opcode names), `depth` and `gas` (ranges in
+        `min-max` format where either bound can be omitted).
+        """
+        if not options:
+            return None
+        kwargs: Dict[str, Any] = {}
+        for option in options:
+            key, sep, value = option.partition("=")
+            if not sep:
+                raise ValueError(f"invalid trace filter '{option}', expected 'key=value'")
+            key = key.strip().lower()
+            if key in ("op", "opcode"):
+                kwargs["opcodes"] = frozenset(op.strip().upper() for op in value.split(","))
+            elif key == "depth":
+                kwargs["depth"] = parse_range(value)
+            elif key == "gas":
+                kwargs["gas"] = parse_range(value)
+            else:
+                raise ValueError(f"unknown trace filter key '{key}', expected op, depth or gas")
+        return cls(**kwargs)
+
+    def matches(self, step: Dict[str, Any]) -> bool:
+        """Return whether the trace line passes the filter."""
+        if "pc" not in step:
+            return True
+        if self.opcodes is not None and step.get("opName") not in self.opcodes:
+            return False
+        return _in_range(step.get("depth", 0), self.depth) and _in_range(
+            step.get("gas", 0), self.gas
+        )
+
+
+@dataclass(frozen=True)
+class TransactionTrace:
+    """
+    Trace of a single transaction, kept on disk as a JSON-lines file.
+
+    Iterating over the trace reads the file one line at a time, so that traces with millions of
+    steps are never fully loaded into memory.
+    """
+
+    path: Path
+    trace_filter: TraceFilter | None = None
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Yield the trace lines that pass the filter."""
+        with open(self.path, "r") as trace_file:
+            for line in trace_file:
+                if not line.strip():
+                    continue
+                step = json.loads(line)
+                if self.trace_filter is None or self.trace_filter.matches(step):
+                    yield step
@@ -6,16 +6,17 @@ import shutil
 import subprocess
 import tempfile
 import textwrap
+import threading
 import time
 from abc import abstractmethod
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Any, Dict, List, LiteralString, Mapping, Optional, Type
-from urllib.parse import urlencode
+from typing import Any, Dict, Generator, List, LiteralString, Mapping, Optional, Type
 
 from requests import Response
-from requests.exceptions import ConnectionError as RequestsConnectionError
-from requests_unixsocket import Session  # type: ignore
+from requests.exceptions import HTTPError
 
 from ethereum_test_base_types import BlobSchedule
 from ethereum_test_exceptions import ExceptionMapper
@@ -23,8 +24,18 @@ from ethereum_test_forks import Fork
 from ethereum_test_forks.helpers import get_development_forks, get_forks
 from ethereum_test_types import Alloc, Environment, Transaction
 
+from .daemon_pool import DaemonStartupError, TransitionToolDaemon, TransitionToolDaemonPool
 from .ethereum_cli import EthereumCLI
 from .file_utils import dump_files_to_directory, write_json_file
+from .traces import TraceFilter, TransactionTrace
+from .transition_tool_cache import TransitionToolCache
+from .transition_tool_profile import TransitionToolProfile, TransitionToolProfileEntry
+from .transition_tool_session import (
+    SESSION_UNKNOWN_STATUS,
+    SESSION_UNSUPPORTED_STATUS,
+    TransitionToolSession,
+    TransitionToolSessionError,
+)
 from .types import (
     TransactionReceipt,
     TransitionToolContext,
@@ -39,6 +50,7 @@ model_dump_config: Mapping = {"by_alias": True, "exclude_none": True}
 # https://github.com/ethereum/execution-spec-tests/issues/1894
 NORMAL_SERVER_TIMEOUT = 180
 SLOW_REQUEST_TIMEOUT = 180
+DEFAULT_MAX_CONCURRENT_EVALUATIONS = 4
 
 
 def get_valid_transition_tool_names() -> set[str]:
@@ -53,7 +65,8 @@ class TransitionTool(EthereumCLI):
     implementations.
     """
 
-    traces: List[List[List[Dict]]] | None = None
+    traces: List[List[TransactionTrace]] | None = None
+    trace_filter: Optional[TraceFilter] = None
 
     registered_tools: List[Type["TransitionTool"]] = []
     default_tool: Optional[Type["TransitionTool"]] = None
@@ -62,10 +75,20 @@ class TransitionTool(EthereumCLI):
 
     subcommand: Optional[str] = None
     cached_version: Optional[str] = None
+    cached_identity: Optional[str] = None
+    result_cache: Optional[TransitionToolCache] = None
+    profile: Optional[TransitionToolProfile] = None
+    profile_test_id: Optional[str] = None
     t8n_use_stream: bool = False
     t8n_use_server: bool = False
+    t8n_use_session: bool = False
+    supports_daemon: bool = False
     server_url: str | None = None
-    process: Optional[subprocess.Popen] = None
+    managed_server_url: str | None = None
+    daemon_count: int = 1
+    daemon_pool: Optional[TransitionToolDaemonPool] = None
+    max_concurrent_evaluations: int = DEFAULT_MAX_CONCURRENT_EVALUATIONS
+    scratch_dir: Optional[Path] = None
 
     @abstractmethod
     def __init__(
@@ -80,7 +103,11 @@ class TransitionTool(EthereumCLI):
         self.exception_mapper = exception_mapper
         super().__init__(binary=binary)
         self.trace = trace
-        self._info_metadata: Optional[Dict[str, Any]] = {}
+        self._thread_local = threading.local()
+        self._lock = threading.Lock()
+        self._subprocess_semaphore: Optional[threading.BoundedSemaphore] = None
+        self._scratch_base: Optional[Path] = None
+        self._trace_store: Optional[tempfile.TemporaryDirectory] = None
 
     def __init_subclass__(cls):
         """Register all subclasses of TransitionTool as possible tools."""
@@ -91,29 +118,136 @@ class TransitionTool(EthereumCLI):
         """Return True if the fork is supported by the tool."""
         pass
 
+    def start_daemon(self) -> TransitionToolDaemon:
+        """
+        Start a single t8n-server process and wait until it is ready to accept requests.
+
+        Only called for tools that set `supports_daemon`, which must override this method.
+        """
+        raise DaemonStartupError(f"{self.__class__.__name__} does not support server mode")
+
     def start_server(self):
         """
-        Start the t8n-server process, extract the port, and leave it running
+        Start a pool of `daemon_count` t8n-server processes and leave them running
         for future reuse.
+
+        If the tool was given a `server_url`, the externally managed server is used instead. The
+        URL of a pool started by the tool is kept in `managed_server_url`. Calling this method
+        while the pool is running has no effect.
         """
-        pass
+        if not self.t8n_use_server or self.daemon_pool is not None:
+            return
+        if self.server_url is not None:
+            self.daemon_pool = TransitionToolDaemonPool.from_url(self.server_url)
+            return
+        if not self.supports_daemon:
+            raise DaemonStartupError(
+                f"{self.__class__.__name__} does not support server mode, "
+                "an external t8n-server URL is required"
+            )
+        self.daemon_pool = TransitionToolDaemonPool(
+            start_daemon=self.start_daemon, size=self.daemon_count
+        )
+        self.managed_server_url = self.daemon_pool.url
+
+    def ensure_server(self) -> TransitionToolDaemonPool:
+        """Start the t8n-server pool if it is not running yet and return it."""
+        with self._lock:
+            if self.daemon_pool is None:
+                self.start_server()
+        assert self.daemon_pool is not None
+        return self.daemon_pool
+
+    @property
+    def _info_metadata(self) -> Optional[Dict[str, Any]]:
+        """
+        Return the `_info` metadata of the last transition evaluated by the current thread.
+
+        Kept per thread so that concurrent evaluations do not see each other's metadata.
+        """
+        return getattr(self._thread_local, "info_metadata", {})
+
+    @_info_metadata.setter
+    def _info_metadata(self, info_metadata: Optional[Dict[str, Any]]):
+        self._thread_local.info_metadata = info_metadata
 
     def shutdown(self):
         """Perform any cleanup tasks related to the tested tool."""
-        pass
+        if self._scratch_base is not None:
+            shutil.rmtree(self._scratch_base, ignore_errors=True)
+            self._scratch_base = None
+        # Drop the scratch directories cached by every thread along with the removed tree.
+        self._thread_local = threading.local()
+        self.reset_traces()
+        if self._trace_store is not None:
+            self._trace_store.cleanup()
+            self._trace_store = None
+        if self.daemon_pool is not None:
+            self.daemon_pool.shutdown()
+            self.daemon_pool = None
+            self.managed_server_url = None
+
+    @contextmanager
+    def session(self) -> Generator[TransitionToolSession, None, None]:
+        """
+        Provide a session to be attached to the `TransitionToolData` of consecutive blocks.
+
+        The session is only used if the tool runs in server mode and `t8n_use_session` is
+        enabled; otherwise every request of the session is sent in full.
+        """
+        session = TransitionToolSession()
+        try:
+            yield session
+        finally:
+            if session.is_open and self.daemon_pool is not None:
+                try:
+                    self.daemon_pool.post(
+                        data={"session": {"id": session.id, "close": True}},
+                        timeout=NORMAL_SERVER_TIMEOUT,
+                        daemon=session.daemon,
+                        retries=1,
+                    )
+                except Exception:
+                    pass  # the server releases the session state on its own
+                session.reset()
+
+    def tool_identity(self) -> str | None:
+        """
+        Return a string that uniquely identifies the tool build being used, or None if the build
+        cannot be pinned, in which case its results are not cached.
+
+        Used as part of the result cache key, so that results are invalidated whenever the tool
+        binary changes.
+        """
+        if self.cached_identity is None:
+            binary_stat = self.binary.stat()
+            self.cached_identity = (
+                f"{self.__class__.__name__}:{self.binary}:{binary_stat.st_size}:"
+                f"{binary_stat.st_mtime_ns}:{self.version()}"
+            )
+        return self.cached_identity
 
     def reset_traces(self):
         """Reset the internal trace storage for a new test to begin."""
+        if self.traces is not None:
+            for block_traces in self.traces:
+                for tx_trace in block_traces:
+                    tx_trace.path.unlink(missing_ok=True)
         self.traces = None
 
-    def append_traces(self, new_traces: List[List[Dict]]):
+    def append_traces(self, new_traces: List[TransactionTrace]):
         """Append a list of traces of a state transition to the current list."""
         if self.traces is None:
             self.traces = []
         self.traces.append(new_traces)
 
-    def get_traces(self) -> List[List[List[Dict]]] | None:
-        """Return the accumulated traces."""
+    def get_traces(self) -> List[List[TransactionTrace]] | None:
+        """
+        Return the accumulated traces.
+
+        Each transaction trace is read lazily from disk when iterated, and only yields the
+        steps that pass the configured `trace_filter`.
+        """
         return self.traces
 
     def collect_traces(
@@ -122,8 +256,16 @@ class TransitionTool(EthereumCLI):
         temp_dir: tempfile.TemporaryDirectory,
         debug_output_path: str = "",
     ) -> None:
-        """Collect the traces from the t8n tool output and store them in the traces list."""
-        traces: List[List[Dict]] = []
+        """
+        Collect the traces from the t8n tool output and store them in the traces list.
+
+        The trace files are moved to a trace store owned by the tool, where they remain until
+        the traces are reset, instead of being loaded into memory.
+        """
+        if self._trace_store is None:
+            self._trace_store = tempfile.TemporaryDirectory(prefix="t8n-traces-")
+        block_number = len(self.traces) if self.traces is not None else 0
+        traces: List[TransactionTrace] = []
         for i, r in enumerate(receipts):
             trace_file_name = f"trace-{i}-{r.transaction_hash}.jsonl"
             if debug_output_path:
@@ -131,11 +273,9 @@ class TransitionTool(EthereumCLI):
                     os.path.join(temp_dir.name, trace_file_name),
                     os.path.join(debug_output_path, trace_file_name),
                 )
-            with open(os.path.join(temp_dir.name, trace_file_name), "r") as trace_file:
-                tx_traces: List[Dict] = []
-                for trace_line in trace_file.readlines():
-                    tx_traces.append(json.loads(trace_line))
-                traces.append(tx_traces)
+            trace_path = Path(self._trace_store.name) / f"block-{block_number}-{trace_file_name}"
+            shutil.move(os.path.join(temp_dir.name, trace_file_name), trace_path)
+            traces.append(TransactionTrace(trace_path, trace_filter=self.trace_filter))
         self.append_traces(traces)
 
     @dataclass
@@ -150,6 +290,7 @@ class TransitionTool(EthereumCLI):
         reward: int
         blob_schedule: BlobSchedule | None
         state_test: bool = False
+        session: TransitionToolSession | None = None
 
         @property
         def fork_name(self) -> str:
@@ -184,29 +325,155 @@ class TransitionTool(EthereumCLI):
                 input=self.to_input(),
             )
 
+    @contextmanager
+    def _profile_phase(self, phase: str) -> Generator[None, None, None]:
+        """Time a phase of the current evaluation, if profiling is enabled."""
+        entry: TransitionToolProfileEntry | None = getattr(
+            self._thread_local, "profile_entry", None
+        )
+        if entry is None:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            entry.add_phase(phase, time.perf_counter() - start)
+
+    def _run_subprocess(
+        self, args: List[str], stdin: bytes | None = None
+    ) -> subprocess.CompletedProcess[bytes]:
+        """
+        Run the tool in a subprocess, bounded by the subprocess semaphore, and return its result.
+
+        If profiling, the exchange with the tool, until it closes its output streams, is timed as
+        the `ipc` phase and the wait for the process to exit as the `tool_exit` phase.
+        """
+        with self._get_subprocess_semaphore():
+            if getattr(self._thread_local, "profile_entry", None) is None:
+                return subprocess.run(
+                    args, input=stdin, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+                )
+            with self._profile_phase("ipc"):
+                process = subprocess.Popen(
+                    args,
+                    stdin=subprocess.PIPE if stdin is not None else None,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                )
+                assert process.stdout is not None and process.stderr is not None
+                # Read stderr and write stdin in threads, so that no pipe fills up and blocks.
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    stderr = executor.submit(process.stderr.read)
+                    if stdin is not None:
+                        executor.submit(self._write_stdin, process, stdin)
+                    stdout = process.stdout.read()
+                process.stdout.close()
+                process.stderr.close()
+            with self._profile_phase("tool_exit"):
+                returncode = process.wait()
+        return subprocess.CompletedProcess(args, returncode, stdout, stderr.result())
+
+    @staticmethod
+    def _write_stdin(process: subprocess.Popen, stdin: bytes) -> None:
+        """Write the input of a tool subprocess and close its stdin."""
+        assert process.stdin is not None
+        with process.stdin:
+            try:
+                process.stdin.write(stdin)
+            except BrokenPipeError:
+                pass  # the tool exited without reading all of its input
+
+    def _profile_traffic(self, *, sent: int = 0, received: int = 0) -> None:
+        """Count the bytes exchanged with the tool in the current evaluation, if profiling."""
+        entry: TransitionToolProfileEntry | None = getattr(
+            self._thread_local, "profile_entry", None
+        )
+        if entry is not None:
+            entry.bytes_sent += sent
+            entry.bytes_received += received
+
+    def _validate_output(self, raw_output: Dict[str, Any] | bytes) -> TransitionToolOutput:
+        """Validate the raw output of the tool and keep it in case it needs to be cached."""
+        self._thread_local.raw_output = raw_output
+        if isinstance(raw_output, bytes):
+            self._profile_traffic(received=len(raw_output))
+            if self.profile is None:
+                return TransitionToolOutput.model_validate_json(
+                    raw_output, context={"exception_mapper": self.exception_mapper}
+                )
+            # Decode separately to time both phases.
+            with self._profile_phase("json_decode"):
+                raw_output = json.loads(raw_output)
+        with self._profile_phase("model_validate"):
+            return TransitionToolOutput.model_validate(
+                raw_output, context={"exception_mapper": self.exception_mapper}
+            )
+
+    def _get_scratch_work_dir(self) -> str:
+        """
+        Return the scratch directory tree of the current thread, creating it on first use.
+
+        The tree lives under `scratch_dir` (ideally a tmpfs such as `/dev/shm`) and is reused by
+        every evaluation of the thread, so no directories are created or removed per call.
+        """
+        assert self.scratch_dir is not None
+        work_dir: str | None = getattr(self._thread_local, "scratch_work_dir", None)
+        if work_dir is None:
+            with self._lock:
+                if self._scratch_base is None:
+                    self.scratch_dir.mkdir(parents=True, exist_ok=True)
+                    self._scratch_base = Path(
+                        tempfile.mkdtemp(prefix=f"t8n-{os.getpid()}-", dir=self.scratch_dir)
+                    )
+            work_dir = tempfile.mkdtemp(dir=self._scratch_base)
+            os.mkdir(os.path.join(work_dir, "input"))
+            os.mkdir(os.path.join(work_dir, "output"))
+            self._thread_local.scratch_work_dir = work_dir
+        return work_dir
+
     def _evaluate_filesystem(
         self,
         *,
         t8n_data: TransitionToolData,
         debug_output_path: str = "",
     ) -> TransitionToolOutput:
-        """Execute a transition tool using the filesystem for its inputs and outputs."""
-        temp_dir = tempfile.TemporaryDirectory()
-        os.mkdir(os.path.join(temp_dir.name, "input"))
-        os.mkdir(os.path.join(temp_dir.name, "output"))
-
-        input_contents = t8n_data.to_input().model_dump(mode="json", **model_dump_config)
+        """
+        Execute a transition tool using the filesystem for its inputs and outputs.
 
-        input_paths = {
-            k: os.path.join(temp_dir.name, "input", f"{k}.json") for k in input_contents.keys()
-        }
-        for key, file_path in input_paths.items():
-            write_json_file(input_contents[key], file_path)
+        If a `scratch_dir` is configured, the inputs and outputs are written as compact JSON to
+        a directory tree that is reused across calls, unless traces or debug output are
+        requested, which use a fresh temporary directory.
+        """
+        temp_dir: tempfile.TemporaryDirectory | None = None
+        use_scratch = self.scratch_dir is not None and not self.trace and not debug_output_path
+        if use_scratch:
+            work_dir = self._get_scratch_work_dir()
+        else:
+            temp_dir = tempfile.TemporaryDirectory()
+            work_dir = temp_dir.name
+            os.mkdir(os.path.join(work_dir, "input"))
+            os.mkdir(os.path.join(work_dir, "output"))
+
+        with self._profile_phase("request_dump"):
+            input_contents = t8n_data.to_input().model_dump(mode="json", **model_dump_config)
+
+            input_paths = {
+                k: os.path.join(work_dir, "input", f"{k}.json") for k in input_contents.keys()
+            }
+            for key, file_path in input_paths.items():
+                write_json_file(input_contents[key], file_path, compact=use_scratch)
+                self._profile_traffic(sent=os.path.getsize(file_path))
 
         output_paths = {
             output: os.path.join("output", f"{output}.json") for output in ["alloc", "result"]
         }
         output_paths["body"] = os.path.join("output", "txs.rlp")
+        if use_scratch:
+            # Outputs of the previous call must not be mistaken for outputs of this one.
+            for file_path in output_paths.values():
+                with suppress(FileNotFoundError):
+                    os.unlink(os.path.join(work_dir, file_path))
 
         # Construct args for evmone-t8n binary
         args = [
@@ -220,7 +487,7 @@ class TransitionTool(EthereumCLI):
             "--input.txs",
             input_paths["txs"],
             "--output.basedir",
-            temp_dir.name,
+            work_dir,
             "--output.result",
             output_paths["result"],
             "--output.alloc",
@@ -236,16 +503,12 @@ class TransitionTool(EthereumCLI):
         if self.trace:
             args.append("--trace")
 
-        result = subprocess.run(
-            args,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
+        result = self._run_subprocess(args)
 
         if debug_output_path:
             if os.path.exists(debug_output_path):
                 shutil.rmtree(debug_output_path)
-            shutil.copytree(temp_dir.name, debug_output_path)
+            shutil.copytree(work_dir, debug_output_path)
             t8n_output_base_dir = os.path.join(debug_output_path, "t8n.sh.out")
             t8n_call = " ".join(args)
             for file_path in input_paths.values():  # update input paths
@@ -253,7 +516,7 @@ class TransitionTool(EthereumCLI):
                     os.path.dirname(file_path), os.path.join(debug_output_path, "input")
                 )
             t8n_call = t8n_call.replace(  # use a new output path for basedir and outputs
-                temp_dir.name,
+                work_dir,
                 t8n_output_base_dir,
             )
             t8n_script = textwrap.dedent(
@@ -279,21 +542,22 @@ class TransitionTool(EthereumCLI):
             raise Exception("failed to evaluate: " + result.stderr.decode())
 
         for key, file_path in output_paths.items():
-            output_paths[key] = os.path.join(temp_dir.name, file_path)
+            output_paths[key] = os.path.join(work_dir, file_path)
 
         output_contents = {}
         for key, file_path in output_paths.items():
             if "txs.rlp" in file_path:
                 continue
-            with open(file_path, "r+") as file:
+            self._profile_traffic(received=os.path.getsize(file_path))
+            with self._profile_phase("json_decode"), open(file_path, "r+") as file:
                 output_contents[key] = json.load(file)
-        output = TransitionToolOutput.model_validate(
-            output_contents, context={"exception_mapper": self.exception_mapper}
-        )
+        output = self._validate_output(output_contents)
         if self.trace:
+            assert temp_dir is not None
             self.collect_traces(output.result.receipts, temp_dir, debug_output_path)
 
-        temp_dir.cleanup()
+        if temp_dir is not None:
+            temp_dir.cleanup()
 
         return output
 
@@ -303,25 +567,18 @@ class TransitionTool(EthereumCLI):
         timeout: int,
         url_args: Optional[Dict[str, List[str] | str]] = None,
         retries: int = 5,
+        daemon: Optional[TransitionToolDaemon] = None,
     ) -> Response:
-        """Send a POST request to the t8n-server and return the response."""
-        if url_args is None:
-            url_args = {}
-        post_delay = 0.1
-        while True:
-            try:
-                response = Session().post(
-                    f"{self.server_url}?{urlencode(url_args, doseq=True)}",
-                    json=data,
-                    timeout=timeout,
-                )
-                break
-            except RequestsConnectionError as e:
-                retries -= 1
-                if retries == 0:
-                    raise e
-                time.sleep(post_delay)
-                post_delay *= 2
+        """Send a POST request to the least loaded t8n-server and return the response."""
+        daemon_pool = self.ensure_server()
+        with self._profile_phase("request_dump"):
+            body = json.dumps(data).encode()
+        self._profile_traffic(sent=len(body))
+        with self._profile_phase("ipc"):
+            response = daemon_pool.post(
+                data=body, timeout=timeout, url_args=url_args, retries=retries, daemon=daemon
+            )
+            self._profile_traffic(received=len(response.content))
         response.raise_for_status()
         if response.status_code != 200:
             raise Exception(
@@ -343,7 +600,8 @@ class TransitionTool(EthereumCLI):
     ) -> TransitionToolOutput:
         """Execute the transition tool sending inputs and outputs via a server."""
         request_data = t8n_data.get_request_data()
-        request_data_json = request_data.model_dump(mode="json", **model_dump_config)
+        with self._profile_phase("request_dump"):
+            request_data_json = request_data.model_dump(mode="json", **model_dump_config)
 
         temp_dir = tempfile.TemporaryDirectory()
         request_data_json["trace"] = self.trace
@@ -352,7 +610,7 @@ class TransitionTool(EthereumCLI):
 
         if debug_output_path:
             request_info = (
-                f"Server URL: {self.server_url}\n\n"
+                f"Server URL: {self.ensure_server().url}\n\n"
                 f"Request Data:\n{json.dumps(request_data_json, indent=2)}\n"
             )
             dump_files_to_directory(
@@ -371,14 +629,13 @@ class TransitionTool(EthereumCLI):
         response = self._server_post(
             data=request_data_json, url_args=self._generate_post_args(t8n_data), timeout=timeout
         )
-        response_json = response.json()
+        with self._profile_phase("json_decode"):
+            response_json = response.json()
 
         # pop optional test ``_info`` metadata from response, if present
         self._info_metadata = response_json.pop("_info_metadata", {})
 
-        output: TransitionToolOutput = TransitionToolOutput.model_validate(
-            response_json, context={"exception_mapper": self.exception_mapper}
-        )
+        output = self._validate_output(response_json)
 
         if self.trace:
             self.collect_traces(output.result.receipts, temp_dir, debug_output_path)
@@ -402,6 +659,96 @@ class TransitionTool(EthereumCLI):
 
         return output
 
+    def _evaluate_server_session(
+        self,
+        *,
+        t8n_data: TransitionToolData,
+        session: TransitionToolSession,
+        timeout: int,
+    ) -> TransitionToolOutput:
+        """
+        Execute the transition tool through a server session, sending only the difference between
+        the state held by the server and the state of the block.
+
+        Falls back to `_evaluate_server` if the server does not support sessions.
+        """
+        daemon_pool = self.ensure_server()
+
+        reopened = not session.is_open
+        if session.is_open:
+            alloc, deleted = session.diff(t8n_data.alloc)
+            session_request: Dict[str, Any] = {"id": session.id, "deleted": deleted}
+        else:
+            alloc = t8n_data.alloc
+            session_request = {"open": True}
+            session.daemon = daemon_pool.select()
+        with self._profile_phase("request_dump"):
+            request_data_json = (
+                replace(t8n_data, alloc=alloc)
+                .get_request_data()
+                .model_dump(mode="json", **model_dump_config)
+            )
+        request_data_json["session"] = session_request
+
+        temp_dir = tempfile.TemporaryDirectory()
+        request_data_json["trace"] = self.trace
+        if self.trace:
+            request_data_json["output-basedir"] = temp_dir.name
+
+        try:
+            response = self._server_post(
+                data=request_data_json,
+                url_args=self._generate_post_args(t8n_data),
+                timeout=timeout,
+                daemon=session.daemon,
+            )
+        except HTTPError as e:
+            temp_dir.cleanup()
+            # The server-side state of the session is unknown after an error.
+            session.reset()
+            status_code = e.response.status_code if e.response is not None else None
+            if status_code not in (SESSION_UNKNOWN_STATUS, SESSION_UNSUPPORTED_STATUS):
+                raise
+            if reopened or status_code == SESSION_UNSUPPORTED_STATUS:
+                # The server rejected the session request: stop using sessions.
+                self.t8n_use_session = False
+                return self._evaluate_server(t8n_data=t8n_data, timeout=timeout)
+            # The session was lost (e.g. the daemon was restarted); open a new one.
+            return self._evaluate_server_session(
+                t8n_data=t8n_data, session=session, timeout=timeout
+            )
+        with self._profile_phase("json_decode"):
+            response_json = response.json()
+
+        self._info_metadata = response_json.pop("_info_metadata", {})
+        session_response = response_json.pop("session", None)
+        output = self._validate_output(response_json)
+
+        if session_response is None:
+            session.reset()
+            if not reopened:
+                temp_dir.cleanup()
+                raise TransitionToolSessionError(
+                    "t8n-server returned no session information for a request of an open "
+                    "session, so its response only contains the accounts sent in the request."
+                )
+            # The server ignored the session, so the response contains the full post-state.
+            self.t8n_use_session = False
+        else:
+            output.alloc = session.apply(
+                t8n_data.alloc, output.alloc, session_response.get("deleted", [])
+            )
+            session.id = session_response["id"]
+            session.server_alloc = output.alloc
+            if self.result_cache is not None:
+                response_json["alloc"] = output.alloc.model_dump(mode="json", **model_dump_config)
+
+        if self.trace:
+            self.collect_traces(output.result.receipts, temp_dir)
+        temp_dir.cleanup()
+
+        return output
+
     def _evaluate_stream(
         self,
         *,
@@ -413,22 +760,18 @@ class TransitionTool(EthereumCLI):
         args = self.construct_args_stream(t8n_data, temp_dir)
 
         stdin = t8n_data.to_input()
+        with self._profile_phase("request_dump"):
+            stdin_bytes = stdin.model_dump_json(**model_dump_config).encode()
+        self._profile_traffic(sent=len(stdin_bytes))
 
-        result = subprocess.run(
-            args,
-            input=stdin.model_dump_json(**model_dump_config).encode(),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
+        result = self._run_subprocess(args, stdin=stdin_bytes)
 
         self.dump_debug_stream(debug_output_path, temp_dir, stdin, args, result)
 
         if result.returncode != 0:
             raise Exception("failed to evaluate: " + result.stderr.decode())
 
-        output: TransitionToolOutput = TransitionToolOutput.model_validate_json(
-            result.stdout, context={"exception_mapper": self.exception_mapper}
-        )
+        output = self._validate_output(result.stdout)
 
         if debug_output_path:
             dump_files_to_directory(
@@ -549,6 +892,104 @@ class TransitionTool(EthereumCLI):
         transition_tool_data: TransitionToolData,
         debug_output_path: str = "",
         slow_request: bool = False,
+    ) -> TransitionToolOutput:
+        """
+        Evaluate a state transition, recording its per-phase timings if profiling is enabled.
+
+        The evaluation is attributed to the current `profile_test_id` and the fork of the
+        transition.
+
+        Independent transitions can be evaluated concurrently from several threads: up to
+        `max_concurrent_evaluations` tool subprocesses run at the same time in stream and
+        filesystem mode, and requests are spread across the t8n-server daemons in server mode.
+        """
+        if self.profile is None:
+            return self._evaluate_with_cache(
+                transition_tool_data=transition_tool_data,
+                debug_output_path=debug_output_path,
+                slow_request=slow_request,
+            )
+        entry = TransitionToolProfileEntry(evaluations=1)
+        self._thread_local.profile_entry = entry
+        start = time.perf_counter()
+        try:
+            return self._evaluate_with_cache(
+                transition_tool_data=transition_tool_data,
+                debug_output_path=debug_output_path,
+                slow_request=slow_request,
+            )
+        finally:
+            entry.wall_time = time.perf_counter() - start
+            self._thread_local.profile_entry = None
+            with self._lock:
+                self.profile.record(
+                    entry, test_id=self.profile_test_id, fork=transition_tool_data.fork_name
+                )
+
+    def _evaluate_with_cache(
+        self,
+        *,
+        transition_tool_data: TransitionToolData,
+        debug_output_path: str = "",
+        slow_request: bool = False,
+    ) -> TransitionToolOutput:
+        """
+        Evaluate a state transition, using the result cache if one is configured.
+
+        The cache is bypassed when traces are collected or a debug output path is requested,
+        since both require the tool to actually run, and when the tool build cannot be pinned.
+        """
+        tool_identity = self.tool_identity() if self.result_cache is not None else None
+        if self.result_cache is None or tool_identity is None or self.trace or debug_output_path:
+            return self._evaluate(
+                transition_tool_data=transition_tool_data,
+                debug_output_path=debug_output_path,
+                slow_request=slow_request,
+            )
+
+        with self._profile_phase("cache"):
+            cache_key = TransitionToolCache.key(
+                tool_identity=tool_identity,
+                request=transition_tool_data.get_request_data(),
+                state_test=transition_tool_data.state_test,
+            )
+            cached_entry = self.result_cache.get(cache_key)
+        if cached_entry is not None:
+            self._info_metadata = cached_entry["info_metadata"]
+            if (profile_entry := getattr(self._thread_local, "profile_entry", None)) is not None:
+                profile_entry.cache_hits += 1
+            return self._validate_output(cached_entry["output"])
+
+        self._thread_local.raw_output = None
+        self._info_metadata = {}
+        output = self._evaluate(
+            transition_tool_data=transition_tool_data,
+            debug_output_path=debug_output_path,
+            slow_request=slow_request,
+        )
+        raw_output = self._thread_local.raw_output
+        with self._profile_phase("cache"):
+            if isinstance(raw_output, bytes):
+                raw_output = json.loads(raw_output)
+            if raw_output is not None:
+                self.result_cache.put(cache_key, raw_output, self._info_metadata)
+        return output
+
+    def _get_subprocess_semaphore(self) -> threading.BoundedSemaphore:
+        """Return the semaphore bounding the number of concurrent tool subprocesses."""
+        with self._lock:
+            if self._subprocess_semaphore is None:
+                self._subprocess_semaphore = threading.BoundedSemaphore(
+                    self.max_concurrent_evaluations
+                )
+            return self._subprocess_semaphore
+
+    def _evaluate(
+        self,
+        *,
+        transition_tool_data: TransitionToolData,
+        debug_output_path: str = "",
+        slow_request: bool = False,
     ) -> TransitionToolOutput:
         """
         Execute the relevant evaluate method as required by the `t8n` tool.
@@ -557,8 +998,16 @@ class TransitionTool(EthereumCLI):
         can be overridden.
         """
         if self.t8n_use_server:
-            if not self.server_url:
-                self.start_server()
+            if (
+                self.t8n_use_session
+                and transition_tool_data.session is not None
+                and not debug_output_path
+            ):
+                return self._evaluate_server_session(
+                    t8n_data=transition_tool_data,
+                    session=transition_tool_data.session,
+                    timeout=SLOW_REQUEST_TIMEOUT if slow_request else NORMAL_SERVER_TIMEOUT,
+                )
             return self._evaluate_server(
                 t8n_data=transition_tool_data,
                 debug_output_path=debug_output_path,
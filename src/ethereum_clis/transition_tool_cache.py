@@ -0,0 +1,125 @@
+"""Persistent, content-addressed cache of transition tool results."""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from .types import TransitionToolRequest
+
+DEFAULT_CACHE_MAX_SIZE_MB = 2048
+CACHE_FORMAT_VERSION = "1"
+EVICTION_LOW_WATERMARK = 0.9
+
+
+class TransitionToolCache:
+    """
+    On-disk cache of raw transition tool outputs keyed by a digest of the request.
+
+    Each entry is stored as a JSON file named after the digest of the full `t8n` request (alloc,
+    txs, env, fork, chain id, reward and blob schedule) combined with the identity of the tool
+    that produced it, so a change in either results in a cache miss.
+
+    The raw (unvalidated) tool output is stored, which means cached entries are re-validated
+    with the current framework models on every hit.
+
+    The cache directory is bounded in size: once the tracked size exceeds `max_size`, the least
+    recently used entries are evicted until the size drops below a low watermark. The directory
+    can be shared among multiple processes (e.g. xdist workers) and threads; entries are written
+    atomically.
+    """
+
+    directory: Path
+    max_size: int
+    hits: int
+    misses: int
+
+    def __init__(self, directory: Path, max_size: int = DEFAULT_CACHE_MAX_SIZE_MB * 1024**2):
+        """Initialize the cache, creating the cache directory if it does not exist."""
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._tracked_size = sum(size for _, _, size in self._entries())
+
+    @staticmethod
+    def key(*, tool_identity: str, request: TransitionToolRequest, state_test: bool) -> str:
+        """Return the cache key of a transition tool request."""
+        digest = hashlib.sha256()
+        for part in (
+            CACHE_FORMAT_VERSION,
+            tool_identity,
+            str(state_test),
+            request.model_dump_json(by_alias=True, exclude_none=True),
+        ):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _entries(self) -> List[Tuple[Path, float, int]]:
+        """Return the path, last access time and size of every entry in the cache."""
+        entries: List[Tuple[Path, float, int]] = []
+        for entry in self.directory.glob("*/*.json"):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:  # evicted by another process
+                continue
+            entries.append((entry, stat.st_mtime, stat.st_size))
+        return entries
+
+    def get(self, key: str) -> Dict[str, Any] | None:
+        """
+        Return the cached entry for the given key, or None if not present.
+
+        The returned dictionary contains the raw tool `output` and the optional `info_metadata`.
+        """
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, "r") as f:
+                entry = json.load(f)
+            os.utime(entry_path)  # mark as recently used
+        except (FileNotFoundError, json.JSONDecodeError):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return entry
+
+    def put(self, key: str, output: Dict[str, Any], info_metadata: Dict[str, Any] | None) -> None:
+        """Store the raw tool output for the given key, evicting old entries if required."""
+        entry_path = self._entry_path(key)
+        entry_path.parent.mkdir(exist_ok=True)
+        contents = json.dumps({"output": output, "info_metadata": info_metadata or {}})
+        fd, temp_path = tempfile.mkstemp(dir=entry_path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            f.write(contents)
+        os.replace(temp_path, entry_path)
+        with self._lock:
+            self._tracked_size += len(contents)
+            if self._tracked_size > self.max_size:
+                self._evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache is below its low watermark."""
+        with self._lock:
+            self._evict()
+
+    def _evict(self) -> None:
+        entries = sorted(self._entries(), key=lambda entry: entry[1])
+        total_size = sum(size for _, _, size in entries)
+        target_size = self.max_size * EVICTION_LOW_WATERMARK
+        for entry_path, _, size in entries:
+            if total_size <= target_size:
+                break
+            entry_path.unlink(missing_ok=True)
+            total_size -= size
+        self._tracked_size = total_size
@@ -0,0 +1,101 @@
+"""Per-phase timing and traffic statistics of transition tool evaluations."""
+
+from typing import Dict, List, Tuple
+
+from pydantic import Field
+
+from ethereum_test_base_types import CamelModel
+
+PROFILE_PHASES = (
+    "cache",
+    "request_dump",
+    "ipc",
+    "tool_exit",
+    "json_decode",
+    "model_validate",
+)
+"""
+Phases timed within `TransitionTool.evaluate`:
+
+- `cache`: computing the result cache key and looking up/storing the result.
+- `request_dump`: dumping the request models to JSON and writing them to the tool input.
+- `ipc`: wall time of the server request until the response is received, or of the tool
+  subprocess from its start until it closes its output streams.
+- `tool_exit`: wait for the tool subprocess to exit once its output streams are closed.
+- `json_decode`: decoding the JSON output of the tool.
+- `model_validate`: validating the decoded output into `TransitionToolOutput`.
+"""
+
+
+class TransitionToolProfileEntry(CamelModel):
+    """Accumulated statistics of a set of transition tool evaluations."""
+
+    evaluations: int = 0
+    cache_hits: int = 0
+    wall_time: float = 0.0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    phases: Dict[str, float] = Field(default_factory=dict)
+
+    def add(self, other: "TransitionToolProfileEntry") -> None:
+        """Add the statistics of another entry to this one."""
+        self.evaluations += other.evaluations
+        self.cache_hits += other.cache_hits
+        self.wall_time += other.wall_time
+        self.bytes_sent += other.bytes_sent
+        self.bytes_received += other.bytes_received
+        for phase, duration in other.phases.items():
+            self.phases[phase] = self.phases.get(phase, 0.0) + duration
+
+    def add_phase(self, phase: str, duration: float) -> None:
+        """Add the duration of a phase."""
+        self.phases[phase] = self.phases.get(phase, 0.0) + duration
+
+
+class TransitionToolProfile(CamelModel):
+    """Statistics of transition tool evaluations aggregated per test, module and fork."""
+
+    total: TransitionToolProfileEntry = Field(default_factory=TransitionToolProfileEntry)
+    tests: Dict[str, TransitionToolProfileEntry] = Field(default_factory=dict)
+    modules: Dict[str, TransitionToolProfileEntry] = Field(default_factory=dict)
+    forks: Dict[str, TransitionToolProfileEntry] = Field(default_factory=dict)
+
+    def record(self, entry: TransitionToolProfileEntry, *, test_id: str | None, fork: str) -> None:
+        """Add the statistics of a single evaluation."""
+        self.total.add(entry)
+        if test_id is not None:
+            self.tests.setdefault(test_id, TransitionToolProfileEntry()).add(entry)
+            module = test_id.split("::")[0]
+            self.modules.setdefault(module, TransitionToolProfileEntry()).add(entry)
+        self.forks.setdefault(fork, TransitionToolProfileEntry()).add(entry)
+
+    def merge(self, other: "TransitionToolProfile") -> None:
+        """Merge the statistics of another profile, e.g. from a different xdist worker."""
+        self.total.add(other.total)
+        for attribute in ("tests", "modules", "forks"):
+            entries: Dict[str, TransitionToolProfileEntry] = getattr(self, attribute)
+            for key, entry in getattr(other, attribute).items():
+                entries.setdefault(key, TransitionToolProfileEntry()).add(entry)
+
+    def slowest(self, attribute: str, count: int) -> List[Tuple[str, TransitionToolProfileEntry]]:
+        """Return the entries of the given aggregation with the highest wall time."""
+        entries: Dict[str, TransitionToolProfileEntry] = getattr(self, attribute)
+        return sorted(entries.items(), key=lambda item: item[1].wall_time, reverse=True)[:count]
+
+    def summary_lines(self, count: int = 5) -> List[str]:
+        """Return a human readable summary of the profile."""
+        total = self.total
+        lines = [
+            f"{total.evaluations} evaluations ({total.cache_hits} cache hits), "
+            f"{total.wall_time:.2f}s total, {total.bytes_sent / 1024**2:.1f} MiB sent, "
+            f"{total.bytes_received / 1024**2:.1f} MiB received",
+        ]
+        for phase in PROFILE_PHASES:
+            duration = total.phases.get(phase, 0.0)
+            share = 100 * duration / total.wall_time if total.wall_time else 0.0
+            lines.append(f"  {phase:<16}{duration:>10.2f}s {share:>6.1f}%")
+        for attribute in ("forks", "modules"):
+            lines.append(f"Slowest {attribute}:")
+            for key, entry in self.slowest(attribute, count):
+                lines.append(f"  {entry.wall_time:>10.2f}s {entry.evaluations:>7} {key}")
+        return lines
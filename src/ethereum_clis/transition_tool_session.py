@@ -0,0 +1,112 @@
+"""
+State kept by the framework for a stateful, multi-block transition tool session.
+
+Protocol
+--------
+Session mode is an optional extension of the t8n-server interface. A request takes part in a
+session by including a `session` object in its JSON body:
+
+- `{"open": true}` opens a new session. `input.alloc` contains the full pre-state.
+- `{"id": <id>, "deleted": [<address>, ...]}` continues an existing session. `input.alloc` only
+  contains the accounts that differ from the post-state of the previous request of the session,
+  and `deleted` lists the accounts that must be removed from it before executing the block.
+- `{"id": <id>, "close": true}` closes the session and releases its state in the server.
+
+A server supporting sessions includes `"session": {"id": <id>, "deleted": [<address>, ...]}` in
+the response, and its `alloc` only contains the accounts touched by the block; `deleted` lists the
+accounts removed from the state by the block. The framework reconstructs the full post-state
+locally.
+
+A server that does not support sessions ignores the `session` object in the opening request and
+returns the full post-state, in which case the framework falls back to sending full requests. A
+server may also reject session requests with status 501 (Not Implemented). A server that does not
+know the session of a request, e.g. after it was restarted, answers with status 404 (Not Found)
+and the framework re-opens the session. Any other error status is an error of the evaluation.
+"""
+
+from typing import Dict, List, Tuple
+
+from ethereum_test_base_types import Account, Address
+from ethereum_test_types import Alloc
+
+from .daemon_pool import TransitionToolDaemon
+
+SESSION_UNKNOWN_STATUS = 404
+"""Status code of the response to a request for a session unknown to the server."""
+SESSION_UNSUPPORTED_STATUS = 501
+"""Status code of the response to a session request by a server that does not support them."""
+
+
+class TransitionToolSessionError(Exception):
+    """Raised when a t8n-server does not follow the session protocol."""
+
+
+class TransitionToolSession:
+    """
+    Framework side of a transition tool session.
+
+    Keeps track of the state held by the server for the session, so that only the difference
+    between that state and the state of the next block has to be sent.
+    """
+
+    id: str | None
+    daemon: TransitionToolDaemon | None
+    server_alloc: Alloc | None
+
+    def __init__(self):
+        """Initialize a session that has not been opened in the server yet."""
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the server-side state, so the next request re-opens the session."""
+        self.id = None
+        self.daemon = None
+        self.server_alloc = None
+
+    @property
+    def is_open(self) -> bool:
+        """Return whether the session has been opened in the server."""
+        return self.id is not None
+
+    def diff(self, alloc: Alloc) -> Tuple[Alloc, List[Address]]:
+        """
+        Return the accounts that must be updated and the addresses that must be deleted in the
+        server-side state of the session to obtain the given alloc.
+        """
+        assert self.server_alloc is not None, "session is not open"
+        server_accounts = self.server_alloc.root
+        target_accounts = alloc.root
+        if server_accounts is target_accounts:
+            return Alloc(), []
+        updated: Dict[Address, Account | None] = {}
+        for address, account in target_accounts.items():
+            if account is None:
+                continue
+            server_account = server_accounts.get(address)
+            if server_account is not account and server_account != account:
+                updated[address] = account
+        deleted = [
+            address
+            for address, account in server_accounts.items()
+            if account is not None and target_accounts.get(address) is None
+        ]
+        return Alloc(updated), deleted
+
+    def apply(self, base_alloc: Alloc, touched_alloc: Alloc, deleted: List[Address]) -> Alloc:
+        """
+        Reconstruct the full post-state from the state the block was executed on and the
+        accounts touched and deleted by the block.
+
+        Untouched account objects are shared between the base and the resulting alloc.
+        """
+        accounts: Dict[Address, Account | None] = {
+            address: account for address, account in base_alloc.root.items() if account is not None
+        }
+        for address, account in touched_alloc.root.items():
+            if account is None:
+                accounts.pop(address, None)
+            else:
+                accounts[address] = account
+        for address in deleted:
+            accounts.pop(Address(address), None)
+        return touched_alloc.__class__.model_construct(root=accounts)
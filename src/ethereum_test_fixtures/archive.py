@@ -0,0 +1,190 @@
+"""Streaming writers and readers of compressed fixture tarballs."""
+
+import io
+import os
+import struct
+import tarfile
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any, Deque, Iterator, Optional
+
+GZIP_BLOCK_SIZE = 1 << 20
+GZIP_DICTIONARY_SIZE = 1 << 15
+GZIP_HEADER = b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+TARBALL_SUFFIXES = (".tar.gz", ".tgz", ".tar.zst")
+
+
+def strip_tarball_suffix(name: str) -> str:
+    """Remove the tarball suffix, if any, from a file name or path."""
+    for suffix in TARBALL_SUFFIXES:
+        if name.endswith(suffix):
+            return name.removesuffix(suffix)
+    return name
+
+
+def import_zstandard() -> Any:
+    """Import the optional `zstandard` package used to write and read `.tar.zst` tarballs."""
+    try:
+        import zstandard  # type: ignore[import-not-found]
+    except ImportError as e:
+        raise ImportError(
+            "The `zstandard` package is required for `.tar.zst` tarballs: "
+            "`uv pip install zstandard`."
+        ) from e
+    return zstandard
+
+
+def _deflate_block(data: bytes, dictionary: bytes, level: int, last: bool) -> bytes:
+    """
+    Compress a block as raw deflate data primed with the tail of the previous block, ending on a
+    byte boundary unless it is the last block of the stream.
+    """
+    if dictionary:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS, zdict=dictionary)
+    else:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush(
+        zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH
+    )
+
+
+class ParallelGzipWriter:
+    """
+    Write-only file object that gzip-compresses its input in blocks compressed in parallel by a
+    pool of threads, producing a single gzip member the way `pigz` does.
+
+    Each block is compressed independently, using the last 32 KiB of the previous block as its
+    dictionary, and all but the last block end with a sync flush, so that the raw deflate
+    streams of the blocks can be concatenated.
+    """
+
+    def __init__(
+        self,
+        fileobj: IO[bytes],
+        threads: Optional[int] = None,
+        level: int = 9,
+        block_size: int = GZIP_BLOCK_SIZE,
+    ):
+        """Start writing a gzip member to `fileobj`."""
+        self.fileobj = fileobj
+        self.level = level
+        self.block_size = block_size
+        self.threads = threads or os.cpu_count() or 1
+        self.executor = ThreadPoolExecutor(max_workers=self.threads)
+        self.pending: Deque[Future[bytes]] = deque()
+        self.buffer = bytearray()
+        self.dictionary = b""
+        self.crc = 0
+        self.size = 0
+        self.closed = False
+        self.fileobj.write(GZIP_HEADER)
+
+    def write(self, data: bytes) -> int:
+        """Buffer the data and submit every full block for compression."""
+        self.buffer += data
+        while len(self.buffer) > self.block_size:
+            self._submit(bytes(self.buffer[: self.block_size]), last=False)
+            del self.buffer[: self.block_size]
+        return len(data)
+
+    def _submit(self, block: bytes, last: bool) -> None:
+        """Submit a block for compression, writing the compressed blocks that are done in order."""
+        self.crc = zlib.crc32(block, self.crc)
+        self.size += len(block)
+        self.pending.append(
+            self.executor.submit(_deflate_block, block, self.dictionary, self.level, last)
+        )
+        self.dictionary = block[-GZIP_DICTIONARY_SIZE:]
+        while self.pending and (self.pending[0].done() or len(self.pending) > 2 * self.threads):
+            self.fileobj.write(self.pending.popleft().result())
+
+    def close(self) -> None:
+        """Compress the remaining data and write the gzip trailer; `fileobj` is left open."""
+        if self.closed:
+            return
+        self.closed = True
+        self._submit(bytes(self.buffer), last=True)
+        self.buffer.clear()
+        while self.pending:
+            self.fileobj.write(self.pending.popleft().result())
+        self.executor.shutdown()
+        self.fileobj.write(struct.pack("<II", self.crc, self.size & 0xFFFFFFFF))
+
+
+class FixtureTarballWriter:
+    """
+    Stream fixture files into a `.tar.gz` or `.tar.zst` tarball as they are added.
+
+    Gzip tarballs are compressed by a `ParallelGzipWriter`; zstd tarballs use the multi-threaded
+    compressor of the optional `zstandard` package.
+    """
+
+    def __init__(self, path: Path, threads: Optional[int] = None):
+        """Create the tarball at `path`."""
+        self.path = path
+        threads = threads or os.cpu_count() or 1
+        self.file = open(path, "wb")
+        self.compressor: Any
+        if path.name.endswith(".tar.zst"):
+            zstandard = import_zstandard()
+            self.compressor = zstandard.ZstdCompressor(threads=threads).stream_writer(
+                self.file, closefd=False
+            )
+        else:
+            self.compressor = ParallelGzipWriter(self.file, threads=threads)
+        self.tar = tarfile.open(fileobj=self.compressor, mode="w|")
+
+    def add(self, file_path: Path, arcname: Path) -> None:
+        """Append a file to the tarball."""
+        self.tar.add(file_path, arcname=arcname)
+
+    def add_data(self, data: bytes, arcname: Path) -> None:
+        """Append a file with the given content to the tarball."""
+        info = tarfile.TarInfo(arcname.as_posix())
+        info.size = len(data)
+        self.tar.addfile(info, io.BytesIO(data))
+
+    def close(self) -> None:
+        """Finish the tarball."""
+        self.tar.close()
+        self.compressor.close()
+        self.file.close()
+
+    def __enter__(self) -> "FixtureTarballWriter":  # noqa: D105
+        return self
+
+    def __exit__(self, *args) -> None:  # noqa: D105
+        self.close()
+
+
+@contextmanager
+def open_fixture_tarball(fileobj: IO[bytes]) -> Iterator[tarfile.TarFile]:
+    """
+    Open a gzip or zstd compressed fixture tarball for reading, detecting the compression from
+    its magic bytes.
+
+    Non-seekable file objects, such as an `io.BufferedReader` over a download, must support
+    `peek`; they are opened as a stream, as are all zstd tarballs: their members must then be
+    read in order, e.g. with `extractall`.
+    """
+    seekable = fileobj.seekable()
+    if seekable:
+        magic = fileobj.read(len(ZSTD_MAGIC))
+        fileobj.seek(0)
+    else:
+        magic = fileobj.peek(len(ZSTD_MAGIC))[: len(ZSTD_MAGIC)]  # type: ignore[attr-defined]
+    if magic == ZSTD_MAGIC:
+        zstandard = import_zstandard()
+        with zstandard.ZstdDecompressor().stream_reader(fileobj, closefd=False) as reader:
+            with tarfile.open(fileobj=reader, mode="r|") as tar:
+                yield tar
+    elif seekable:
+        with tarfile.open(fileobj=fileobj, mode="r:gz") as tar:
+            yield tar
+    else:
+        with tarfile.open(fileobj=fileobj, mode="r|gz") as tar:
+            yield tar
@@ -3,20 +3,26 @@
 import hashlib
 import json
 from functools import cached_property
-from typing import Annotated, Any, ClassVar, Dict, Type, Union
+from typing import Annotated, Any, ClassVar, Dict, Tuple, Type, Union
 
 from pydantic import (
     Discriminator,
     Field,
     PlainSerializer,
     PlainValidator,
+    PrivateAttr,
     Tag,
     TypeAdapter,
+    ValidationInfo,
+    WrapValidator,
+    model_serializer,
     model_validator,
 )
-from pydantic_core.core_schema import ValidatorFunctionWrapHandler
+from pydantic.functional_validators import ModelWrapValidatorHandler
+from pydantic_core.core_schema import SerializerFunctionWrapHandler, ValidatorFunctionWrapHandler
+from typing_extensions import Self
 
-from ethereum_test_base_types import CamelModel, ReferenceSpec
+from ethereum_test_base_types import CamelModel, ReferenceSpec, to_json
 from ethereum_test_forks import Fork
 
 
@@ -38,8 +44,49 @@ def fixture_format_discriminator(v: Any) -> str | None:
     return fixture_format
 
 
+class LazyValue:
+    """The unvalidated JSON value of a lazy fixture field."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        """Wrap the unvalidated JSON value."""
+        self.value = value
+
+
+def lazy_field_validator(
+    value: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo
+) -> Any:
+    """Defer the validation of a field if the `lazy` validation context flag is set."""
+    if info.context and info.context.get("lazy"):
+        return LazyValue(value)
+    return handler(value)
+
+
+LazyField = WrapValidator(lazy_field_validator)
+"""
+Annotation of a fixture field whose validation can be deferred until it is first accessed.
+
+Fields that hold large sub-models, such as the pre-allocation or the blocks of a blockchain test,
+are kept as unvalidated JSON when the fixture is validated with `context={"lazy": True}`.
+"""
+
+
+def fixture_json_hash(json_dict: Dict[str, Any]) -> str:
+    """Return the hash of the JSON representation of a fixture, without its `_info` field."""
+    json_str = json.dumps(json_dict, sort_keys=True, separators=(",", ":"))
+    h = hashlib.sha256(json_str.encode("utf-8")).hexdigest()
+    return f"0x{h}"
+
+
 class BaseFixture(CamelModel):
-    """Represents a base Ethereum test fixture of any type."""
+    """
+    Represents a base Ethereum test fixture of any type.
+
+    Fields annotated with `LazyField` are validated on first access when the fixture is loaded
+    with `context={"lazy": True}`, e.g.
+    `Fixtures.model_validate_json(json_text, context={"lazy": True})`.
+    """
 
     # Base Fixture class properties
     formats: ClassVar[Dict[str, Type["BaseFixture"]]] = {}
@@ -47,6 +94,9 @@ class BaseFixture(CamelModel):
 
     info: Dict[str, Dict[str, Any] | str] = Field(default_factory=dict, alias="_info")
 
+    _lazy_values: Dict[str, Any] = PrivateAttr(default_factory=dict)
+    _lazy_field_type_adapters: ClassVar[Dict[Tuple[type, str], TypeAdapter]] = {}
+
     # Fixture format properties
     format_name: ClassVar[str] = ""
     output_file_extension: ClassVar[str] = ".json"
@@ -86,12 +136,78 @@ class BaseFixture(CamelModel):
 
     @model_validator(mode="wrap")
     @classmethod
-    def _parse_into_subclass(cls, v: Any, handler: ValidatorFunctionWrapHandler) -> "BaseFixture":
+    def _parse_into_subclass(
+        cls, v: Any, handler: ModelWrapValidatorHandler[Self], info: ValidationInfo
+    ) -> Self:
         """Parse the fixture into the correct subclass."""
         if cls is BaseFixture:
-            return BaseFixture.formats_type_adapter.validate_python(v)
+            return BaseFixture.formats_type_adapter.validate_python(v, context=info.context)
         return handler(v)
 
+    def model_post_init(self, __context: Any) -> None:
+        """Move the unvalidated values of the lazy fields out of the model fields."""
+        super().model_post_init(__context)
+        for name, value in list(self.__dict__.items()):
+            if isinstance(value, LazyValue):
+                self._lazy_values[name] = value.value
+                del self.__dict__[name]
+
+    def __getattr__(self, name: str) -> Any:
+        """Validate a lazy field on first access."""
+        try:
+            private = object.__getattribute__(self, "__pydantic_private__")
+            lazy_values = private["_lazy_values"]
+        except (AttributeError, KeyError, TypeError):
+            # Not initialized yet, e.g. while unpickling.
+            lazy_values = {}
+        if name in lazy_values:
+            value = self._lazy_field_type_adapter(name).validate_python(lazy_values[name])
+            # Restore the field order of the model, which is the order of serialization.
+            fields = dict(self.__dict__, **{name: value})
+            self.__dict__.clear()
+            self.__dict__.update((k, fields[k]) for k in type(self).model_fields if k in fields)
+            # Replace rather than mutate, the dict is shared with shallow copies of the model.
+            private["_lazy_values"] = {k: v for k, v in lazy_values.items() if k != name}
+            return value
+        return super().__getattr__(name)  # type: ignore[misc]
+
+    @classmethod
+    def _lazy_field_type_adapter(cls, name: str) -> TypeAdapter:
+        key = (cls, name)
+        if key not in BaseFixture._lazy_field_type_adapters:
+            BaseFixture._lazy_field_type_adapters[key] = TypeAdapter(
+                cls.model_fields[name].annotation
+            )
+        return BaseFixture._lazy_field_type_adapters[key]
+
+    def validate_lazy_fields(self) -> None:
+        """Validate all the lazy fields that have not been accessed yet."""
+        for name in list(self._lazy_values):
+            getattr(self, name)
+
+    def field_json(self, name: str) -> Any:
+        """
+        Return the JSON representation of a field, without validating it if it is a lazy field
+        that has not been accessed yet.
+        """
+        if name in self._lazy_values:
+            return self._lazy_values[name]
+        value = getattr(self, name)
+        return None if value is None else to_json(value)
+
+    @model_serializer(mode="wrap")
+    def _serialize_lazy_fields(self, handler: SerializerFunctionWrapHandler) -> Any:
+        """Validate the lazy fields before serializing the fixture."""
+        self.validate_lazy_fields()
+        return handler(self)
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare the fixtures, including their lazy fields."""
+        if isinstance(other, BaseFixture):
+            self.validate_lazy_fields()
+            other.validate_lazy_fields()
+        return super().__eq__(other)
+
     @cached_property
     def json_dict(self) -> Dict[str, Any]:
         """Returns the JSON representation of the fixture."""
@@ -100,9 +216,7 @@ class BaseFixture(CamelModel):
     @cached_property
     def hash(self) -> str:
         """Returns the hash of the fixture."""
-        json_str = json.dumps(self.json_dict, sort_keys=True, separators=(",", ":"))
-        h = hashlib.sha256(json_str.encode("utf-8")).hexdigest()
-        return f"0x{h}"
+        return fixture_json_hash(self.json_dict)
 
     def json_dict_with_info(self, hash_only: bool = False) -> Dict[str, Any]:
         """Return JSON representation of the fixture with the info field."""
@@ -43,8 +43,9 @@ from ethereum_test_types import (
 from ethereum_test_types.block_types import WithdrawalGeneric
 from ethereum_test_types.transaction_types import TransactionFixtureConverter, TransactionGeneric
 
-from .base import BaseFixture
+from .base import BaseFixture, LazyField
 from .common import FixtureAuthorizationTuple, FixtureBlobSchedule
+from .store import StoredField
 
 
 def post_state_validator(alternate_field: str | None = None, mode: str = "after"):
@@ -478,8 +479,8 @@ class BlockchainFixtureCommon(BaseFixture):
 
     fork: Fork = Field(..., alias="network")
     genesis: FixtureHeader = Field(..., alias="genesisBlockHeader")
-    pre: Alloc
-    post_state: Alloc | None = Field(None)
+    pre: Annotated[Alloc, LazyField, StoredField]
+    post_state: Annotated[Alloc | None, LazyField, StoredField] = Field(None)
     post_state_hash: Hash | None = Field(None)
     last_block_hash: Hash = Field(..., alias="lastblockhash")  # FIXME: lastBlockHash
     config: FixtureConfig
@@ -512,8 +513,8 @@ class BlockchainFixture(BlockchainFixtureCommon):
     format_name: ClassVar[str] = "blockchain_test"
     description: ClassVar[str] = "Tests that generate a blockchain test fixture."
 
-    genesis_rlp: Bytes = Field(..., alias="genesisRLP")
-    blocks: List[FixtureBlock | InvalidFixtureBlock]
+    genesis_rlp: Annotated[Bytes, StoredField] = Field(..., alias="genesisRLP")
+    blocks: Annotated[List[FixtureBlock | InvalidFixtureBlock], LazyField]
     seal_engine: Literal["NoProof"] = Field("NoProof")
 
 
@@ -552,10 +553,12 @@ class BlockchainEngineFixture(BlockchainEngineFixtureCommon):
     description: ClassVar[str] = (
         "Tests that generate a blockchain test fixture in Engine API format."
     )
-    pre: Alloc
+    pre: Annotated[Alloc, LazyField, StoredField]
     genesis: FixtureHeader = Field(..., alias="genesisBlockHeader")
-    post_state: Alloc | None = Field(None)
-    payloads: List[FixtureEngineNewPayload] = Field(..., alias="engineNewPayloads")
+    post_state: Annotated[Alloc | None, LazyField, StoredField] = Field(None)
+    payloads: Annotated[List[FixtureEngineNewPayload], LazyField] = Field(
+        ..., alias="engineNewPayloads"
+    )
     sync_payload: FixtureEngineNewPayload | None = None
 
 
@@ -574,10 +577,12 @@ class BlockchainEngineXFixture(BlockchainEngineFixtureCommon):
     pre_hash: str
     """Hash of the pre-allocation group this test belongs to."""
 
-    post_state_diff: Alloc | None = None
+    post_state_diff: Annotated[Alloc | None, LazyField] = None
     """State difference from genesis after test execution (efficiency optimization)."""
 
-    payloads: List[FixtureEngineNewPayload] = Field(..., alias="engineNewPayloads")
+    payloads: Annotated[List[FixtureEngineNewPayload], LazyField] = Field(
+        ..., alias="engineNewPayloads"
+    )
     """Engine API payloads for blockchain execution."""
 
     sync_payload: FixtureEngineNewPayload | None = None
@@ -7,13 +7,14 @@ import json
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import ClassVar, Dict, Literal, Optional, Tuple
+from typing import ClassVar, Dict, List, Literal, Optional, Tuple
 
 from ethereum_test_base_types import to_json
 
-from .base import BaseFixture
+from .base import BaseFixture, FixtureFormat
 from .consume import FixtureConsumer
 from .file import Fixtures
 
@@ -113,6 +114,7 @@ class FixtureCollector:
     single_fixture_per_file: bool
     filler_path: Path
     base_dump_dir: Optional[Path] = None
+    shard_dir: Optional[Path] = None
 
     # Internal state
     all_fixtures: Dict[Path, Fixtures] = field(default_factory=dict)
@@ -163,24 +165,73 @@ class FixtureCollector:
             return
         os.makedirs(self.output_dir, exist_ok=True)
         for fixture_path, fixtures in self.all_fixtures.items():
-            os.makedirs(fixture_path.parent, exist_ok=True)
+            output_file_path = self.get_output_file_path(fixture_path)
+            os.makedirs(output_file_path.parent, exist_ok=True)
             if len({fixture.__class__ for fixture in fixtures.values()}) != 1:
                 raise TypeError("All fixtures in a single file must have the same format.")
-            fixtures.collect_into_file(fixture_path)
+            if self.shard_dir is not None:
+                fixtures.write_shard(output_file_path)
+            else:
+                fixtures.collect_into_file(output_file_path)
 
-    def verify_fixture_files(self, evm_fixture_verification: FixtureConsumer) -> None:
-        """Run `evm [state|block]test` on each fixture."""
+    def get_output_file_path(self, fixture_path: Path) -> Path:
+        """
+        Return the file the fixtures of `fixture_path` are written to: the fixture file itself,
+        or this collector's shard of it when writing sharded output.
+        """
+        if self.shard_dir is None:
+            return fixture_path
+        return self.shard_dir / fixture_path.relative_to(self.output_dir)
+
+    def verify_fixture_files(
+        self, evm_fixture_verification: FixtureConsumer, workers: int = 1
+    ) -> None:
+        """
+        Run `evm [state|block]test` once on each fixture file and raise an exception listing
+        every fixture that failed verification.
+
+        Files are verified concurrently in a pool of `workers` processes.
+        """
+        jobs: List[Tuple[FixtureFormat, Path, List[str], Optional[Path]]] = []
         for fixture_path, name_fixture_dict in self.all_fixtures.items():
-            for _fixture_name, fixture in name_fixture_dict.items():
-                if evm_fixture_verification.can_consume(fixture.__class__):
-                    info = self.json_path_to_test_item[fixture_path]
-                    consume_direct_dump_dir = self._get_consume_direct_dump_dir(info)
-                    evm_fixture_verification.consume_fixture(
-                        fixture.__class__,
-                        fixture_path,
-                        fixture_name=None,
-                        debug_output_path=consume_direct_dump_dir,
+            fixture_formats = {fixture.__class__ for fixture in name_fixture_dict.values()}
+            for fixture_format in fixture_formats:
+                if not evm_fixture_verification.can_consume(fixture_format):
+                    continue
+                fixture_names = [
+                    name
+                    for name, fixture in name_fixture_dict.items()
+                    if fixture.__class__ == fixture_format
+                ]
+                info = self.json_path_to_test_item[fixture_path]
+                consume_direct_dump_dir = self._get_consume_direct_dump_dir(info)
+                jobs.append(
+                    (
+                        fixture_format,
+                        self.get_output_file_path(fixture_path),
+                        fixture_names,
+                        consume_direct_dump_dir,
                     )
+                )
+
+        if workers > 1 and len(jobs) > 1:
+            with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+                futures = [
+                    executor.submit(evm_fixture_verification.consume_fixture_file, *job)
+                    for job in jobs
+                ]
+                results = [future.result() for future in futures]
+        else:
+            results = [evm_fixture_verification.consume_fixture_file(*job) for job in jobs]
+
+        failures = [
+            f"{fixture_path}::{fixture_name}: {error}"
+            for (_, fixture_path, _, _), errors in zip(jobs, results, strict=True)
+            for fixture_name, error in errors.items()
+            if error is not None
+        ]
+        if failures:
+            raise Exception("Fixture verification failed:\n" + "\n".join(failures))
 
     def _get_consume_direct_dump_dir(
         self,
@@ -1,9 +1,13 @@
 """Defines models for index files and consume test cases."""
 
 import datetime
+import json
+import os
+import sqlite3
+import tempfile
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List, Optional, TextIO
+from typing import Callable, Dict, List, Optional, Sequence, TextIO, Tuple
 
 from pydantic import BaseModel, RootModel
 
@@ -11,7 +15,8 @@ from ethereum_test_base_types import HexNumber
 from ethereum_test_forks import Fork
 
 from .base import BaseFixture, FixtureFormat
-from .file import Fixtures
+from .file import Fixtures, load_fixture_slice
+from .store import FixtureStore
 
 
 class FixtureConsumer(ABC):
@@ -39,6 +44,52 @@ class FixtureConsumer(ABC):
             "The `consume_fixture()` function is not supported by this tool."
         )
 
+    def consume_fixture_file(
+        self,
+        fixture_format: FixtureFormat,
+        fixture_path: Path,
+        fixture_names: List[str],
+        debug_output_path: Path | None = None,
+    ) -> Dict[str, str | None]:
+        """
+        Consume all the fixtures of a file with a single invocation of the consumer.
+
+        Return the error of each of the given fixtures, keyed by fixture name, or None if the
+        fixture passed.
+
+        The default implementation consumes the whole file once and, since it cannot tell which
+        fixture failed, attributes any error to all of them. Consumers that report per-fixture
+        results should override it.
+        """
+        try:
+            self.consume_fixture(
+                fixture_format,
+                fixture_path,
+                fixture_name=None,
+                debug_output_path=debug_output_path,
+            )
+        except Exception as e:
+            return dict.fromkeys(fixture_names, str(e))
+        return dict.fromkeys(fixture_names, None)
+
+    @staticmethod
+    def map_file_results(results: List[Dict], fixture_names: List[str]) -> Dict[str, str | None]:
+        """
+        Map the per-test results reported by a consumer (a list of `{"name", "pass", "error"}`
+        entries) back to the given fixture names.
+        """
+        results_by_name = {result["name"]: result for result in results}
+        errors: Dict[str, str | None] = {}
+        for fixture_name in fixture_names:
+            result = results_by_name.get(fixture_name)
+            if result is None:
+                errors[fixture_name] = "Test result missing"
+            elif not result["pass"]:
+                errors[fixture_name] = result.get("error") or "Test failed"
+            else:
+                errors[fixture_name] = None
+        return errors
+
 
 class TestCaseBase(BaseModel):
     """Base model for a test case used in EEST consume commands."""
@@ -62,8 +113,27 @@ class TestCaseIndexFile(TestCaseBase):
     """The test case model used to save/load test cases to/from an index file."""
 
     json_path: Path
+    offset: int | None = None
+    length: int | None = None
     __test__ = False  # stop pytest from collecting this class as a test
 
+    def load_fixture(self, fixtures_path: Path) -> BaseFixture:
+        """
+        Load the fixture of the test case from the fixtures directory.
+
+        If the index recorded the byte span of the fixture within its file, only that span is
+        read and validated; otherwise the whole file is loaded. The lazy fields of the fixture,
+        e.g. the pre-allocation, are only validated on first access, and references to the
+        fixture store are resolved.
+        """
+        file_path = fixtures_path / self.json_path
+        if self.offset is not None and self.length is not None:
+            return load_fixture_slice(file_path, self.offset, self.length, self.format, lazy=True)
+        return Fixtures.model_validate_json(
+            file_path.read_text(),
+            context={"lazy": True, "fixture_store": FixtureStore.find(file_path)},
+        )[self.id]
+
     # TODO: add pytest marks
     """
     ConsumerTypes = Literal["all", "direct", "rlp", "engine"]
@@ -87,6 +157,110 @@ class IndexFile(BaseModel):
     test_cases: List[TestCaseIndexFile]
 
 
+INDEX_DATABASE_FILE_NAME = "index.sqlite"
+
+INDEX_DATABASE_COLUMNS = (
+    "id",
+    "fixture_hash",
+    "fork",
+    "format",
+    "pre_hash",
+    "json_path",
+    "offset",
+    "length",
+)
+INDEX_DATABASE_COLUMNS_SQL = ", ".join(f'"{column}"' for column in INDEX_DATABASE_COLUMNS)
+
+
+class IndexDatabase:
+    """
+    A SQLite copy of an index file, stored alongside it in `.meta/index.sqlite`.
+
+    The test cases are stored in an indexed table so that only the test cases matching a filter
+    have to be read and validated, instead of the whole index file.
+    """
+
+    def __init__(self, path: Path):
+        """Open an existing index database in read-only mode."""
+        self.path = path
+        self.connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+
+    @staticmethod
+    def write(path: Path, index: IndexFile) -> None:
+        """Write the index database of an index file, replacing any previous one."""
+        # A unique temporary file per writer, replaced atomically once complete.
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+        os.close(fd)
+        tmp_path = Path(tmp_name)
+        index_json = index.model_dump(mode="json")
+        with sqlite3.connect(tmp_path) as connection:
+            connection.execute(f"CREATE TABLE test_cases ({INDEX_DATABASE_COLUMNS_SQL})")
+            for column in ("id", "fork", "format", "json_path", "fixture_hash", "pre_hash"):
+                connection.execute(f"CREATE INDEX test_cases_{column} ON test_cases ({column})")
+            connection.executemany(
+                f"INSERT INTO test_cases VALUES ({', '.join('?' * len(INDEX_DATABASE_COLUMNS))})",
+                (
+                    tuple(
+                        str(test_case[column]) if column == "json_path" else test_case[column]
+                        for column in INDEX_DATABASE_COLUMNS
+                    )
+                    for test_case in index_json.pop("test_cases")
+                ),
+            )
+            connection.execute("CREATE TABLE metadata (key PRIMARY KEY, value)")
+            connection.executemany(
+                "INSERT INTO metadata VALUES (?, ?)",
+                ((key, json.dumps(value)) for key, value in index_json.items()),
+            )
+        connection.close()
+        os.replace(tmp_path, path)
+
+    def close(self) -> None:
+        """Close the connection to the index database."""
+        self.connection.close()
+
+    @property
+    def forks(self) -> List[str]:
+        """Return the names of the forks of all the test cases."""
+        (forks,) = self.connection.execute(
+            "SELECT value FROM metadata WHERE key = 'forks'"
+        ).fetchone()
+        return json.loads(forks) or []
+
+    def fork_format_pairs(self, formats: Sequence[str]) -> List[Tuple[str | None, str]]:
+        """Return the distinct fork and format name pairs of the test cases in `formats`."""
+        return self.connection.execute(
+            "SELECT DISTINCT fork, format FROM test_cases "
+            f"WHERE format IN ({', '.join('?' * len(formats))})",
+            tuple(formats),
+        ).fetchall()
+
+    def select_test_cases(
+        self,
+        fork_format_pairs: Sequence[Tuple[str | None, str]],
+        id_filter: Callable[[str], bool] | None = None,
+    ) -> List[TestCaseIndexFile]:
+        """
+        Return the test cases of the given fork and format name pairs whose ID passes
+        `id_filter`, in the order of the index file.
+        """
+        if not fork_format_pairs:
+            return []
+        where = " OR ".join(["(fork IS ? AND format = ?)"] * len(fork_format_pairs))
+        parameters = tuple(name for pair in fork_format_pairs for name in pair)
+        if id_filter is not None:
+            self.connection.create_function("id_filter", 1, id_filter, deterministic=True)
+            where = f"({where}) AND id_filter(id)"
+        cursor = self.connection.execute(
+            f"SELECT {INDEX_DATABASE_COLUMNS_SQL} FROM test_cases WHERE {where} ORDER BY rowid",
+            parameters,
+        )
+        return [
+            TestCaseIndexFile.model_validate(dict(zip(INDEX_DATABASE_COLUMNS, row, strict=True)))
+            for row in cursor
+        ]
+
+
 class TestCases(RootModel):
     """Root model defining a list test cases used in consume commands."""
 
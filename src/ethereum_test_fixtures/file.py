@@ -1,8 +1,11 @@
 """Defines models for interacting with JSON fixture files."""
 
+import heapq
 import json
+import mmap
+import os
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, List, Tuple, Type
 
 from filelock import FileLock
 from pydantic import SerializeAsAny
@@ -10,6 +13,7 @@ from pydantic import SerializeAsAny
 from ethereum_test_base_types import EthereumTestRootModel
 
 from .base import BaseFixture
+from .store import FixtureStore
 
 
 class Fixtures(EthereumTestRootModel):
@@ -68,3 +72,125 @@ class Fixtures(EthereumTestRootModel):
 
             with open(file_path, "w") as f:
                 json.dump(dict(sorted(json_fixtures.items())), f, indent=4)
+
+    def write_shard(self, file_path: Path):
+        """
+        Write the fixtures, sorted by name, to a shard file owned by a single writer.
+
+        Unlike `collect_into_file`, no lock is taken; the shards of all writers are combined by
+        `merge_fixture_shards`. If the writer already wrote to the shard, e.g. when a module's
+        fixture collector is recreated on the same worker, the fixtures are merged into it.
+        """
+        json_fixtures = {name: fixture.json_dict_with_info() for name, fixture in self.items()}
+        write_path = file_path
+        if file_path.exists():
+            write_path = file_path.with_name(file_path.name + ".new")
+        with open(write_path, "w") as f:
+            json.dump(dict(sorted(json_fixtures.items())), f, indent=4)
+        if write_path != file_path:
+            merge_fixture_shards([write_path], file_path)
+            write_path.unlink()
+
+
+def iter_fixture_file_entries(file_path: Path) -> Iterator[Tuple[str, str]]:
+    """
+    Yield the name and the serialized JSON text of each top-level entry of a fixture file, in
+    file order, without parsing the fixtures.
+
+    The file must have been written with `json.dump(..., indent=4)`, as done by
+    `Fixtures.collect_into_file` and `Fixtures.write_shard`: each entry then starts on a line
+    indented by exactly four spaces followed by its quoted name.
+    """
+    decoder = json.JSONDecoder()
+    name: str | None = None
+    lines: List[str] = []
+    with open(file_path, "r") as f:
+        for line in f:
+            if line.startswith('    "'):
+                if name is not None:
+                    yield name, "".join(lines).rstrip("\n").removesuffix(",")
+                name, _ = decoder.raw_decode(line, 4)
+                lines = [line]
+            elif name is not None and line.rstrip("\n") != "}":
+                lines.append(line)
+    if name is not None:
+        yield name, "".join(lines).rstrip("\n").removesuffix(",")
+
+
+def iter_fixture_file_spans(file_path: Path) -> Iterator[Tuple[str, int, int]]:
+    """
+    Yield the name of each top-level entry of a fixture file, and the byte offset and length of
+    its JSON value within the file, without parsing the fixtures.
+
+    The file must have been written with `json.dump(..., indent=4)`; see
+    `iter_fixture_file_entries`.
+    """
+    decoder = json.JSONDecoder()
+    name: str | None = None
+    start = end = position = 0
+    with open(file_path, "rb") as f:
+        for raw_line in f:
+            line_start = position
+            position += len(raw_line)
+            if raw_line.startswith(b'    "'):
+                if name is not None:
+                    yield name, start, end - start
+                line = raw_line.decode()
+                name, key_end = decoder.raw_decode(line, 4)
+                value_start = line.index(":", key_end) + 1
+                while line[value_start] == " ":
+                    value_start += 1
+                start = line_start + len(line[:value_start].encode())
+            elif name is None or raw_line.rstrip(b"\r\n") == b"}":
+                continue
+            end = line_start + len(raw_line.rstrip(b"\r\n").removesuffix(b","))
+    if name is not None:
+        yield name, start, end - start
+
+
+def load_fixture_slice(
+    file_path: Path,
+    offset: int,
+    length: int,
+    fixture_format: Type[BaseFixture],
+    lazy: bool = False,
+) -> BaseFixture:
+    """
+    Load a single fixture from the given byte span of a fixture file.
+
+    The file is memory-mapped and only the JSON of the requested fixture is validated. If `lazy`
+    is set, the lazy fields of the fixture are only validated on first access. References to the
+    fixture store of the directory of the file are resolved.
+    """
+    context = {"lazy": lazy, "fixture_store": FixtureStore.find(file_path)}
+    with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        return fixture_format.model_validate_json(m[offset : offset + length], context=context)
+
+
+def merge_fixture_shards(shard_paths: List[Path], file_path: Path):
+    """
+    Stream-combine sorted fixture shards into a single sorted fixture file.
+
+    The fixtures are never parsed: the shards are k-way merged by fixture name and their
+    serialized entries copied over, so the result is identical to writing all the fixtures with
+    `Fixtures.collect_into_file`. An existing file at `file_path` is merged as well and, if a name
+    appears more than once, the entry of the last shard is kept.
+    """
+    sources = ([file_path] if file_path.exists() else []) + shard_paths
+    merged = heapq.merge(
+        *(iter_fixture_file_entries(path) for path in sources), key=lambda e: e[0]
+    )
+    tmp_file_path = file_path.with_name(file_path.name + ".merging")
+    with open(tmp_file_path, "w") as f:
+        previous: Tuple[str, str] | None = None
+        count = 0
+        for entry in merged:
+            if previous is not None and previous[0] != entry[0]:
+                f.write(("{\n" if count == 0 else ",\n") + previous[1])
+                count += 1
+            previous = entry
+        if previous is not None:
+            f.write(("{\n" if count == 0 else ",\n") + previous[1] + "\n}")
+        else:
+            f.write("{}")
+    os.replace(tmp_file_path, file_path)
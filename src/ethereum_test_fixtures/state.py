@@ -1,6 +1,6 @@
 """StateTest types."""
 
-from typing import ClassVar, List, Mapping, Sequence
+from typing import Annotated, ClassVar, List, Mapping, Sequence
 
 from pydantic import BaseModel, Field
 
@@ -23,6 +23,7 @@ from ethereum_test_types.transaction_types import (
 
 from .base import BaseFixture
 from .common import FixtureAuthorizationTuple, FixtureBlobSchedule
+from .store import StoredField
 
 
 class FixtureEnvironment(EnvironmentGeneric[ZeroPaddedHexNumber]):
@@ -96,7 +97,7 @@ class StateFixture(BaseFixture):
     description: ClassVar[str] = "Tests that generate a state test fixture."
 
     env: FixtureEnvironment
-    pre: Alloc
+    pre: Annotated[Alloc, StoredField]
     transaction: FixtureTransaction
     post: Mapping[Fork, List[FixtureForkPost]]
     config: FixtureConfig
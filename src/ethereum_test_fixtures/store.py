@@ -0,0 +1,182 @@
+"""Content-addressed store of the large fields shared by many fixtures."""
+
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, ClassVar, Dict, Optional
+
+from Crypto.Hash import keccak
+from pydantic import ValidationInfo, WrapValidator
+from pydantic_core.core_schema import ValidatorFunctionWrapHandler
+
+STORE_DIR_NAME = ".store"
+STORE_REFERENCE_KEY = "$ref"
+STORE_FIELDS = ("pre", "postState", "genesisRLP")
+"""JSON names of the fixture fields that are moved to the store."""
+STORE_MIN_SIZE = 512
+"""Minimum size of the canonical JSON of a field value for it to be moved to the store."""
+STORE_CACHE_SIZE = 64
+
+
+def is_store_reference(value: Any) -> bool:
+    """Return True if the JSON value is a reference to a value of a fixture store."""
+    return isinstance(value, dict) and len(value) == 1 and STORE_REFERENCE_KEY in value
+
+
+class FixtureStore:
+    """
+    Content-addressed store of the large fields of the fixtures of a directory.
+
+    The JSON value of a stored field is written once to `.store/<keccak>.json`, where `<keccak>`
+    is the keccak256 hash of the canonical JSON encoding of the value, and the fixtures reference
+    it as `{"$ref": "<keccak>"}`. The most recently read values are kept in memory.
+    """
+
+    stores: ClassVar[Dict[Path, "FixtureStore"]] = {}
+
+    def __init__(self, path: Path, cache_size: int = STORE_CACHE_SIZE):
+        """Open the store at `path`, the `.store` directory of a fixture directory."""
+        self.path = path
+        self.cache_size = cache_size
+        self.cache: OrderedDict[str, Any] = OrderedDict()
+
+    @classmethod
+    def open(cls, path: Path) -> "FixtureStore":
+        """Return the store at `path`, shared by all the fixtures loaded by the process."""
+        path = path.absolute()
+        if path not in cls.stores:
+            cls.stores[path] = cls(path)
+        return cls.stores[path]
+
+    @classmethod
+    def find(cls, fixture_path: Path) -> Optional["FixtureStore"]:
+        """
+        Return the store of the fixture directory that contains `fixture_path`, if any.
+
+        The parent directories are searched up to the first one with a `.store` or a `.meta`
+        directory, the root of a fixture directory.
+        """
+        for directory in fixture_path.absolute().parents:
+            if (directory / STORE_DIR_NAME).is_dir():
+                return cls.open(directory / STORE_DIR_NAME)
+            if (directory / ".meta").is_dir():
+                return None
+        return None
+
+    def value_path(self, key: str) -> Path:
+        """Return the path of the file of a stored value."""
+        return self.path / f"{key}.json"
+
+    def get(self, key: str) -> Any:
+        """Return a stored value."""
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            return self.cache[key]
+        with open(self.value_path(key), "rb") as f:
+            value = json.load(f)
+        self.cache[key] = value
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return value
+
+    def put(self, value: Any) -> Dict[str, str]:
+        """Store a value, unless it is already stored, and return a reference to it."""
+        encoded = json.dumps(value, sort_keys=True, separators=(",", ":")).encode()
+        key = keccak.new(digest_bits=256, data=encoded).hexdigest()
+        value_path = self.value_path(key)
+        if not value_path.exists():
+            self.path.mkdir(parents=True, exist_ok=True)
+            tmp_path = value_path.with_name(f"{value_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(encoded)
+            os.replace(tmp_path, value_path)
+        return {STORE_REFERENCE_KEY: key}
+
+    def resolve(self, value: Any) -> Any:
+        """Return the stored value if `value` is a reference, otherwise `value` itself."""
+        if is_store_reference(value):
+            return self.get(value[STORE_REFERENCE_KEY])
+        return value
+
+    def dedup(self, fixture: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the JSON of a fixture with its large store fields replaced by references."""
+        deduped = dict(fixture)
+        for field in STORE_FIELDS:
+            value = fixture.get(field)
+            if value is None or is_store_reference(value):
+                continue
+            if len(json.dumps(value, separators=(",", ":"))) >= STORE_MIN_SIZE:
+                deduped[field] = self.put(value)
+        return deduped
+
+    def inflate(self, fixture: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the JSON of a fixture with its references replaced by the stored values."""
+        return {name: self.resolve(value) for name, value in fixture.items()}
+
+
+def _count_references(fixtures: Dict[str, Any]) -> int:
+    """Return the number of store references of the fixtures of a file."""
+    return sum(
+        is_store_reference(value) for fixture in fixtures.values() for value in fixture.values()
+    )
+
+
+def _rewrite_fixture_file(file_path: Path, fixtures: Dict[str, Any]) -> None:
+    """Atomically rewrite a fixture file, indented as written by the filler."""
+    tmp_path = file_path.with_name(f"{file_path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(fixtures, f, indent=4)
+    os.replace(tmp_path, file_path)
+
+
+def dedup_fixture_file(file_path: Path, store_path: Path) -> int:
+    """
+    Move the large fields of the fixtures of a file to the store at `store_path`, replacing them
+    with references, and return the number of fields moved.
+    """
+    store = FixtureStore.open(store_path)
+    with open(file_path, "r") as f:
+        fixtures = json.load(f)
+    deduped = {name: store.dedup(fixture) for name, fixture in fixtures.items()}
+    moved = _count_references(deduped) - _count_references(fixtures)
+    if moved:
+        _rewrite_fixture_file(file_path, deduped)
+    return moved
+
+
+def inflate_fixture_file(file_path: Path, store_path: Path) -> int:
+    """
+    Replace the references of the fixtures of a file by the values of the store at
+    `store_path`, and return the number of references replaced.
+    """
+    store = FixtureStore.open(store_path)
+    with open(file_path, "r") as f:
+        fixtures = json.load(f)
+    replaced = _count_references(fixtures)
+    if replaced:
+        _rewrite_fixture_file(
+            file_path, {name: store.inflate(fixture) for name, fixture in fixtures.items()}
+        )
+    return replaced
+
+
+def stored_field_validator(
+    value: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo
+) -> Any:
+    """Resolve a reference to the fixture store given in the validation context."""
+    if is_store_reference(value):
+        store: FixtureStore | None = info.context.get("fixture_store") if info.context else None
+        if store is None:
+            raise ValueError(
+                f"Field references the value {value[STORE_REFERENCE_KEY]} of a fixture store, "
+                'but no store was given in the validation context ("fixture_store").'
+            )
+        value = store.get(value[STORE_REFERENCE_KEY])
+    return handler(value)
+
+
+StoredField = WrapValidator(stored_field_validator)
+"""
+Annotation of a fixture field that can reference a value of a `FixtureStore`, resolved when the
+fixture is validated with `context={"fixture_store": store}`.
+"""
@@ -0,0 +1,42 @@
+"""Test the streaming fixture tarball writers and readers."""
+
+import gzip
+import io
+import random
+from pathlib import Path
+
+import pytest
+
+from ..archive import FixtureTarballWriter, ParallelGzipWriter, open_fixture_tarball
+
+
+@pytest.mark.parametrize("size", [0, 1000, 4096, 50_000])
+def test_parallel_gzip_writer(size: int):
+    """Test that the block-parallel gzip output decompresses to the written data."""
+    rng = random.Random(size)
+    data = bytes(rng.choice(b"0123456789abcdef\n ") for _ in range(size))
+    output = io.BytesIO()
+    writer = ParallelGzipWriter(output, threads=4, block_size=4096)
+    for i in range(0, size, 1000):
+        writer.write(data[i : i + 1000])
+    writer.close()
+    assert gzip.decompress(output.getvalue()) == data
+
+
+@pytest.mark.parametrize("suffix", [".tar.gz", ".tar.zst"])
+def test_fixture_tarball_round_trip(tmp_path: Path, suffix: str):
+    """Test that the fixture files added to a tarball are read back from it."""
+    if suffix == ".tar.zst":
+        pytest.importorskip("zstandard")
+    files = {f"fixtures/state_tests/test_{i}.json": f'{{"test_{i}": {{}}}}' for i in range(3)}
+    tarball_path = tmp_path / f"fixtures{suffix}"
+    with FixtureTarballWriter(tarball_path, threads=2) as writer:
+        for arcname, content in files.items():
+            file_path = tmp_path / Path(arcname).name
+            file_path.write_text(content)
+            writer.add(file_path, arcname=Path(arcname))
+
+    with open(tarball_path, "rb") as f, open_fixture_tarball(f) as tar:
+        tar.extractall(path=tmp_path / "extracted", filter="data")
+    for arcname, content in files.items():
+        assert (tmp_path / "extracted" / arcname).read_text() == content
@@ -1,5 +1,7 @@
 """Test cases for the ethereum_test_fixtures.base module."""
 
+from pathlib import Path
+
 import pytest
 
 from ..base import BaseFixture
@@ -7,6 +9,8 @@ from ..file import Fixtures
 from ..state import FixtureEnvironment, FixtureTransaction, StateFixture
 from ..transaction import FixtureResult, TransactionFixture
 
+FIXTURES_DIR = Path(__file__).parents[2] / "ethereum_test_specs" / "tests" / "fixtures"
+
 
 def test_json_dict():
     """Test that the json_dict property does not include the info field."""
@@ -56,3 +60,38 @@ def test_base_fixtures_parsing(fixture: BaseFixture):
     json_dump = fixture.json_dict_with_info()
     assert json_dump is not None
     Fixtures.model_validate({"fixture": json_dump})
+
+
+@pytest.mark.parametrize(
+    "fixture_file_name,lazy_fields",
+    [
+        (
+            "chainid_cancun_blockchain_test_tx_type_0.json",
+            {"pre", "post_state", "blocks"},
+        ),
+        (
+            "chainid_cancun_blockchain_test_engine_tx_type_0.json",
+            {"pre", "post_state", "payloads"},
+        ),
+        ("chainid_cancun_state_test_tx_type_0.json", set()),
+    ],
+)
+def test_lazy_fields(fixture_file_name: str, lazy_fields: set):
+    """Test that lazy fields are validated on first access and match the eager validation."""
+    json_text = (FIXTURES_DIR / fixture_file_name).read_text()
+    fixtures = Fixtures.model_validate_json(json_text)
+    lazy_fixtures = Fixtures.model_validate_json(json_text, context={"lazy": True})
+    fixture_name = next(iter(fixtures))
+    fixture, lazy_fixture = fixtures[fixture_name], lazy_fixtures[fixture_name]
+    assert type(lazy_fixture) is type(fixture)
+    assert set(lazy_fixture._lazy_values) == lazy_fields
+    assert not set(lazy_fixture.__dict__) & lazy_fields
+
+    if "pre" in lazy_fields:
+        assert lazy_fixture.field_json("pre") == fixture.field_json("pre")
+        assert lazy_fixture.pre == fixture.pre
+        assert "pre" not in lazy_fixture._lazy_values
+    # Serializing validates the remaining lazy fields and keeps the field order.
+    assert lazy_fixture.model_dump_json(by_alias=True) == fixture.model_dump_json(by_alias=True)
+    assert not lazy_fixture._lazy_values
+    assert Fixtures.model_validate_json(json_text, context={"lazy": True}) == fixtures
@@ -0,0 +1,84 @@
+"""Test the fixture collector."""
+
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import pytest
+
+from ..base import FixtureFormat
+from ..blockchain import BlockchainFixture
+from ..collector import FixtureCollector
+from ..collector import TestInfo as FixtureTestInfo
+from ..consume import FixtureConsumer
+from ..file import Fixtures
+from ..state import StateFixture
+
+
+class FileConsumer(FixtureConsumer):
+    """Consumer that records its calls and fails the fixtures whose name contains `fail`."""
+
+    fixture_formats = [BlockchainFixture]
+
+    def __init__(self):
+        """Initialize the list of consumed files."""
+        self.consumed_files: List[Path] = []
+
+    def consume_fixture(
+        self, fixture_format, fixture_path, fixture_name=None, debug_output_path=None
+    ):
+        """Fail, since the collector must only verify whole files."""
+        raise AssertionError("fixtures must be verified one file at a time")
+
+    def consume_fixture_file(
+        self, fixture_format, fixture_path, fixture_names, debug_output_path=None
+    ) -> Dict[str, str | None]:
+        """Record the call and fail the fixtures whose name contains `fail`."""
+        self.consumed_files.append(fixture_path)
+        results = [
+            {"name": name, "pass": "fail" not in name, "error": "boom"} for name in fixture_names
+        ]
+        return self.map_file_results(results, fixture_names)
+
+
+@pytest.fixture
+def collector(tmp_path: Path) -> FixtureCollector:
+    """Return a collector with two blockchain fixture files and one state fixture file."""
+    collector = FixtureCollector(
+        output_dir=tmp_path,
+        flat_output=False,
+        fill_static_tests=False,
+        single_fixture_per_file=False,
+        filler_path=tmp_path,
+    )
+    fixture_files: List[Tuple[str, FixtureFormat, List[str]]] = [
+        ("a.json", BlockchainFixture, ["a1", "a2", "a3"]),
+        ("b.json", BlockchainFixture, ["b1", "b2_fail"]),
+        ("c.json", StateFixture, ["c1_fail"]),
+    ]
+    for file_name, fixture_format, names in fixture_files:
+        collector.all_fixtures[tmp_path / file_name] = Fixtures.model_construct(
+            root={name: fixture_format.model_construct() for name in names}
+        )
+        collector.json_path_to_test_item[tmp_path / file_name] = FixtureTestInfo(
+            name=f"test_{file_name}[fork_Cancun]",
+            id=f"tests/test_{file_name}::test[fork_Cancun]",
+            original_name=f"test_{file_name}",
+            module_path=tmp_path / "tests" / "test_module.py",
+        )
+    return collector
+
+
+def test_verify_fixture_files_once_per_file(collector: FixtureCollector, tmp_path: Path):
+    """Test that each consumable file is verified once and failures are mapped to fixtures."""
+    consumer = FileConsumer()
+    with pytest.raises(Exception, match="Fixture verification failed") as exc_info:
+        collector.verify_fixture_files(consumer)
+    assert consumer.consumed_files == [tmp_path / "a.json", tmp_path / "b.json"]
+    assert str(exc_info.value).splitlines()[1:] == [f"{tmp_path / 'b.json'}::b2_fail: boom"]
+
+
+def test_verify_fixture_files_process_pool(collector: FixtureCollector, tmp_path: Path):
+    """Test that verifying the files in a process pool yields the same failures."""
+    with pytest.raises(Exception, match="Fixture verification failed") as exc_info:
+        collector.verify_fixture_files(FileConsumer(), workers=2)
+    assert str(exc_info.value).splitlines()[1:] == [f"{tmp_path / 'b.json'}::b2_fail: boom"]
@@ -0,0 +1,99 @@
+"""Test the fixture file helpers."""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from ..file import (
+    Fixtures,
+    iter_fixture_file_entries,
+    iter_fixture_file_spans,
+    merge_fixture_shards,
+)
+
+STATE_FIXTURE_FILE = (
+    Path(__file__).parents[2]
+    / "ethereum_test_specs"
+    / "tests"
+    / "fixtures"
+    / "chainid_cancun_state_test_tx_type_0.json"
+)
+
+
+def write_fixture_file(path: Path, fixtures: Dict[str, Any]):
+    """Write a fixture file the same way `Fixtures.collect_into_file` does."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(dict(sorted(fixtures.items())), f, indent=4)
+
+
+def fixture(name: str) -> Dict[str, Any]:
+    """Return a nested fixture-like JSON object."""
+    return {
+        "_info": {"hash": "0x" + name.encode().hex(), "comment": 'a "quoted"\n    "line"'},
+        "blocks": [{"rlp": "0x00", "number": 1}, {"rlp": "0x01", "number": []}],
+        "empty": {},
+    }
+
+
+def test_iter_fixture_file_entries(tmp_path: Path):
+    """Test that the entries of a fixture file are yielded in order without parsing them."""
+    fixtures = {name: fixture(name) for name in ["b", "a", "c"]}
+    write_fixture_file(tmp_path / "f.json", fixtures)
+    entries = list(iter_fixture_file_entries(tmp_path / "f.json"))
+    assert [name for name, _ in entries] == ["a", "b", "c"]
+    for name, text in entries:
+        assert json.loads("{" + text + "}") == {name: fixtures[name]}
+
+
+def test_iter_fixture_file_spans(tmp_path: Path):
+    """Test that the byte span of each fixture value is found within the file."""
+    fixtures = {name: fixture(name) for name in ["b", "a", "c"]}
+    fixtures["d"] = {}
+    with open(tmp_path / "f.json", "w") as f:
+        # Non-ASCII characters make byte and character offsets differ.
+        json.dump({"ä/é": fixture("x"), **fixtures}, f, indent=4, ensure_ascii=False)
+    data = (tmp_path / "f.json").read_bytes()
+    spans = list(iter_fixture_file_spans(tmp_path / "f.json"))
+    assert [name for name, _, _ in spans] == ["ä/é", "b", "a", "c", "d"]
+    for name, offset, length in spans:
+        assert (
+            json.loads(data[offset : offset + length]) == {**fixtures, "ä/é": fixture("x")}[name]
+        )
+
+
+@pytest.mark.parametrize(
+    "shards",
+    [
+        pytest.param([["a", "c"], ["b", "d"]], id="interleaved"),
+        pytest.param([["a"], [], ["b", "c", "d"]], id="empty_shard"),
+        pytest.param([["a", "b"], ["b", "c"]], id="duplicate"),
+        pytest.param([[]], id="all_empty"),
+    ],
+)
+def test_merge_fixture_shards(tmp_path: Path, shards: List[List[str]]):
+    """Test that merging shards yields the same file as collecting all fixtures at once."""
+    shard_paths = []
+    all_fixtures: Dict[str, Any] = {}
+    for i, names in enumerate(shards):
+        shard_fixtures = {name: fixture(name + str(i)) for name in names}
+        all_fixtures.update(shard_fixtures)
+        shard_paths.append(tmp_path / f"shard-{i}" / "f.json")
+        write_fixture_file(shard_paths[-1], shard_fixtures)
+
+    merge_fixture_shards(shard_paths, tmp_path / "merged.json")
+    write_fixture_file(tmp_path / "expected.json", all_fixtures)
+    assert (tmp_path / "merged.json").read_text() == (tmp_path / "expected.json").read_text()
+    assert not (tmp_path / "merged.json.merging").exists()
+
+
+def test_write_shard_twice(tmp_path: Path):
+    """Test that writing to an existing shard merges the fixtures instead of replacing them."""
+    fixture = next(iter(Fixtures.model_validate_json(STATE_FIXTURE_FILE.read_text()).values()))
+    shard_path = tmp_path / "f.json"
+    Fixtures({"b": fixture, "c": fixture}).write_shard(shard_path)
+    Fixtures({"a": fixture}).write_shard(shard_path)
+    assert [name for name, _ in iter_fixture_file_entries(shard_path)] == ["a", "b", "c"]
+    assert list(tmp_path.iterdir()) == [shard_path]
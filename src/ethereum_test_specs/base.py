@@ -5,7 +5,7 @@ from abc import abstractmethod
 from functools import reduce
 from os import path
 from pathlib import Path
-from typing import Callable, ClassVar, Dict, Generator, List, Sequence, Type
+from typing import Any, Callable, ClassVar, Dict, Generator, List, Sequence, Type
 
 import pytest
 from pydantic import BaseModel, Field, PrivateAttr
@@ -55,6 +55,10 @@ class BaseTest(BaseModel):
     tag: str = ""
 
     _request: pytest.FixtureRequest | None = PrivateAttr(None)
+    _built_chains: Dict[str, Any] | None = PrivateAttr(None)
+    """
+    Memo of built chains shared among the fixture formats of the same test, if provided.
+    """
 
     spec_types: ClassVar[Dict[str, Type["BaseTest"]]] = {}
 
@@ -101,6 +105,7 @@ class BaseTest(BaseModel):
             **kwargs,
         )
         new_instance._request = base_test._request
+        new_instance._built_chains = base_test._built_chains
         return new_instance
 
     @classmethod
@@ -1,5 +1,6 @@
 """Ethereum blockchain test spec definition and filler."""
 
+import hashlib
 import warnings
 from pprint import pprint
 from typing import Any, Callable, ClassVar, Dict, Generator, List, Optional, Sequence, Tuple, Type
@@ -7,7 +8,12 @@ from typing import Any, Callable, ClassVar, Dict, Generator, List, Optional, Seq
 import pytest
 from pydantic import ConfigDict, Field, field_validator
 
-from ethereum_clis import BlockExceptionWithMessage, Result, TransitionTool
+from ethereum_clis import (
+    BlockExceptionWithMessage,
+    Result,
+    TransitionTool,
+    TransitionToolSession,
+)
 from ethereum_test_base_types import (
     Address,
     Bloom,
@@ -385,6 +391,33 @@ class BuiltBlock(CamelModel):
         )
 
 
+class BuiltChain(CamelModel):
+    """
+    Model that contains the genesis block and all blocks built on top of it for a given
+    blockchain test and fork.
+    """
+
+    pre: Alloc
+    genesis: FixtureBlock
+    blocks: List[BuiltBlock]
+    post: Alloc
+    """
+    Alloc after the last valid block.
+    """
+    env: Environment
+    """
+    Environment to build a new block on top of the last valid block.
+    """
+    head: Hash
+    """
+    Hash of the last valid block.
+    """
+    info_metadata: Dict[str, Any] = Field(default_factory=dict)
+    """
+    `_info` metadata returned by the transition tool when the chain was built.
+    """
+
+
 class BlockchainTest(BaseTest):
     """Filler type that tests multiple blocks (valid or invalid) in a chain."""
 
@@ -471,8 +504,14 @@ class BlockchainTest(BaseTest):
         block: Block,
         previous_env: Environment,
         previous_alloc: Alloc,
+        session: TransitionToolSession | None = None,
     ) -> BuiltBlock:
-        """Generate common block data for both make_fixture and make_hive_fixture."""
+        """
+        Generate common block data for both make_fixture and make_hive_fixture.
+
+        If a transition tool session is given, the state of consecutive blocks is kept by the
+        transition tool between calls, if supported.
+        """
         env = block.set_environment(previous_env)
         env = env.set_fork_requirements(fork)
 
@@ -506,6 +545,7 @@ class BlockchainTest(BaseTest):
                 chain_id=self.chain_id,
                 reward=fork.get_reward(env.number, env.timestamp),
                 blob_schedule=fork.blob_schedule(),
+                session=session,
             ),
             debug_output_path=self.get_next_transition_tool_output_path(),
             slow_request=self.is_tx_gas_heavy_test(),
@@ -627,13 +667,27 @@ class BlockchainTest(BaseTest):
             print_traces(t8n.get_traces())
             raise e
 
-    def make_fixture(
+    def build_chain(
         self,
         t8n: TransitionTool,
         fork: Fork,
-    ) -> BlockchainFixture:
-        """Create a fixture from the blockchain test definition."""
-        fixture_blocks: List[FixtureBlock | InvalidFixtureBlock] = []
+    ) -> BuiltChain:
+        """
+        Build all the blocks of the test on top of the genesis block and verify the results.
+
+        If a memo of built chains was provided, the chain is built only once and then shared by
+        all the fixture formats filled for the same test definition and fork.
+        """
+        chain_key: str | None = None
+        if self._built_chains is not None:
+            chain_key = hashlib.sha256(
+                f"{fork.name()}:{self.model_dump_json()}".encode()
+            ).hexdigest()
+            if (built_chain := self._built_chains.get(chain_key)) is not None:
+                t8n._info_metadata = built_chain.info_metadata
+                return built_chain
+
+        built_blocks: List[BuiltBlock] = []
 
         pre, genesis = BlockchainTest.make_genesis(self.genesis_environment, self.pre, fork)
 
@@ -641,39 +695,63 @@ class BlockchainTest(BaseTest):
         env = environment_from_parent_header(genesis.header)
         head = genesis.header.block_hash
         invalid_blocks = 0
-        for block in self.blocks:
-            # This is the most common case, the RLP needs to be constructed
-            # based on the transactions to be included in the block.
-            # Set the environment according to the block to execute.
-            built_block = self.generate_block_data(
-                t8n=t8n,
-                fork=fork,
-                block=block,
-                previous_env=env,
-                previous_alloc=alloc,
-            )
-            fixture_blocks.append(built_block.get_fixture_block())
-            if block.exception is None:
-                # Update env, alloc and last block hash for the next block.
-                alloc = built_block.alloc
-                env = apply_new_parent(built_block.env, built_block.header)
-                head = built_block.header.block_hash
-            else:
-                invalid_blocks += 1
-
-            if block.expected_post_state:
-                self.verify_post_state(
-                    t8n, t8n_state=alloc, expected_state=block.expected_post_state
+        with t8n.session() as session:
+            for block in self.blocks:
+                # This is the most common case, the RLP needs to be constructed
+                # based on the transactions to be included in the block.
+                # Set the environment according to the block to execute.
+                built_block = self.generate_block_data(
+                    t8n=t8n,
+                    fork=fork,
+                    block=block,
+                    previous_env=env,
+                    previous_alloc=alloc,
+                    session=session,
                 )
+                built_blocks.append(built_block)
+                if block.exception is None:
+                    # Update env, alloc and last block hash for the next block.
+                    alloc = built_block.alloc
+                    env = apply_new_parent(built_block.env, built_block.header)
+                    head = built_block.header.block_hash
+                else:
+                    invalid_blocks += 1
+
+                if block.expected_post_state:
+                    self.verify_post_state(
+                        t8n, t8n_state=alloc, expected_state=block.expected_post_state
+                    )
         self.check_exception_test(exception=invalid_blocks > 0)
         self.verify_post_state(t8n, t8n_state=alloc)
+
+        built_chain = BuiltChain(
+            pre=pre,
+            genesis=genesis,
+            blocks=built_blocks,
+            post=alloc,
+            env=env,
+            head=head,
+            info_metadata=t8n._info_metadata or {},
+        )
+        if chain_key is not None and self._built_chains is not None:
+            self._built_chains[chain_key] = built_chain
+        return built_chain
+
+    def make_fixture(
+        self,
+        t8n: TransitionTool,
+        fork: Fork,
+    ) -> BlockchainFixture:
+        """Create a fixture from the blockchain test definition."""
+        chain = self.build_chain(t8n, fork)
+        alloc = chain.post
         return BlockchainFixture(
             fork=fork,
-            genesis=genesis.header,
-            genesis_rlp=genesis.rlp,
-            blocks=fixture_blocks,
-            last_block_hash=head,
-            pre=pre,
+            genesis=chain.genesis.header,
+            genesis_rlp=chain.genesis.rlp,
+            blocks=[built_block.get_fixture_block() for built_block in chain.blocks],
+            last_block_hash=chain.head,
+            pre=chain.pre,
             post_state=alloc if not self.exclude_full_post_state_in_output else None,
             post_state_hash=alloc.state_root() if self.exclude_full_post_state_in_output else None,
             config=FixtureConfig(
@@ -690,44 +768,24 @@ class BlockchainTest(BaseTest):
         fixture_format: FixtureFormat = BlockchainEngineFixture,
     ) -> BlockchainEngineFixture | BlockchainEngineXFixture:
         """Create a hive fixture from the blocktest definition."""
-        fixture_payloads: List[FixtureEngineNewPayload] = []
-
-        pre, genesis = BlockchainTest.make_genesis(self.genesis_environment, self.pre, fork)
-        alloc = pre
-        env = environment_from_parent_header(genesis.header)
-        head_hash = genesis.header.block_hash
-        invalid_blocks = 0
-        for block in self.blocks:
-            built_block = self.generate_block_data(
-                t8n=t8n,
-                fork=fork,
-                block=block,
-                previous_env=env,
-                previous_alloc=alloc,
-            )
-            fixture_payloads.append(built_block.get_fixture_engine_new_payload())
-            if block.exception is None:
-                alloc = built_block.alloc
-                env = apply_new_parent(built_block.env, built_block.header)
-                head_hash = built_block.header.block_hash
-            else:
-                invalid_blocks += 1
-
-            if block.expected_post_state:
-                self.verify_post_state(
-                    t8n, t8n_state=alloc, expected_state=block.expected_post_state
-                )
-        self.check_exception_test(exception=invalid_blocks > 0)
+        chain = self.build_chain(t8n, fork)
+        fixture_payloads: List[FixtureEngineNewPayload] = [
+            built_block.get_fixture_engine_new_payload() for built_block in chain.blocks
+        ]
+        genesis = chain.genesis
+        pre = chain.pre
+        alloc = chain.post
+        env = chain.env
+        head_hash = chain.head
+        last_header = chain.blocks[-1].header
         fcu_version = fork.engine_forkchoice_updated_version(
-            built_block.header.number, built_block.header.timestamp
+            last_header.number, last_header.timestamp
         )
         assert fcu_version is not None, (
             "A hive fixture was requested but no forkchoice update is defined."
             " The framework should never try to execute this test case."
         )
 
-        self.verify_post_state(t8n, t8n_state=alloc)
-
         sync_payload: Optional[FixtureEngineNewPayload] = None
         if self.verify_sync:
             # Test is marked for syncing verification.
@@ -1,11 +1,16 @@
 """Test spec debugging tools."""
 
 import pprint
-from typing import Dict, List
+from typing import Any, Dict, Iterable
 
 
-def print_traces(traces: List[List[List[Dict]]] | None):
-    """Print the traces from the transition tool for debugging."""
+def print_traces(traces: Iterable[Iterable[Iterable[Dict[str, Any]]]] | None):
+    """
+    Print the traces from the transition tool for debugging.
+
+    The traces of each transaction are consumed as iterators, so they are streamed from the
+    transition tool's trace store one step at a time.
+    """
     if traces is None:
         print("Traces not collected. Use `--traces` to see detailed execution information.")
         return
@@ -908,3 +908,46 @@ def test_fill_blockchain_invalid_txs(
     assert fixture_name in fixture
     assert fixture_name in expected
     assert fixture[fixture_name] == expected[fixture_name]
+
+
+def test_built_chain_shared_among_formats(
+    monkeypatch: pytest.MonkeyPatch, default_t8n: TransitionTool
+):
+    """Test that the blocks built for one fixture format are reused by the other formats."""
+    fork = Cancun
+    sender = Address(0xA94F5374FCE5EDBC8E2A8697C15331677E6EBF0B)
+    test_kwargs: Mapping[str, Any] = {
+        "pre": Alloc({sender: Account(balance=0x0BA1A9CE0BA1A9CE)}),
+        "post": {},
+        "blocks": [Block(txs=[Transaction(to=Address(0xC0DE), value=1, nonce=0)])],
+    }
+
+    evaluate_calls = 0
+    original_evaluate = default_t8n.evaluate
+
+    def counting_evaluate(**kwargs):
+        nonlocal evaluate_calls
+        evaluate_calls += 1
+        return original_evaluate(**kwargs)
+
+    monkeypatch.setattr(default_t8n, "evaluate", counting_evaluate)
+
+    built_chains: dict = {}
+    shared_fixtures = {}
+    fixture_formats: List[FixtureFormat] = [BlockchainFixture, BlockchainEngineFixture]
+    for fixture_format in fixture_formats:
+        blockchain_test = BlockchainTest(**test_kwargs)
+        blockchain_test._built_chains = built_chains
+        shared_fixtures[fixture_format] = blockchain_test.generate(
+            t8n=default_t8n, fork=fork, fixture_format=fixture_format
+        )
+    assert evaluate_calls == 1
+    assert len(built_chains) == 1
+
+    for fixture_format, shared_fixture in shared_fixtures.items():
+        fixture = BlockchainTest(**test_kwargs).generate(
+            t8n=default_t8n, fork=fork, fixture_format=fixture_format
+        )
+        assert fixture.json_dict_with_info(hash_only=True) == shared_fixture.json_dict_with_info(
+            hash_only=True
+        )
@@ -1,30 +1,65 @@
 """A pytest plugin providing common functionality for consuming test fixtures."""
 
+import hashlib
+import io
+import os
 import re
+import shutil
 import sys
 import tarfile
 from dataclasses import dataclass
-from io import BytesIO
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Generator, Iterator, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import platformdirs
 import pytest
 import requests
 import rich
-
+from _pytest.mark import MarkMatcher
+from _pytest.mark.expression import Expression
+from filelock import FileLock
+from pydantic import TypeAdapter
+
+from cli.fixtures_delta import (
+    DELTA_MANIFEST_NAME,
+    FixturesDelta,
+    FixturesDeltaError,
+    apply_fixtures_delta,
+)
 from cli.gen_index import generate_fixtures_index
 from ethereum_test_fixtures import BaseFixture
-from ethereum_test_fixtures.consume import IndexFile, TestCases
-from ethereum_test_forks import get_forks, get_relative_fork_markers, get_transition_forks
+from ethereum_test_fixtures.archive import open_fixture_tarball, strip_tarball_suffix
+from ethereum_test_fixtures.consume import (
+    INDEX_DATABASE_FILE_NAME,
+    IndexDatabase,
+    IndexFile,
+    TestCaseIndexFile,
+    TestCases,
+)
+from ethereum_test_fixtures.store import STORE_DIR_NAME
+from ethereum_test_forks import (
+    Fork,
+    get_forks,
+    get_relative_fork_markers,
+    get_transition_forks,
+)
 from ethereum_test_tools.utility.versioning import get_current_commit_hash_or_tag
 
-from .releases import ReleaseTag, get_release_page_url, get_release_url, is_release_url, is_url
+from .releases import (
+    ReleaseTag,
+    get_cached_release_asset_digest,
+    get_release_page_url,
+    get_release_url,
+    is_release_url,
+    is_url,
+)
 
 CACHED_DOWNLOADS_DIRECTORY = (
     Path(platformdirs.user_cache_dir("ethereum-execution-spec-tests")) / "cached_downloads"
 )
+DEFAULT_FIXTURE_CACHE_MB = 1024
+DOWNLOAD_CHUNK_SIZE = 1 << 16
 
 
 def default_input() -> str:
@@ -43,14 +78,50 @@ def default_html_report_file_path() -> str:
     return ".meta/report_consume.html"
 
 
+class DigestMismatchError(Exception):
+    """Raised when a downloaded archive does not match its published digest."""
+
+    def __init__(self, url: str, expected: str, actual: str):  # noqa: D107
+        super().__init__(
+            f"The archive downloaded from {url} does not match its published digest: "
+            f"{actual} != {expected}"
+        )
+
+
+class DownloadStream(io.RawIOBase):
+    """Readable stream over the chunks of a download that hashes the bytes as they are read."""
+
+    def __init__(self, chunks: Iterator[bytes], hasher: "hashlib._Hash"):  # noqa: D107
+        self.chunks = chunks
+        self.hasher = hasher
+        self.buffer = memoryview(b"")
+
+    def readable(self) -> bool:  # noqa: D102
+        return True
+
+    def readinto(self, b) -> int:  # noqa: D102
+        while not self.buffer:
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                return 0
+            self.hasher.update(chunk)
+            self.buffer = memoryview(chunk)
+        size = min(len(b), len(self.buffer))
+        b[:size] = self.buffer[:size]
+        self.buffer = self.buffer[size:]
+        return size
+
+
 class FixtureDownloader:
     """Handles downloading and extracting fixture archives."""
 
-    def __init__(self, url: str, base_directory: Path):  # noqa: D107
+    def __init__(self, url: str, base_directory: Path, digest: Optional[str] = None):  # noqa: D107
         self.url = url
         self.base_directory = base_directory
+        self.digest = digest
         self.parsed_url = urlparse(url)
-        self.archive_name = self.strip_archive_extension(Path(self.parsed_url.path).name)
+        self.archive_file_name = Path(self.parsed_url.path).name
+        self.archive_name = self.strip_archive_extension(self.archive_file_name)
 
     @property
     def extract_to(self) -> Path:
@@ -61,12 +132,33 @@ class FixtureDownloader:
             return self.base_directory / self.org_repo / version / self.archive_name
         return self.base_directory / "other" / self.archive_name
 
+    @property
+    def partial_path(self) -> Path:
+        """Path to the file the archive is downloaded to, kept to resume an interrupted one."""
+        return self.extract_to.parent / f"{self.archive_file_name}.partial"
+
+    @property
+    def lock_path(self) -> Path:
+        """Path to the lock file held while the archive is downloaded and extracted."""
+        return self.extract_to.parent / f"{self.archive_file_name}.lock"
+
     def download_and_extract(self) -> Tuple[bool, Path]:
-        """Download the URL and extract it locally if it hasn't already been downloaded."""
+        """
+        Download the URL and extract it locally if it hasn't already been downloaded.
+
+        The download is done under a file lock, so that processes starting at the same time,
+        e.g. xdist workers, wait for a single download and then use its extracted directory.
+        """
         if self.extract_to.exists():
             return True, self.detect_extracted_directory()
 
-        return False, self.fetch_and_extract()
+        self.extract_to.parent.mkdir(parents=True, exist_ok=True)
+        with FileLock(self.lock_path):
+            if self.extract_to.exists():
+                return True, self.detect_extracted_directory()
+            if self.fetch_and_apply_delta():
+                return False, self.detect_extracted_directory()
+            return False, self.fetch_and_extract()
 
     def extract_github_repo(self) -> str:
         """Extract <username>/<repo> from GitHub URLs, otherwise return 'other'."""
@@ -79,25 +171,181 @@ class FixtureDownloader:
 
     @staticmethod
     def strip_archive_extension(filename: str) -> str:
-        """Remove .tar.gz or .tgz extensions from filename."""
-        return filename.removesuffix(".tar.gz").removesuffix(".tgz")
+        """Remove .tar.gz, .tgz or .tar.zst extensions from filename."""
+        return strip_tarball_suffix(filename)
 
-    def fetch_and_extract(self) -> Path:
-        """Download and extract an archive from the given URL."""
-        self.extract_to.mkdir(parents=True, exist_ok=False)
-        response = requests.get(self.url)
-        response.raise_for_status()
+    def published_digest(self) -> Optional[str]:
+        """
+        Return the digest published for the archive, as `<algorithm>:<hex>`.
 
-        with tarfile.open(fileobj=BytesIO(response.content), mode="r:gz") as tar:
-            tar.extractall(path=self.extract_to, filter="data")
+        This is the digest given to the downloader, the digest of the GitHub release asset if
+        the release information is cached, or the content of a `<url>.sha256` file published
+        next to the archive, as written by `sha256sum`.
+        """
+        if self.digest is not None:
+            return self.digest
+        if (digest := get_cached_release_asset_digest(self.url)) is not None:
+            return digest
+        response = requests.get(f"{self.url}.sha256")
+        if response.ok and (fields := response.text.split()):
+            return f"sha256:{fields[0]}"
+        return None
+
+    def iter_archive_chunks(self) -> Generator[bytes, None, None]:
+        """
+        Yield the bytes of the archive in chunks, appending the downloaded chunks to the partial
+        file as they arrive.
+
+        If a previous download was interrupted, the bytes of its partial file are yielded first
+        and only the rest of the archive is requested, with an HTTP Range request; the download
+        starts over if the server does not support ranges.
+        """
+        offset = self.partial_path.stat().st_size if self.partial_path.exists() else 0
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        with requests.get(self.url, headers=headers, stream=True) as response:
+            # 416: the partial file already holds the whole archive.
+            if not offset or response.status_code not in (206, 416):
+                response.raise_for_status()
+                offset = 0
+            with open(self.partial_path, "r+b" if offset else "wb") as f:
+                while f.tell() < offset:
+                    yield f.read(min(DOWNLOAD_CHUNK_SIZE, offset - f.tell()))
+                if response.status_code == 416:
+                    return
+                for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+                    yield chunk
 
+    def fetch_and_extract(self) -> Path:
+        """
+        Download and extract an archive from the given URL.
+
+        The extracted directory is only moved into place once the archive is complete and matches
+        its published digest, if any; the partial download is kept if the download is
+        interrupted.
+        """
+        extracting_path = self.extract_to.with_name(f"{self.extract_to.name}.extracting")
+        self.extract_archive(extracting_path)
+        extracting_path.mkdir(exist_ok=True)
+        os.replace(extracting_path, self.extract_to)
         return self.detect_extracted_directory()
 
+    def extract_archive(self, path: Path) -> None:
+        """
+        Download the archive and extract it to `path` while it is downloaded, hashing it as well.
+
+        If the archive does not match its published digest, the extracted files are removed and
+        a `DigestMismatchError` is raised. The partial download is only kept if the download is
+        interrupted, not if the archive fails to extract.
+        """
+        digest = self.published_digest()
+        algorithm = digest.partition(":")[0] if digest is not None else "sha256"
+        hasher = hashlib.new(algorithm)
+        shutil.rmtree(path, ignore_errors=True)
+
+        chunks = self.iter_archive_chunks()
+        try:
+            stream = io.BufferedReader(DownloadStream(chunks, hasher), DOWNLOAD_CHUNK_SIZE)
+            with open_fixture_tarball(stream) as tar:
+                tar.extractall(path=path, filter="data")
+            # Read the end of the archive after the tarball, so that it is hashed as well.
+            while stream.read(DOWNLOAD_CHUNK_SIZE):
+                pass
+        except requests.exceptions.RequestException:
+            # The download was interrupted: keep the partial file to resume it.
+            raise
+        except Exception:
+            # The archive itself is broken, e.g. `tarfile.TarError`: resuming it is pointless.
+            chunks.close()
+            shutil.rmtree(path, ignore_errors=True)
+            self.partial_path.unlink(missing_ok=True)
+            raise
+        finally:
+            chunks.close()
+
+        self.partial_path.unlink()
+        actual_digest = f"{algorithm}:{hasher.hexdigest()}"
+        if digest is not None and actual_digest != digest.lower():
+            shutil.rmtree(path, ignore_errors=True)
+            raise DigestMismatchError(self.url, digest, actual_digest)
+
+    def cached_base_release(self) -> Optional[Path]:
+        """
+        Return the extracted directory of the most recently cached other release of the archive,
+        if any; only archives of releases, cached by version, have one.
+        """
+        if not is_release_url(self.url):
+            return None
+        cached_releases = [
+            path
+            for path in self.extract_to.parent.parent.glob(f"*/{self.archive_name}")
+            if path.is_dir() and path != self.extract_to
+        ]
+        if not cached_releases:
+            return None
+        return max(cached_releases, key=lambda path: path.stat().st_mtime)
+
+    def delta_url(self, base_version: str) -> str:
+        """
+        Return the URL of the delta archive from a release to the release of the archive,
+        published next to it as `<archive name>.delta-<base version><archive suffix>`.
+        """
+        suffix = self.archive_file_name.removeprefix(self.archive_name)
+        return (
+            f"{self.url.removesuffix(self.archive_file_name)}"
+            f"{self.archive_name}.delta-{base_version}{suffix}"
+        )
+
+    def fetch_and_apply_delta(self) -> bool:
+        """
+        Build the release of the archive from the most recently cached release of the same
+        archive and the delta archive between them, if one is published, and return whether it
+        succeeded.
+
+        The delta archive is verified against its published digest, if any, and the root hashes
+        of the base and of the resulting fixtures against the manifest of the delta; the full
+        archive is downloaded instead if any of this fails.
+        """
+        base = self.cached_base_release()
+        if base is None:
+            return False
+        delta_downloader = FixtureDownloader(self.delta_url(base.parent.name), self.base_directory)
+        delta_path = self.extract_to.with_name(f"{self.extract_to.name}.delta")
+        extracting_path = self.extract_to.with_name(f"{self.extract_to.name}.extracting")
+        try:
+            delta_downloader.extract_archive(delta_path)
+            delta = FixturesDelta.model_validate_json(
+                (delta_path / DELTA_MANIFEST_NAME).read_bytes()
+            )
+            shutil.rmtree(extracting_path, ignore_errors=True)
+            apply_fixtures_delta(
+                base / delta.directory, delta_path, extracting_path / delta.directory
+            )
+        except (
+            requests.exceptions.RequestException,
+            DigestMismatchError,
+            FixturesDeltaError,
+            tarfile.TarError,
+            ValueError,
+            OSError,
+        ):
+            shutil.rmtree(extracting_path, ignore_errors=True)
+            delta_downloader.partial_path.unlink(missing_ok=True)
+            return False
+        finally:
+            shutil.rmtree(delta_path, ignore_errors=True)
+        os.replace(extracting_path, self.extract_to)
+        return True
+
     def detect_extracted_directory(self) -> Path:
         """
         Detect a single top-level dir within the extracted archive, otherwise return extract_to.
         """  # noqa: D200
-        extracted_dirs = [d for d in self.extract_to.iterdir() if d.is_dir() and d.name != ".meta"]
+        extracted_dirs = [
+            d
+            for d in self.extract_to.iterdir()
+            if d.is_dir() and d.name not in {".meta", STORE_DIR_NAME}
+        ]
         return extracted_dirs[0] if len(extracted_dirs) == 1 else self.extract_to
 
 
@@ -252,7 +500,8 @@ def pytest_addoption(parser):  # noqa: D103
         default=None,
         help=(
             "Specify the JSON test fixtures source. Can be a local directory, a URL pointing to a "
-            " fixtures.tar.gz archive, a release name and version in the form of `NAME@v1.2.3` "
+            " fixtures.tar.gz (or fixtures.tar.zst) archive, a release name and version in the "
+            "form of `NAME@v1.2.3` "
             "(`stable` and `develop` are valid release names, and `latest` is a valid version), "
             "or the special keyword 'stdin'. "
             f"Defaults to the following local directory: '{default_input()}'."
@@ -296,6 +545,17 @@ def pytest_addoption(parser):  # noqa: D103
             "To list all available test case IDs, set the value to `collectonly`."
         ),
     )
+    consume_group.addoption(
+        "--fixture-cache-mb",
+        action="store",
+        dest="fixture_cache_mb",
+        type=int,
+        default=DEFAULT_FIXTURE_CACHE_MB,
+        help=(
+            "Memory budget in MB of the cache of parsed fixture files; least recently used files "
+            f"are evicted once exceeded. Default: {DEFAULT_FIXTURE_CACHE_MB}."
+        ),
+    )
 
 
 @pytest.hookimpl(tryfirst=True)
@@ -344,8 +604,10 @@ def pytest_configure(config):  # noqa: D103
         config.test_cases = TestCases.from_stream(sys.stdin)
         return
     index_file = config.fixtures_source.path / ".meta" / "index.json"
-    index_file.parent.mkdir(parents=True, exist_ok=True)
-    if not index_file.exists():
+    if hasattr(config, "workerinput"):
+        # The index was (re)generated by the xdist controller before starting the workers.
+        pass
+    elif not index_file.exists():
         rich.print(f"Generating index file [bold cyan]{index_file}[/]...")
         generate_fixtures_index(
             config.fixtures_source.path,
@@ -353,9 +615,28 @@ def pytest_configure(config):  # noqa: D103
             force_flag=False,
             disable_infer_format=False,
         )
+    elif not os.access(index_file.parent, os.W_OK):
+        # A read-only fixture directory, e.g. a mounted release: use its index as is.
+        pass
+    else:
+        # Regenerate the index if the fixtures changed; the stat cache avoids re-reading the
+        # fixture files that did not.
+        generate_fixtures_index(
+            config.fixtures_source.path,
+            quiet_mode=True,
+            force_flag=False,
+            disable_infer_format=False,
+        )
 
-    index = IndexFile.model_validate_json(index_file.read_text())
-    config.test_cases = index.test_cases
+    index_database_file = index_file.with_name(INDEX_DATABASE_FILE_NAME)
+    if index_database_file.exists():
+        # The test cases are selected from the index database when generating tests.
+        config.index_database = IndexDatabase(index_database_file)
+        index_forks = config.index_database.forks
+    else:
+        index = IndexFile.model_validate_json(index_file.read_text())
+        config.test_cases = index.test_cases
+        index_forks = getattr(index, "forks", [])
 
     for fixture_format in BaseFixture.formats.values():
         config.addinivalue_line(
@@ -368,7 +649,7 @@ def pytest_configure(config):  # noqa: D103
         fork for fork in set(get_forks()) | get_transition_forks() if not fork.ignore()
     }
     # Append all forks within the index file (compatibility with `ethereum/tests`)
-    all_forks.update(getattr(index, "forks", []))
+    all_forks.update(index_forks)
     for fork in all_forks:
         config.addinivalue_line("markers", f"{fork}: Tests for the {fork} fork")
 
@@ -419,6 +700,65 @@ def fixtures_source(request) -> FixturesSource:  # noqa: D103
     return request.config.fixtures_source
 
 
+def get_test_case_marks(fork, format_name: str) -> List[pytest.MarkDecorator]:
+    """Return the fork and fixture format marks of a test case."""
+    fork_markers = get_relative_fork_markers(fork, strict_mode=False)
+    return [getattr(pytest.mark, m) for m in fork_markers] + [getattr(pytest.mark, format_name)]
+
+
+def select_test_cases(metafunc, index_database: IndexDatabase) -> List[TestCaseIndexFile]:
+    """
+    Select the test cases of a test function from the index database.
+
+    The supported fixture formats, the marker expression (`-m`, e.g. a fork) and the `--regex`
+    (or `--sim.limit`) pattern are evaluated in the database query, so that only the matching
+    test cases are validated and parametrized. The filters are still applied by pytest to the
+    collected items afterwards.
+    """
+    config = metafunc.config
+    fork_format_pairs = index_database.fork_format_pairs(config._supported_fixture_formats)
+
+    if config.option.markexpr:
+        expression = Expression.compile(config.option.markexpr)
+        own_marks = list(metafunc.definition.iter_markers())
+        fork_adapter: TypeAdapter = TypeAdapter(Fork)
+
+        def matches_markexpr(fork_name: str | None, format_name: str) -> bool:
+            try:
+                fork = fork_adapter.validate_python(fork_name)
+            except Exception:
+                fork = fork_name  # unknown to EEST, e.g. from `ethereum/tests`
+            marks = [mark.mark for mark in get_test_case_marks(fork, format_name)]
+            return expression.evaluate(MarkMatcher.from_markers(own_marks + marks))
+
+        fork_format_pairs = [pair for pair in fork_format_pairs if matches_markexpr(*pair)]
+
+    id_filter = None
+    regex = getattr(config.option, "dest_regex", ".*")
+    if regex != ".*":
+        # Reconstruct the possible node IDs of each test case, including the IDs of the
+        # parameters that are parametrized before (e.g. the fixture consumer) and after it
+        # (the hive client).
+        pattern = re.compile(regex)
+        prefixes = [callspec.id for callspec in metafunc._calls] or [""]
+        suffixes = [""]
+        if "client_type" in metafunc.fixturenames:
+            suffixes = [client.name for client in config.hive_execution_clients]
+
+        def id_filter(test_case_id: str) -> bool:
+            return any(
+                pattern.match(
+                    f"{metafunc.definition.nodeid}["
+                    + "-".join(part for part in (prefix, test_case_id, suffix) if part)
+                    + "]"
+                )
+                for prefix in prefixes
+                for suffix in suffixes
+            )
+
+    return index_database.select_test_cases(fork_format_pairs, id_filter=id_filter)
+
+
 def pytest_generate_tests(metafunc):
     """
     Generate test cases for every test fixture in all the JSON fixture files
@@ -427,17 +767,18 @@ def pytest_generate_tests(metafunc):
     if "cache" in sys.argv:
         return
 
-    test_cases = metafunc.config.test_cases
+    if hasattr(metafunc.config, "index_database"):
+        test_cases = select_test_cases(metafunc, metafunc.config.index_database)
+    else:
+        test_cases = metafunc.config.test_cases
     param_list = []
     for test_case in test_cases:
         if test_case.format.format_name not in metafunc.config._supported_fixture_formats:
             continue
-        fork_markers = get_relative_fork_markers(test_case.fork, strict_mode=False)
         param = pytest.param(
             test_case,
             id=test_case.id,
-            marks=[getattr(pytest.mark, m) for m in fork_markers]
-            + [getattr(pytest.mark, test_case.format.format_name)],
+            marks=get_test_case_marks(test_case.fork, test_case.format.format_name),
         )
         param_list.append(param)
 
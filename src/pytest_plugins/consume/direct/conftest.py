@@ -6,9 +6,11 @@ For example, via go-ethereum's `evm blocktest` or `evm statetest` commands.
 """
 
 import json
+import os
 import tempfile
 import warnings
 from pathlib import Path
+from typing import Generator
 
 import pytest
 
@@ -20,6 +22,8 @@ from ethereum_test_fixtures.consume import TestCaseIndexFile, TestCaseStream
 from ethereum_test_fixtures.file import Fixtures
 from pytest_plugins.consume.consume import FixturesSource
 
+from .fixture_file_consumption import FixtureFileConsumption, resolve_fixture_file
+
 
 class CollectOnlyCLI(EthereumCLI):
     """A dummy CLI for use with `--collect-only`."""
@@ -60,6 +64,28 @@ def pytest_addoption(parser):  # noqa: D103
         default=False,
         help="Collect traces of the execution information from the fixture consumer tool.",
     )
+    consume_group.addoption(
+        "--grouped",
+        action="store_true",
+        dest="consume_grouped",
+        default=False,
+        help=(
+            "Consume each fixture file once per fixture consumer, e.g. with a single "
+            "`evm blocktest <file>` call, and report the result of each test case from the "
+            "results of its file, instead of calling the consumer once per test case."
+        ),
+    )
+    consume_group.addoption(
+        "--grouped-workers",
+        action="store",
+        dest="consume_grouped_workers",
+        type=int,
+        default=None,
+        help=(
+            "Number of fixture files consumed concurrently with --grouped. "
+            "Default: the number of CPUs; files are only consumed on demand with xdist."
+        ),
+    )
     debug_group = parser.getgroup("debug", "Arguments defining debug behavior")
     debug_group.addoption(
         "--dump-dir",
@@ -103,6 +129,58 @@ def pytest_configure(config):  # noqa: D103
     config.fixture_consumers = fixture_consumers
 
 
+def pytest_itemcollected(item: pytest.Item):
+    """
+    With `--grouped`, mark the item with its fixture file, so that `--dist loadgroup` runs all
+    the test cases of a file on the xdist worker that consumes it.
+
+    The marks must be set before the `pytest_collection_modifyitems` hook of xdist reads them.
+    """
+    if not item.config.getoption("consume_grouped", False):
+        return
+    callspec = getattr(item, "callspec", None)
+    if callspec is None or "test_case" not in callspec.params:
+        return
+    group = FixtureFileConsumption.xdist_group(callspec.params["test_case"])
+    item.add_marker(pytest.mark.xdist_group(name=group))
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    """Add the selected test cases, in running order, to their fixture file consumption."""
+    if not config.getoption("consume_grouped", False):
+        return
+    # Under xdist, the fixture files of the next test cases may be run by other workers.
+    workers = config.getoption("consume_grouped_workers") or os.cpu_count() or 1
+    config.fixture_file_consumption = FixtureFileConsumption(
+        fixtures_source=config.fixtures_source,
+        work_dir=Path(tempfile.mkdtemp(prefix="consume_grouped_")),
+        workers=workers,
+        prefetch=not hasattr(config, "workerinput"),
+        base_dump_dir=config.getoption("base_dump_dir"),
+    )
+    for item in items:
+        callspec = getattr(item, "callspec", None)
+        if callspec is None or "test_case" not in callspec.params:
+            continue
+        config.fixture_file_consumption.add(
+            callspec.params["fixture_consumer"], callspec.params["test_case"]
+        )
+
+
+def pytest_unconfigure(config):
+    """Stop the workers of the fixture file consumption, if any."""
+    fixture_file_consumption = getattr(config, "fixture_file_consumption", None)
+    if fixture_file_consumption is not None:
+        fixture_file_consumption.shutdown()
+
+
+@pytest.fixture(scope="session")
+def fixture_file_consumption(request) -> FixtureFileConsumption | None:
+    """Return the grouped consumption of the fixture files, if enabled with `--grouped`."""
+    return getattr(request.config, "fixture_file_consumption", None)
+
+
 @pytest.fixture(scope="function")
 def test_dump_dir(request, fixture_path: Path, fixture_name: str) -> Path | None:
     """The directory to write evm debug output to."""
@@ -115,14 +193,30 @@ def test_dump_dir(request, fixture_path: Path, fixture_name: str) -> Path | None
     return base_dump_dir / fixture_path.stem / fixture_name.replace("/", "-")
 
 
+@pytest.fixture(scope="session")
+def inflated_fixtures_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Directory of the inflated copies of the fixture files that reference a fixture store."""
+    return tmp_path_factory.mktemp("inflated_fixtures")
+
+
 @pytest.fixture
-def fixture_path(test_case: TestCaseIndexFile | TestCaseStream, fixtures_source: FixturesSource):
+def fixture_path(
+    test_case: TestCaseIndexFile | TestCaseStream,
+    fixtures_source: FixturesSource,
+    inflated_fixtures_dir: Path,
+    fixture_file_consumption: FixtureFileConsumption | None,
+) -> Generator[Path, None, None]:
     """
     Path to the current JSON fixture file.
 
-    If the fixture source is stdin, the fixture is written to a temporary json file.
+    If the fixture source is stdin, the fixture is written to a temporary json file, or, with
+    `--grouped`, to the fixture file of all the test cases of its format. If the fixture
+    directory has a fixture store, the consumer tools are given a copy of the fixture file with
+    its references replaced by the stored values, made once per file.
     """
-    if fixtures_source.is_stdin:
+    if fixture_file_consumption is not None:
+        yield fixture_file_consumption.fixture_path(test_case)
+    elif fixtures_source.is_stdin:
         assert isinstance(test_case, TestCaseStream)
         temp_dir = tempfile.TemporaryDirectory()
         fixture_path = Path(temp_dir.name) / f"{test_case.id.replace('/', '_')}.json"
@@ -133,7 +227,7 @@ def fixture_path(test_case: TestCaseIndexFile | TestCaseStream, fixtures_source:
         temp_dir.cleanup()
     else:
         assert isinstance(test_case, TestCaseIndexFile)
-        yield fixtures_source.path / test_case.json_path
+        yield resolve_fixture_file(test_case, fixtures_source, inflated_fixtures_dir)
 
 
 @pytest.fixture(scope="function")
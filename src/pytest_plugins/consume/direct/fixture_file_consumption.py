@@ -0,0 +1,156 @@
+"""
+Grouped consumption of the fixture files of the collected test cases of `consume direct`.
+
+Instead of one consumer call per test case, each fixture file is consumed once per fixture
+consumer, e.g. with a single `evm blocktest <file>` call, and the result of each test case is
+picked from the per-test results reported for its file.
+"""
+
+import json
+import shutil
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from ethereum_test_base_types import to_json
+from ethereum_test_fixtures import FixtureConsumer
+from ethereum_test_fixtures.consume import TestCaseIndexFile, TestCaseStream
+from ethereum_test_fixtures.file import Fixtures
+from ethereum_test_fixtures.store import FixtureStore, inflate_fixture_file
+from pytest_plugins.consume.consume import FixturesSource
+
+TestCase = TestCaseIndexFile | TestCaseStream
+FixtureFileKey = Tuple[FixtureConsumer, str, str]
+"""Fixture consumer, fixture format name and fixture file (empty for stdin) of a test case."""
+
+
+def resolve_fixture_file(
+    test_case: TestCaseIndexFile, fixtures_source: FixturesSource, inflated_fixtures_dir: Path
+) -> Path:
+    """
+    Return the path of the fixture file of a test case to give to the consumer tools.
+
+    If the fixture directory has a fixture store, this is a copy of the fixture file with its
+    references replaced by the stored values, made once per file.
+    """
+    fixture_path = fixtures_source.path / test_case.json_path
+    store = FixtureStore.find(fixture_path)
+    if store is None:
+        return fixture_path
+    inflated_path = inflated_fixtures_dir / test_case.json_path
+    if not inflated_path.exists():
+        inflated_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy(fixture_path, inflated_path)
+        inflate_fixture_file(inflated_path, store.path)
+    return inflated_path
+
+
+class FixtureFileConsumption:
+    """
+    Consume the fixture files of the collected test cases, each once per fixture consumer, in
+    a pool of worker threads running the consumer tools.
+
+    The fixture files are submitted in the order their test cases run: the file of the running
+    test case and, if `prefetch` is set, the files of the next test cases, up to one per worker.
+    Test cases read from stdin are written to a single fixture file per fixture format.
+    """
+
+    def __init__(
+        self,
+        fixtures_source: FixturesSource,
+        work_dir: Path,
+        workers: int,
+        prefetch: bool = True,
+        base_dump_dir: Path | None = None,
+    ):
+        """Create an empty consumption; the test cases are added with `add`."""
+        self.fixtures_source = fixtures_source
+        self.work_dir = work_dir
+        self.workers = workers
+        self.prefetch = prefetch
+        self.base_dump_dir = base_dump_dir
+        self.test_cases: Dict[FixtureFileKey, List[TestCase]] = {}
+        self.positions: Dict[FixtureFileKey, int] = {}
+        self.order: List[FixtureFileKey] = []
+        self.fixture_paths: Dict[Tuple[str, str], Path] = {}
+        self.results: Dict[FixtureFileKey, Future[Dict[str, str | None]]] = {}
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+
+    @staticmethod
+    def key(fixture_consumer: FixtureConsumer, test_case: TestCase) -> FixtureFileKey:
+        """Return the key of the fixture file consumption of a test case."""
+        json_path = test_case.json_path if isinstance(test_case, TestCaseIndexFile) else ""
+        return fixture_consumer, test_case.format.format_name, str(json_path)
+
+    @staticmethod
+    def xdist_group(test_case: TestCase) -> str:
+        """Return the xdist group of the test cases that share the fixture file of a test case."""
+        json_path = test_case.json_path if isinstance(test_case, TestCaseIndexFile) else ""
+        return f"{test_case.format.format_name}:{json_path}"
+
+    def add(self, fixture_consumer: FixtureConsumer, test_case: TestCase) -> None:
+        """Add a test case to the consumption of its fixture file, in running order."""
+        key = self.key(fixture_consumer, test_case)
+        if key not in self.test_cases:
+            self.positions[key] = len(self.order)
+            self.order.append(key)
+            self.test_cases[key] = []
+        self.test_cases[key].append(test_case)
+
+    def fixture_path(self, test_case: TestCase) -> Path:
+        """Return the path of the fixture file of a test case, writing it first if needed."""
+        path_key = (test_case.format.format_name, str(getattr(test_case, "json_path", "")))
+        if path_key not in self.fixture_paths:
+            if isinstance(test_case, TestCaseIndexFile):
+                path = resolve_fixture_file(test_case, self.fixtures_source, self.work_dir)
+            else:
+                path = self.work_dir / f"stdin_{test_case.format.format_name}.json"
+                fixtures = Fixtures(
+                    {
+                        stream_test_case.id: stream_test_case.fixture
+                        for key, test_cases in self.test_cases.items()
+                        if key[1:] == path_key
+                        for stream_test_case in test_cases
+                        if isinstance(stream_test_case, TestCaseStream)
+                    }
+                )
+                with open(path, "w") as f:
+                    json.dump(to_json(fixtures), f, indent=4)
+            self.fixture_paths[path_key] = path
+        return self.fixture_paths[path_key]
+
+    def submit(self, key: FixtureFileKey) -> None:
+        """Submit the consumption of a fixture file by a fixture consumer."""
+        fixture_consumer, _, _ = key
+        test_cases = self.test_cases[key]
+        fixture_path = self.fixture_path(test_cases[0])
+        debug_output_path = (
+            self.base_dump_dir / fixture_path.stem if self.base_dump_dir is not None else None
+        )
+        self.results[key] = self.executor.submit(
+            fixture_consumer.consume_fixture_file,
+            test_cases[0].format,
+            fixture_path,
+            [test_case.id for test_case in test_cases],
+            debug_output_path,
+        )
+
+    def result(self, fixture_consumer: FixtureConsumer, test_case: TestCase) -> str | None:
+        """
+        Return the error of a test case, or None if it passed, waiting for the consumption of
+        its fixture file.
+        """
+        key = self.key(fixture_consumer, test_case)
+        position = self.positions[key]
+        for next_key in self.order[position : position + (self.workers if self.prefetch else 1)]:
+            if next_key not in self.results:
+                self.submit(next_key)
+        return self.results[key].result()[test_case.id]
+
+    def shutdown(self) -> None:
+        """
+        Cancel the fixture files that were prefetched but not needed, stop the workers and
+        remove the written fixture files.
+        """
+        self.executor.shutdown(cancel_futures=True)
+        shutil.rmtree(self.work_dir, ignore_errors=True)
@@ -5,20 +5,33 @@ client interface similar to geth's EVM 'blocktest' command.
 
 from pathlib import Path
 
+import pytest
+
 from ethereum_test_fixtures import FixtureConsumer
 from ethereum_test_fixtures.consume import TestCaseIndexFile, TestCaseStream
 
+from .fixture_file_consumption import FixtureFileConsumption
+
 
 def test_fixture(
     test_case: TestCaseIndexFile | TestCaseStream,
     fixture_consumer: FixtureConsumer,
     fixture_path: Path,
     test_dump_dir: Path | None,
+    fixture_file_consumption: FixtureFileConsumption | None,
 ):
     """
     Generic test function used to call the fixture consumer with a given fixture file path and
     a fixture name (for a single test run).
+
+    With `--grouped`, the result of the test case is taken from the consumption of its whole
+    fixture file instead.
     """
+    if fixture_file_consumption is not None:
+        error = fixture_file_consumption.result(fixture_consumer, test_case)
+        if error is not None:
+            pytest.fail(error, pytrace=False)
+        return
     fixture_consumer.consume_fixture(
         test_case.format,
         fixture_path,
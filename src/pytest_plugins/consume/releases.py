@@ -94,6 +94,7 @@ class Asset(BaseModel):
     name: str
     content_type: str
     size: int
+    digest: str | None = None
 
 
 class Assets(RootModel[List[Asset]]):
@@ -205,6 +206,20 @@ def parse_release_information_from_file(
     return parse_release_information(release_information)
 
 
+def get_cached_release_asset_digest(url: str) -> str | None:
+    """
+    Return the digest (e.g. `sha256:<hex>`) published for the release asset with the given
+    download URL, if the release information is already cached; the GitHub API is not called.
+    """
+    if not CACHED_RELEASE_INFORMATION_FILE.exists():
+        return None
+    for release in parse_release_information_from_file(CACHED_RELEASE_INFORMATION_FILE):
+        for asset in release.assets.root:
+            if asset.url == url:
+                return asset.digest
+    return None
+
+
 def get_release_url_from_release_information(
     release_string: str, release_information: List[ReleaseInformation]
 ) -> str:
@@ -1,9 +1,11 @@
 """Common pytest fixtures for the Hive simulators."""
 
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Literal
+from typing import Callable, Dict, List, Literal, Tuple, cast
 
 import pytest
+import xdist
 from hive.client import Client
 
 from ethereum_test_fixtures import (
@@ -11,8 +13,9 @@ from ethereum_test_fixtures import (
 )
 from ethereum_test_fixtures.consume import TestCaseIndexFile, TestCaseStream
 from ethereum_test_fixtures.file import Fixtures
+from ethereum_test_fixtures.store import FixtureStore
 from ethereum_test_rpc import EthRPC
-from pytest_plugins.consume.consume import FixturesSource
+from pytest_plugins.consume.consume import DEFAULT_FIXTURE_CACHE_MB, FixturesSource
 
 
 @pytest.fixture(scope="function")
@@ -26,41 +29,162 @@ def check_live_port(test_suite_name: str) -> Literal[8545, 8551]:
     """Port used by hive to check for liveness of the client."""
     if test_suite_name == "eest/consume-rlp":
         return 8545
-    elif test_suite_name == "eest/consume-engine":
+    elif test_suite_name in ("eest/consume-engine", "eest/consume-enginex"):
         return 8551
     raise ValueError(
         f"Unexpected test suite name '{test_suite_name}' while setting HIVE_CHECK_LIVE_PORT."
     )
 
 
+PARSED_FIXTURES_SIZE_FACTOR = 5
+"""Approximate ratio between the memory used by parsed `Fixtures` models and their JSON size."""
+
+
+FixtureCacheKey = Path | Tuple[Path, str]
+"""Path of a cached fixture file, or path and id of a fixture loaded from its byte span."""
+
+
 class FixturesDict(Dict[Path, Fixtures]):
     """
-    A dictionary caches loaded fixture files to avoid reloading the same file
+    A dictionary that caches loaded fixture files to avoid reloading the same file
     multiple times.
+
+    The cache is bounded: once the estimated memory used by the parsed fixture files, and the
+    fixtures loaded from their byte span, exceeds `max_size` bytes, the least recently used
+    entries are evicted.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, max_size: int = DEFAULT_FIXTURE_CACHE_MB * 1024**2) -> None:
         """Initialize the dictionary that caches loaded fixture files."""
-        self._fixtures: Dict[Path, Fixtures] = {}
+        self._fixtures: OrderedDict[FixtureCacheKey, Tuple[Fixtures | BaseFixture, int]] = (
+            OrderedDict()
+        )
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _get(
+        self, key: FixtureCacheKey, load: Callable[[], Tuple[Fixtures | BaseFixture, int]]
+    ) -> Fixtures | BaseFixture:
+        """Return a cached entry, or load it with `load`, which also returns its size."""
+        if key in self._fixtures:
+            self.hits += 1
+            self._fixtures.move_to_end(key)
+            return self._fixtures[key][0]
+        self.misses += 1
+        value, size = load()
+        self._fixtures[key] = (value, size)
+        self.size += size
+        # Evict the least recently used entries, but always keep the one just loaded.
+        while self.size > self.max_size and len(self._fixtures) > 1:
+            _, (_, evicted_size) = self._fixtures.popitem(last=False)
+            self.size -= evicted_size
+            self.evictions += 1
+        return value
 
     def __getitem__(self, key: Path) -> Fixtures:
         """Return the fixtures from the index file, if not found, load from disk."""
         assert key.is_file(), f"Expected a file path, got '{key}'"
-        if key not in self._fixtures:
-            self._fixtures[key] = Fixtures.model_validate_json(key.read_text())
-        return self._fixtures[key]
+
+        def load() -> Tuple[Fixtures, int]:
+            json_text = key.read_text()
+            fixtures = Fixtures.model_validate_json(
+                json_text, context={"lazy": True, "fixture_store": FixtureStore.find(key)}
+            )
+            return fixtures, len(json_text) * PARSED_FIXTURES_SIZE_FACTOR
+
+        return cast(Fixtures, self._get(key, load))
+
+    def __len__(self) -> int:
+        """Return the number of cached fixture files and fixtures."""
+        return len(self._fixtures)
+
+    def stats(self) -> Dict[str, int]:
+        """Return the cache counters."""
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+    def get_fixture(self, fixtures_path: Path, test_case: TestCaseIndexFile) -> BaseFixture:
+        """
+        Return the fixture of a test case.
+
+        If the index recorded the byte span of the fixture within its file, and the file is not
+        cached already, only that span is loaded and cached; otherwise the whole fixture file is
+        loaded and cached.
+        """
+        file_path = fixtures_path / test_case.json_path
+        if test_case.offset is None or test_case.length is None or file_path in self._fixtures:
+            return self[file_path][test_case.id]
+        length = test_case.length
+
+        def load() -> Tuple[BaseFixture, int]:
+            return test_case.load_fixture(fixtures_path), length * PARSED_FIXTURES_SIZE_FACTOR
+
+        return cast(BaseFixture, self._get((file_path, test_case.id), load))
+
+
+def item_json_path(item: pytest.Item) -> str:
+    """Return the path of the fixture file of the test case of a collected item."""
+    callspec = getattr(item, "callspec", None)
+    test_case = callspec.params.get("test_case") if callspec else None
+    return str(getattr(test_case, "json_path", ""))
+
+
+def pytest_collection_modifyitems(items: List[pytest.Item]):
+    """
+    Order the tests by fixture file, so that each file is loaded once while its tests run and
+    can then be evicted from the fixture file cache.
+    """
+    items.sort(key=item_json_path)
 
 
 @pytest.fixture(scope="session")
-def fixture_file_loader() -> Dict[Path, Fixtures]:
+def fixture_file_loader(request: pytest.FixtureRequest) -> FixturesDict:
     """Return a singleton dictionary that caches loaded fixture files used in all tests."""
-    return FixturesDict()
+    fixture_file_loader = FixturesDict(
+        max_size=request.config.getoption("fixture_cache_mb") * 1024**2
+    )
+    request.config.fixture_file_loader = fixture_file_loader  # type: ignore[attr-defined]
+    return fixture_file_loader
+
+
+def pytest_sessionfinish(session: pytest.Session):
+    """Report the fixture cache counters of an xdist worker to the controller."""
+    if xdist.is_xdist_worker(session) and hasattr(session.config, "fixture_file_loader"):
+        session.config.workeroutput["fixture_cache"] = (  # type: ignore[attr-defined]
+            session.config.fixture_file_loader.stats()
+        )
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Accumulate the fixture cache counters of a finished xdist worker."""
+    stats = node.workeroutput.get("fixture_cache")
+    if stats is None:
+        return
+    totals = getattr(node.config, "fixture_cache_stats", {})
+    node.config.fixture_cache_stats = {key: totals.get(key, 0) + stats[key] for key in stats}
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus: int, config: pytest.Config):
+    """Print the hit, miss and eviction counters of the fixture file cache."""
+    stats = getattr(config, "fixture_cache_stats", None)
+    if stats is None and hasattr(config, "fixture_file_loader"):
+        stats = config.fixture_file_loader.stats()
+    if not stats or not (stats["hits"] or stats["misses"]):
+        return
+    terminalreporter.write_line(
+        f"fixture file cache: {stats['hits']} hits, {stats['misses']} misses, "
+        f"{stats['evictions']} evictions "
+        f"(--fixture-cache-mb={config.getoption('fixture_cache_mb')})"
+    )
 
 
 @pytest.fixture(scope="function")
 def fixture(
     fixtures_source: FixturesSource,
-    fixture_file_loader: Dict[Path, Fixtures],
+    fixture_file_loader: FixturesDict,
     test_case: TestCaseIndexFile | TestCaseStream,
 ) -> BaseFixture:
     """
@@ -77,9 +201,7 @@ def fixture(
         fixture = test_case.fixture
     else:
         assert isinstance(test_case, TestCaseIndexFile), "Expected an index file test case"
-        fixtures_file_path = fixtures_source.path / test_case.json_path
-        fixtures: Fixtures = fixture_file_loader[fixtures_file_path]
-        fixture = fixtures[test_case.id]
+        fixture = fixture_file_loader.get_fixture(fixtures_source.path, test_case)
     assert isinstance(fixture, test_case.format), (
         f"Expected a {test_case.format.format_name} test fixture"
     )
@@ -0,0 +1,65 @@
+"""
+Pytest fixtures for the `consume enginex` simulator.
+
+Configures the hive back-end & EL clients shared by the tests of each pre-allocation group.
+"""
+
+import io
+from typing import Mapping
+
+import pytest
+from hive.client import Client
+
+from ethereum_test_exceptions import ExceptionMapper
+from ethereum_test_fixtures import BlockchainEngineXFixture
+from ethereum_test_rpc import EngineRPC
+
+pytest_plugins = (
+    "pytest_plugins.pytest_hive.pytest_hive",
+    "pytest_plugins.consume.simulators.base",
+    "pytest_plugins.consume.simulators.multi_test_client",
+    "pytest_plugins.consume.simulators.test_case_description",
+    "pytest_plugins.consume.simulators.timing_data",
+    "pytest_plugins.consume.simulators.exceptions",
+)
+
+
+def pytest_configure(config):
+    """Set the supported fixture formats for the engine-x simulator."""
+    config._supported_fixture_formats = [BlockchainEngineXFixture.format_name]
+
+
+@pytest.fixture(scope="function")
+def engine_rpc(client: Client, client_exception_mapper: ExceptionMapper | None) -> EngineRPC:
+    """Initialize engine RPC client for the execution client under test."""
+    if client_exception_mapper:
+        return EngineRPC(
+            f"http://{client.ip}:8551",
+            response_validation_context={
+                "exception_mapper": client_exception_mapper,
+            },
+        )
+    return EngineRPC(f"http://{client.ip}:8551")
+
+
+@pytest.fixture(scope="session")
+def test_suite_name() -> str:
+    """The name of the hive test suite used in this simulator."""
+    return "eest/consume-enginex"
+
+
+@pytest.fixture(scope="session")
+def test_suite_description() -> str:
+    """The description of the hive test suite used in this simulator."""
+    return (
+        "Execute blockchain tests against clients using the Engine API, sharing one client "
+        "per pre-allocation group."
+    )
+
+
+@pytest.fixture(scope="function")
+def client_files(buffered_genesis: io.BufferedReader) -> Mapping[str, io.BufferedReader]:
+    """Define the files that hive will start the client with."""
+    files = {}
+    files["/genesis.json"] = buffered_genesis
+    return files
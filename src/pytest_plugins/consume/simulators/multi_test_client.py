@@ -0,0 +1,272 @@
+"""
+Common pytest fixtures for simulators with multi-test client architecture.
+
+The `blockchain_test_engine_x` fixtures that share a pre-allocation group (`pre_hash`) all start
+from the same genesis, so a single client is started per pre-allocation group and client type
+and the tests of the group run one after the other against it. Each test starts with a
+forkchoice update to the genesis block, which rolls the client back from the chain imported by
+the previous test of the group.
+
+The tests are ordered by pre-allocation group and, with xdist, the groups are distributed as a
+whole to the workers (`--dist loadgroup`), so that each client is only started once and stopped
+as soon as the last test of its group has run.
+"""
+
+import io
+import json
+import logging
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Dict, Generator, List, Literal, Tuple, cast
+
+import pytest
+from hive.client import Client, ClientType
+from hive.testing import HiveTest, HiveTestResult, HiveTestSuite
+
+from ethereum_test_base_types import Number, to_json
+from ethereum_test_fixtures import BlockchainEngineXFixture, PreAllocGroup
+from ethereum_test_fixtures.blockchain import FixtureHeader
+from pytest_plugins.consume.consume import FixturesSource
+from pytest_plugins.consume.simulators.helpers.ruleset import (
+    ruleset,  # TODO: generate dynamically
+)
+
+from .helpers.timing import TimingData
+
+logger = logging.getLogger(__name__)
+
+ClientKey = Tuple[str, str]
+"""Pre-allocation group hash and client name of a multi-test client."""
+
+
+def item_pre_hash(item: pytest.Item) -> str:
+    """Return the pre-allocation group hash of the test case of a collected item."""
+    callspec = getattr(item, "callspec", None)
+    test_case = callspec.params.get("test_case") if callspec else None
+    return getattr(test_case, "pre_hash", None) or ""
+
+
+def item_client_key(item: pytest.Item) -> ClientKey:
+    """Return the key of the multi-test client used by a collected item."""
+    callspec = getattr(item, "callspec", None)
+    client_type = callspec.params.get("client_type") if callspec else None
+    return item_pre_hash(item), getattr(client_type, "name", "")
+
+
+def pytest_configure(config: pytest.Config):
+    """Keep the hive test suite, and thus the clients, for the whole session."""
+    config.test_suite_scope = "session"  # type: ignore[attr-defined]
+
+
+def pytest_itemcollected(item: pytest.Item):
+    """
+    Mark the item with its pre-allocation group, so that `--dist loadgroup` runs all the tests
+    of a group on the same xdist worker.
+
+    The marks must be set before the `pytest_collection_modifyitems` hook of xdist reads them.
+    """
+    if pre_hash := item_pre_hash(item):
+        item.add_marker(pytest.mark.xdist_group(name=pre_hash))
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(items: List[pytest.Item]):
+    """Order the tests by pre-allocation group, keeping their order within each group."""
+    items.sort(key=item_pre_hash)
+
+
+def pytest_collection_finish(session: pytest.Session):
+    """Count the selected tests of each multi-test client."""
+    session.config.multi_test_client_test_counts = Counter(  # type: ignore[attr-defined]
+        item_client_key(item) for item in session.items
+    )
+
+
+class MultiTestClientManager:
+    """
+    Start, share and stop the clients of the pre-allocation groups.
+
+    Each client is started within a dedicated hive test of the suite, which ends when the client
+    is stopped, i.e. after the last test that uses it or at the end of the session.
+    """
+
+    def __init__(
+        self,
+        test_suite: HiveTestSuite,
+        pre_alloc_folder: Path,
+        test_counts: Dict[ClientKey, int],
+    ):
+        """Initialize the manager with the number of tests that use each client."""
+        self.test_suite = test_suite
+        self.pre_alloc_folder = pre_alloc_folder
+        self.remaining_tests = Counter(test_counts)
+        self.pre_alloc_groups: Dict[str, Tuple[PreAllocGroup, FixtureHeader]] = {}
+        self.clients: Dict[ClientKey, Tuple[HiveTest, Client]] = {}
+
+    def pre_alloc_group(self, pre_hash: str) -> Tuple[PreAllocGroup, FixtureHeader]:
+        """Return a pre-allocation group and its genesis header, loaded once per group."""
+        if pre_hash not in self.pre_alloc_groups:
+            pre_alloc_file = self.pre_alloc_folder / f"{pre_hash}.json"
+            if not pre_alloc_file.exists():
+                pytest.fail(f"Pre-allocation group file not found: {pre_alloc_file}")
+            group = PreAllocGroup.model_validate_json(pre_alloc_file.read_text())
+            self.pre_alloc_groups[pre_hash] = (group, cast(FixtureHeader, group.genesis))
+        return self.pre_alloc_groups[pre_hash]
+
+    def get_client(self, key: ClientKey, start: Callable[[HiveTest], Client | None]) -> Client:
+        """Return the client of a pre-allocation group, starting it with `start` if needed."""
+        if key not in self.clients:
+            pre_hash, client_name = key
+            hive_test = self.test_suite.start_test(
+                name=f"{client_name} client for pre-allocation group {pre_hash}",
+                description=(
+                    f"Client shared by the tests of the pre-allocation group {pre_hash}."
+                ),
+            )
+            client = start(hive_test)
+            if client is None:
+                hive_test.end(
+                    result=HiveTestResult(test_pass=False, details="Client failed to start.")
+                )
+                pytest.fail(
+                    f"Unable to connect to the client container ({client_name}) via Hive "
+                    "during test setup. Check the client or Hive server logs for more "
+                    "information."
+                )
+            self.clients[key] = (hive_test, client)
+        return self.clients[key][1]
+
+    def release(self, key: ClientKey) -> None:
+        """Stop the client of a pre-allocation group once its last test has run."""
+        self.remaining_tests[key] -= 1
+        if self.remaining_tests[key] > 0:
+            return
+        self.stop_client(key)
+        pre_hash, _ = key
+        if not any(
+            count > 0 for (group, _), count in self.remaining_tests.items() if group == pre_hash
+        ):
+            self.pre_alloc_groups.pop(pre_hash, None)
+
+    def stop_client(self, key: ClientKey) -> None:
+        """Stop a client and end its hive test."""
+        if key not in self.clients:
+            return
+        hive_test, client = self.clients.pop(key)
+        logger.info(f"Stopping client ({key[1]}) of pre-allocation group {key[0]}...")
+        client.stop()
+        hive_test.end(result=HiveTestResult(test_pass=True, details="Client stopped."))
+
+    def stop_all(self) -> None:
+        """Stop all the remaining clients."""
+        for key in list(self.clients):
+            self.stop_client(key)
+
+
+@pytest.fixture(scope="session")
+def multi_test_client_manager(
+    request: pytest.FixtureRequest,
+    test_suite: HiveTestSuite,
+    fixtures_source: FixturesSource,
+) -> Generator[MultiTestClientManager, None, None]:
+    """Return the manager of the clients shared by the tests of each pre-allocation group."""
+    if fixtures_source.is_stdin:
+        pytest.exit("The Engine-X simulator requires a fixture directory, not stdin.")
+    manager = MultiTestClientManager(
+        test_suite=test_suite,
+        pre_alloc_folder=(
+            fixtures_source.path / BlockchainEngineXFixture.output_base_dir_name() / "pre_alloc"
+        ),
+        test_counts=getattr(request.config, "multi_test_client_test_counts", {}),
+    )
+    yield manager
+    manager.stop_all()
+
+
+@pytest.fixture(scope="function")
+def pre_alloc_group(
+    fixture: BlockchainEngineXFixture,
+    multi_test_client_manager: MultiTestClientManager,
+) -> PreAllocGroup:
+    """Return the pre-allocation group of the current test fixture."""
+    return multi_test_client_manager.pre_alloc_group(fixture.pre_hash)[0]
+
+
+@pytest.fixture(scope="function")
+def genesis_header(
+    fixture: BlockchainEngineXFixture,
+    multi_test_client_manager: MultiTestClientManager,
+) -> FixtureHeader:
+    """Provide the genesis header from the shared pre-state group."""
+    return multi_test_client_manager.pre_alloc_group(fixture.pre_hash)[1]
+
+
+@pytest.fixture(scope="function")
+def client_genesis(pre_alloc_group: PreAllocGroup, genesis_header: FixtureHeader) -> dict:
+    """Convert the pre-allocation group genesis and pre-state to a client genesis state."""
+    genesis = to_json(genesis_header)
+    alloc = to_json(pre_alloc_group.pre)
+    # NOTE: nethermind requires account keys without '0x' prefix
+    genesis["alloc"] = {k.replace("0x", ""): v for k, v in alloc.items()}
+    return genesis
+
+
+@pytest.fixture(scope="function")
+def environment(
+    fixture: BlockchainEngineXFixture,
+    pre_alloc_group: PreAllocGroup,
+    check_live_port: Literal[8545, 8551],
+) -> dict:
+    """Define the environment that hive will start the client with."""
+    fork = pre_alloc_group.fork
+    assert fork in ruleset, f"fork '{fork}' missing in hive ruleset"
+    return {
+        "HIVE_CHAIN_ID": str(Number(fixture.config.chain_id)),
+        "HIVE_FORK_DAO_VOTE": "1",
+        "HIVE_NODETYPE": "full",
+        "HIVE_CHECK_LIVE_PORT": str(check_live_port),
+        **{k: f"{v:d}" for k, v in ruleset[fork].items()},
+    }
+
+
+@pytest.fixture(scope="function")
+def buffered_genesis(client_genesis: dict) -> io.BufferedReader:
+    """Create a buffered reader for the genesis block header of the pre-allocation group."""
+    genesis_json = json.dumps(client_genesis)
+    genesis_bytes = genesis_json.encode("utf-8")
+    return io.BufferedReader(cast(io.RawIOBase, io.BytesIO(genesis_bytes)))
+
+
+@pytest.fixture(scope="function")
+def client(
+    request: pytest.FixtureRequest,
+    hive_test: HiveTest,
+    fixture: BlockchainEngineXFixture,
+    client_type: ClientType,
+    total_timing_data: TimingData,
+    multi_test_client_manager: MultiTestClientManager,
+) -> Generator[Client, None, None]:
+    """
+    Return the client of the pre-allocation group of the current test, starting it for the
+    first test of the group and stopping it after the last one.
+
+    The client files and environment are only requested when the client is started.
+    """
+    key = (fixture.pre_hash, client_type.name)
+
+    def start(group_hive_test: HiveTest) -> Client | None:
+        logger.info(f"Starting client ({client_type.name}) for group {fixture.pre_hash}...")
+        with total_timing_data.time("Start client"):
+            return group_hive_test.start_client(
+                client_type=client_type,
+                environment=request.getfixturevalue("environment"),
+                files=request.getfixturevalue("client_files"),
+            )
+
+    try:
+        client = multi_test_client_manager.get_client(key, start)
+        hive_test.register_multi_test_client(client)
+        yield client
+    finally:
+        with total_timing_data.time("Release client"):
+            multi_test_client_manager.release(key)
@@ -25,7 +25,8 @@ logger = logging.getLogger(__name__)
 def client_genesis(fixture: BlockchainFixtureCommon) -> dict:
     """Convert the fixture genesis block header and pre-state to a client genesis state."""
     genesis = to_json(fixture.genesis)
-    alloc = to_json(fixture.pre)
+    # The pre-allocation is copied from the fixture JSON, without validating it.
+    alloc = fixture.field_json("pre")
     # NOTE: nethermind requires account keys without '0x' prefix
     genesis["alloc"] = {k.replace("0x", ""): v for k, v in alloc.items()}
     return genesis
@@ -0,0 +1,234 @@
+"""Test the streaming, resumable and verified fixture downloads of consume."""
+
+import hashlib
+import os
+import shutil
+import tarfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Generator, List, Optional, Tuple
+
+import pytest
+import requests
+
+from cli.fixtures_delta import list_files, write_fixtures_delta
+from cli.gen_index import generate_fixtures_index
+from ethereum_test_fixtures.archive import FixtureTarballWriter
+from pytest_plugins.consume.consume import DigestMismatchError, FixtureDownloader
+
+FIXTURES_DIR = Path(__file__).parents[3] / "ethereum_test_specs" / "tests" / "fixtures"
+FIXTURE_FILES = [
+    "chainid_cancun_blockchain_test_tx_type_0.json",
+    "chainid_paris_blockchain_test_engine_tx_type_0.json",
+    "chainid_cancun_state_test_tx_type_0.json",
+]
+
+
+class ArchiveServer(ThreadingHTTPServer):
+    """Local HTTP server stand-in serving files with HTTP Range support."""
+
+    files: Dict[str, bytes]
+    requests: List[Tuple[str, Optional[str]]]
+    fail_after: Dict[str, int]
+
+
+class ArchiveRequestHandler(BaseHTTPRequestHandler):
+    """Serve the files of the server, dropping the connection once after `fail_after` bytes."""
+
+    server: ArchiveServer
+
+    def do_GET(self):  # noqa: N802, D102
+        range_header = self.headers.get("Range")
+        self.server.requests.append((self.path, range_header))
+        if self.path not in self.server.files:
+            self.send_error(404)
+            return
+        data = self.server.files[self.path]
+        offset = int(range_header.removeprefix("bytes=").removesuffix("-")) if range_header else 0
+        if offset >= len(data) > 0:
+            self.send_error(416)
+            return
+        self.send_response(206 if offset else 200)
+        self.send_header("Content-Length", str(len(data) - offset))
+        if offset:
+            self.send_header("Content-Range", f"bytes {offset}-{len(data) - 1}/{len(data)}")
+        self.end_headers()
+        if (fail_after := self.server.fail_after.pop(self.path, None)) is not None:
+            self.wfile.write(data[offset : offset + fail_after])
+            self.close_connection = True
+            return
+        self.wfile.write(data[offset:])
+
+    def log_message(self, *args):  # noqa: D102
+        pass
+
+
+@pytest.fixture
+def archive(tmp_path: Path) -> bytes:
+    """Return a fixture tarball with a fixture file and an incompressible file."""
+    (tmp_path / "test.json").write_text('{"test": {}}')
+    (tmp_path / "random.bin").write_bytes(os.urandom(256 * 1024))
+    tarball_path = tmp_path / "fixtures.tar.gz"
+    with FixtureTarballWriter(tarball_path, threads=2) as writer:
+        writer.add(tmp_path / "test.json", arcname=Path("fixtures/state_tests/test.json"))
+        writer.add(tmp_path / "random.bin", arcname=Path("fixtures/random.bin"))
+    return tarball_path.read_bytes()
+
+
+@pytest.fixture
+def server(archive: bytes) -> Generator[ArchiveServer, None, None]:
+    """Serve the archive and its sha256 digest file from a local HTTP server."""
+    server = ArchiveServer(("127.0.0.1", 0), ArchiveRequestHandler)
+    digest = hashlib.sha256(archive).hexdigest()
+    server.files = {
+        "/fixtures.tar.gz": archive,
+        "/fixtures.tar.gz.sha256": f"{digest}  fixtures.tar.gz\n".encode(),
+    }
+    server.requests = []
+    server.fail_after = {}
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def archive_url(server: ArchiveServer) -> str:
+    """Return the URL of the served archive."""
+    return f"http://127.0.0.1:{server.server_address[1]}/fixtures.tar.gz"
+
+
+def archive_requests(server: ArchiveServer) -> List[Optional[str]]:
+    """Return the Range header of each request of the archive."""
+    return [range_header for path, range_header in server.requests if path == "/fixtures.tar.gz"]
+
+
+def test_download_and_extract(server: ArchiveServer, tmp_path: Path):
+    """Test that the archive is verified, extracted and then served from the cache."""
+    downloader = FixtureDownloader(archive_url(server), tmp_path / "cache")
+    was_cached, path = downloader.download_and_extract()
+    assert not was_cached
+    assert path == downloader.extract_to / "fixtures"
+    assert (path / "state_tests" / "test.json").read_text() == '{"test": {}}'
+    assert not downloader.partial_path.exists()
+
+    was_cached, cached_path = FixtureDownloader(
+        archive_url(server), tmp_path / "cache"
+    ).download_and_extract()
+    assert was_cached
+    assert cached_path == path
+    assert archive_requests(server) == [None]
+
+
+def test_digest_mismatch(server: ArchiveServer, tmp_path: Path):
+    """Test that an archive that does not match its published digest is not extracted."""
+    downloader = FixtureDownloader(archive_url(server), tmp_path / "cache", digest="sha256:00")
+    with pytest.raises(DigestMismatchError):
+        downloader.download_and_extract()
+    assert not downloader.extract_to.exists()
+    assert not downloader.partial_path.exists()
+
+
+def test_corrupt_archive(server: ArchiveServer, tmp_path: Path):
+    """Test that the partial download of an archive that fails to extract is removed."""
+    server.files["/fixtures.tar.gz"] = os.urandom(64 * 1024)
+    downloader = FixtureDownloader(archive_url(server), tmp_path / "cache")
+    with pytest.raises(tarfile.TarError):
+        downloader.download_and_extract()
+    assert not downloader.extract_to.exists()
+    assert not downloader.partial_path.exists()
+
+
+def test_resume_interrupted_download(server: ArchiveServer, archive: bytes, tmp_path: Path):
+    """Test that an interrupted download is resumed with a Range request."""
+    server.fail_after["/fixtures.tar.gz"] = 100 * 1024
+    downloader = FixtureDownloader(archive_url(server), tmp_path / "cache")
+    with pytest.raises(requests.exceptions.RequestException):
+        downloader.download_and_extract()
+    assert not downloader.extract_to.exists()
+    # The bytes received before the interruption, in full chunks, are kept.
+    partial = downloader.partial_path.read_bytes()
+    assert 0 < len(partial) <= 100 * 1024
+    assert archive.startswith(partial)
+
+    was_cached, path = downloader.download_and_extract()
+    assert not was_cached
+    assert (path / "random.bin").stat().st_size == 256 * 1024
+    assert archive_requests(server) == [None, f"bytes={len(partial)}-"]
+
+
+def test_concurrent_downloads(server: ArchiveServer, tmp_path: Path):
+    """Test that concurrent downloaders of the same archive download it only once."""
+    results: List[Tuple[bool, Path]] = []
+
+    def download():
+        results.append(
+            FixtureDownloader(archive_url(server), tmp_path / "cache").download_and_extract()
+        )
+
+    threads = [threading.Thread(target=download) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(was_cached for was_cached, _ in results) == [False, True, True, True]
+    assert len({path for _, path in results}) == 1
+    assert archive_requests(server) == [None]
+
+
+def write_release(folder: Path, tarball_path: Path) -> None:
+    """Write the release tarball of a fixture folder."""
+    with FixtureTarballWriter(tarball_path, threads=1) as writer:
+        for path in sorted(list_files(folder)):
+            writer.add(folder / path, arcname=Path("fixtures") / path)
+
+
+@pytest.mark.parametrize("publish_delta", [True, False], ids=["delta", "no_delta"])
+def test_download_with_delta(
+    server: ArchiveServer,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    publish_delta: bool,
+):
+    """
+    Test that a release is built from the cached previous release and a published delta, and
+    that the full release is downloaded if no delta is published.
+    """
+    # Cache the releases by version, as for GitHub release URLs.
+    monkeypatch.setattr("pytest_plugins.consume.consume.is_release_url", lambda url: True)
+    base, target = tmp_path / "base", tmp_path / "target"
+    for folder in (base, target):
+        (folder / "tests").mkdir(parents=True)
+        shutil.copy(FIXTURES_DIR / FIXTURE_FILES[0], folder / "tests" / FIXTURE_FILES[0])
+    shutil.copy(FIXTURES_DIR / FIXTURE_FILES[1], base / "tests" / FIXTURE_FILES[1])
+    shutil.copy(FIXTURES_DIR / FIXTURE_FILES[2], target / "tests" / FIXTURE_FILES[2])
+    for folder in (base, target):
+        generate_fixtures_index(folder, quiet_mode=True, jobs=1)
+        write_release(folder, tmp_path / f"{folder.name}.tar.gz")
+        server.files[f"/{folder.name}/fixtures.tar.gz"] = (
+            tmp_path / f"{folder.name}.tar.gz"
+        ).read_bytes()
+    if publish_delta:
+        write_fixtures_delta(base, target, tmp_path / "delta.tar.gz", jobs=1)
+        server.files["/target/fixtures.delta-base.tar.gz"] = (
+            tmp_path / "delta.tar.gz"
+        ).read_bytes()
+
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    FixtureDownloader(f"{url}/base/fixtures.tar.gz", tmp_path / "cache").download_and_extract()
+    was_cached, path = FixtureDownloader(
+        f"{url}/target/fixtures.tar.gz", tmp_path / "cache"
+    ).download_and_extract()
+    assert not was_cached
+    assert path == tmp_path / "cache" / "other" / "target" / "fixtures" / "fixtures"
+    assert {file_path: (path / file_path).read_bytes() for file_path in list_files(path)} == {
+        file_path: (target / file_path).read_bytes() for file_path in list_files(target)
+    }
+    downloaded_paths = [request_path for request_path, _ in server.requests]
+    assert ("/target/fixtures.tar.gz" in downloaded_paths) != publish_delta
+    assert not any(
+        name.endswith((".delta", ".extracting", ".partial"))
+        for name in os.listdir(path.parents[1])
+    )
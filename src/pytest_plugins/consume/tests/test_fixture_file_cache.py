@@ -0,0 +1,90 @@
+"""Test the size-bounded cache of fixture files used by the hive simulators."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from ethereum_test_fixtures import StateFixture
+from ethereum_test_fixtures.consume import TestCaseIndexFile
+from ethereum_test_fixtures.file import Fixtures, iter_fixture_file_spans
+
+from ..simulators.base import PARSED_FIXTURES_SIZE_FACTOR, FixturesDict
+
+
+@pytest.fixture
+def fixture_files(tmp_path: Path) -> list[Path]:
+    """Write three empty fixture files of the same size."""
+    paths = []
+    for name in ("a", "b", "c"):
+        path = tmp_path / f"{name}.json"
+        path.write_text(Fixtures({}).model_dump_json())
+        paths.append(path)
+    return paths
+
+
+def test_fixture_file_cache_evicts_least_recently_used(fixture_files: list[Path]):
+    """Test that only the most recently used files fitting in the budget are kept."""
+    a, b, c = fixture_files
+    file_size = len(a.read_text()) * PARSED_FIXTURES_SIZE_FACTOR
+    cache = FixturesDict(max_size=2 * file_size)
+
+    cache[a]
+    cache[b]
+    cache[a]
+    cache[c]
+    assert len(cache) == 2
+    assert cache.stats() == {"hits": 1, "misses": 3, "evictions": 1}
+
+    cache[a]
+    assert cache.hits == 2
+    cache[b]
+    assert cache.stats() == {"hits": 2, "misses": 4, "evictions": 2}
+    assert cache.size == 2 * file_size
+
+
+def test_fixture_file_cache_keeps_file_larger_than_budget(fixture_files: list[Path]):
+    """Test that a file larger than the budget is still cached until the next file is loaded."""
+    a, b, _ = fixture_files
+    cache = FixturesDict(max_size=0)
+
+    cache[a]
+    cache[a]
+    cache[b]
+    assert len(cache) == 1
+    assert cache.stats() == {"hits": 1, "misses": 2, "evictions": 1}
+
+
+def test_fixture_cache_span_indexed_fixtures(tmp_path: Path):
+    """Test that fixtures loaded from their byte span are cached and counted as well."""
+    state_fixtures = (
+        Path(__file__).parents[3]
+        / "ethereum_test_specs"
+        / "tests"
+        / "fixtures"
+        / "chainid_cancun_state_test_tx_type_0.json"
+    )
+    fixture_file = tmp_path / "state.json"
+    with open(fixture_file, "w") as f:
+        json.dump(json.loads(state_fixtures.read_text()), f, indent=4)
+    (name, offset, length), *_ = iter_fixture_file_spans(fixture_file)
+    test_case = TestCaseIndexFile(
+        id=name,
+        fixture_hash=None,
+        fork=None,
+        format=StateFixture,
+        json_path=Path("state.json"),
+        offset=offset,
+        length=length,
+    )
+    cache = FixturesDict()
+
+    fixture = cache.get_fixture(tmp_path, test_case)
+    assert cache.get_fixture(tmp_path, test_case) is fixture
+    assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 0}
+    assert cache.size == length * PARSED_FIXTURES_SIZE_FACTOR
+
+    # Once the whole file is cached, its fixtures are served from it.
+    fixtures = cache[fixture_file]
+    assert cache.get_fixture(tmp_path, test_case) is fixtures[name]
+    assert cache.stats() == {"hits": 2, "misses": 2, "evictions": 0}
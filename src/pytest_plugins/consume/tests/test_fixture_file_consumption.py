@@ -0,0 +1,85 @@
+"""Test the grouped consumption of fixture files of `consume direct`."""
+
+import threading
+from pathlib import Path
+from typing import Dict, List
+
+from ethereum_test_fixtures import BlockchainFixture, FixtureConsumer, StateFixture
+from ethereum_test_fixtures.consume import TestCaseIndexFile
+from pytest_plugins.consume.consume import FixturesSource
+from pytest_plugins.consume.direct.fixture_file_consumption import FixtureFileConsumption
+
+
+class FileConsumer(FixtureConsumer):
+    """Consumer that records its calls and fails the fixtures whose name contains `fail`."""
+
+    fixture_formats = [BlockchainFixture, StateFixture]
+
+    def __init__(self):
+        """Initialize the list of consumed files."""
+        self.consumed_files: List[Path] = []
+        self.lock = threading.Lock()
+
+    def consume_fixture(
+        self, fixture_format, fixture_path, fixture_name=None, debug_output_path=None
+    ):
+        """Fail, since grouped consumption must only consume whole files."""
+        raise AssertionError("fixtures must be consumed one file at a time")
+
+    def consume_fixture_file(
+        self, fixture_format, fixture_path, fixture_names, debug_output_path=None
+    ) -> Dict[str, str | None]:
+        """Record the call and fail the fixtures whose name contains `fail`."""
+        with self.lock:
+            self.consumed_files.append(fixture_path)
+        results = [
+            {"name": name, "pass": "fail" not in name, "error": "boom"} for name in fixture_names
+        ]
+        return self.map_file_results(results, fixture_names)
+
+
+def test_fixture_file_consumption(tmp_path: Path):
+    """Test that each file is consumed once per consumer and its results fanned out."""
+    test_cases = [
+        TestCaseIndexFile(
+            id=name,
+            fixture_hash=None,
+            fork=None,
+            format=fixture_format,
+            json_path=Path(json_path),
+        )
+        for json_path, fixture_format, name in [
+            ("a.json", BlockchainFixture, "a1"),
+            ("a.json", BlockchainFixture, "a2_fail"),
+            ("b.json", BlockchainFixture, "b1"),
+            ("c.json", StateFixture, "c1"),
+            ("c.json", StateFixture, "c2_fail"),
+        ]
+    ]
+    consumers = [FileConsumer(), FileConsumer()]
+    consumption = FixtureFileConsumption(
+        fixtures_source=FixturesSource(input_option=str(tmp_path), path=tmp_path),
+        work_dir=tmp_path / "work",
+        workers=2,
+    )
+    for consumer in consumers:
+        for test_case in test_cases:
+            consumption.add(consumer, test_case)
+
+    try:
+        results = {
+            (index, test_case.id): consumption.result(consumer, test_case)
+            for index, consumer in enumerate(consumers)
+            for test_case in test_cases
+        }
+    finally:
+        consumption.shutdown()
+
+    for index in range(len(consumers)):
+        assert results[(index, "a1")] is None
+        assert results[(index, "a2_fail")] == "boom"
+        assert results[(index, "c2_fail")] == "boom"
+    for consumer in consumers:
+        assert sorted(consumer.consumed_files) == [tmp_path / f"{name}.json" for name in "abc"]
+    groups = {FixtureFileConsumption.xdist_group(test_case) for test_case in test_cases}
+    assert groups == {"blockchain_test:a.json", "blockchain_test:b.json", "state_test:c.json"}
@@ -0,0 +1,85 @@
+"""Test the clients shared by the tests of a pre-allocation group of `consume enginex`."""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List
+
+from hive.testing import HiveTestResult
+
+from ethereum_test_fixtures import PreAllocGroup
+from ethereum_test_forks import Cancun
+from ethereum_test_types import Alloc, Environment
+from pytest_plugins.consume.simulators.multi_test_client import MultiTestClientManager
+
+
+@dataclass
+class FakeClient:
+    """Client that records whether it was stopped."""
+
+    stopped: bool = False
+
+    def stop(self):
+        """Stop the client."""
+        self.stopped = True
+
+
+@dataclass
+class FakeHiveTest:
+    """Hive test that records its result."""
+
+    name: str
+    results: List[HiveTestResult] = field(default_factory=list)
+
+    def end(self, *, result: HiveTestResult):
+        """End the test."""
+        self.results.append(result)
+
+
+@dataclass
+class FakeTestSuite:
+    """Hive test suite that records its started tests."""
+
+    tests: List[FakeHiveTest] = field(default_factory=list)
+
+    def start_test(self, name: str, description: str) -> FakeHiveTest:
+        """Start a test."""
+        self.tests.append(FakeHiveTest(name=name))
+        return self.tests[-1]
+
+
+def test_multi_test_client_manager(tmp_path: Path):
+    """Test that a client is started once per group and stopped after its last test."""
+    group = PreAllocGroup(environment=Environment(), fork=Cancun, pre=Alloc())
+    (tmp_path / "0x01.json").write_text(group.model_dump_json(by_alias=True))
+    test_suite = FakeTestSuite()
+    manager = MultiTestClientManager(
+        test_suite=test_suite,  # type: ignore[arg-type]
+        pre_alloc_folder=tmp_path,
+        test_counts={("0x01", "geth"): 2, ("0x02", "geth"): 1},
+    )
+    _, genesis = manager.pre_alloc_group("0x01")
+    assert genesis.block_hash == group.genesis.block_hash  # type: ignore[attr-defined]
+
+    started: List[FakeClient] = []
+
+    def start(hive_test) -> FakeClient:
+        started.append(FakeClient())
+        return started[-1]
+
+    first = manager.get_client(("0x01", "geth"), start)  # type: ignore[arg-type]
+    manager.release(("0x01", "geth"))
+    assert manager.get_client(("0x01", "geth"), start) is first  # type: ignore[arg-type]
+    assert not first.stopped  # type: ignore[attr-defined]
+    manager.release(("0x01", "geth"))
+    assert first.stopped  # type: ignore[attr-defined]
+    assert "0x01" not in manager.pre_alloc_groups
+
+    other = manager.get_client(("0x02", "geth"), start)  # type: ignore[arg-type]
+    manager.stop_all()
+    assert other.stopped  # type: ignore[attr-defined]
+    assert len(started) == 2
+    assert [test.name for test in test_suite.tests] == [
+        "geth client for pre-allocation group 0x01",
+        "geth client for pre-allocation group 0x02",
+    ]
+    assert all(test.results[0].test_pass for test in test_suite.tests)
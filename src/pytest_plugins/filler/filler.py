@@ -10,10 +10,12 @@ import configparser
 import datetime
 import os
 import warnings
+from collections import OrderedDict
 from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, Generator, List, Type
 
+import platformdirs
 import pytest
 import xdist
 from _pytest.compat import NotSetType
@@ -21,8 +23,10 @@ from _pytest.terminal import TerminalReporter
 from pytest_metadata.plugin import metadata_key  # type: ignore
 
 from cli.gen_index import generate_fixtures_index
-from ethereum_clis import TransitionTool
+from ethereum_clis import TraceFilter, TransitionTool
 from ethereum_clis.clis.geth import FixtureConsumerTool
+from ethereum_clis.transition_tool_cache import DEFAULT_CACHE_MAX_SIZE_MB, TransitionToolCache
+from ethereum_clis.transition_tool_profile import TransitionToolProfile
 from ethereum_test_base_types import Account, Address, Alloc, ReferenceSpec
 from ethereum_test_fixtures import (
     BaseFixture,
@@ -98,6 +102,12 @@ def calculate_post_state_diff(post_state: Alloc, genesis_state: Alloc) -> Alloc:
     return Alloc(diff)
 
 
+MAX_BUILT_CHAIN_TESTS = 32
+"""
+Maximum number of test parametrizations for which built chains are kept in memory by a worker.
+"""
+
+
 def default_output_directory() -> str:
     """
     Directory (default) to store the generated test fixtures. Defined as a
@@ -106,6 +116,14 @@ def default_output_directory() -> str:
     return "./fixtures"
 
 
+def default_t8n_cache_directory() -> Path:
+    """
+    Directory (default) to store cached transition tool results. Defined as a
+    function to allow for easier testing.
+    """
+    return Path(platformdirs.user_cache_dir("ethereum-execution-spec-tests")) / "t8n_results"
+
+
 def default_html_report_file_path() -> str:
     """
     File path (default) to store the generated HTML test report. Defined as a
@@ -139,6 +157,53 @@ def pytest_addoption(parser: pytest.Parser):
             "intended for regular CLI use."
         ),
     )
+    evm_group.addoption(
+        "--t8n-daemons",
+        action="store",
+        dest="t8n_daemons",
+        type=int,
+        default=1,
+        help=(
+            "Number of t8n-server daemons started per worker for transition tools that run in "
+            "server mode. Requests are dispatched to the least loaded daemon. Default: 1."
+        ),
+    )
+    evm_group.addoption(
+        "--t8n-session",
+        action="store_true",
+        dest="t8n_session",
+        default=False,
+        help=(
+            "Keep the state of multi-block tests in the t8n-server between blocks, sending only "
+            "state differences, if the server supports sessions. Falls back to full requests "
+            "otherwise."
+        ),
+    )
+    evm_group.addoption(
+        "--t8n-scratch-dir",
+        action="store",
+        dest="t8n_scratch_dir",
+        type=Path,
+        default=None,
+        help=(
+            "Directory, ideally on a tmpfs such as '/dev/shm', in which transition tools that "
+            "exchange files (e.g. evmone-t8n) keep a reusable per-worker scratch area with "
+            "compact JSON inputs and outputs, instead of creating a temporary directory for "
+            "every call."
+        ),
+    )
+    evm_group.addoption(
+        "--t8n-profile",
+        action="store_true",
+        dest="t8n_profile",
+        default=False,
+        help=(
+            "Time each phase of the transition tool evaluations (request dump, IPC, JSON decode "
+            "and output validation) and count the bytes exchanged with the tool. Writes "
+            "'.meta/t8n_profile.json' with the statistics per test, module and fork and prints "
+            "a summary at the end of the session."
+        ),
+    )
     evm_group.addoption(
         "--traces",
         action="store_true",
@@ -146,6 +211,49 @@ def pytest_addoption(parser: pytest.Parser):
         default=None,
         help="Collect traces of the execution information from the transition tool.",
     )
+    evm_group.addoption(
+        "--trace-filter",
+        action="append",
+        dest="trace_filter",
+        type=str,
+        default=[],
+        help=(
+            "Only show the trace steps that match the filter; implies --traces. Can be given "
+            "multiple times: 'op=SSTORE,SLOAD' (opcode names), 'depth=1-2' and 'gas=1000-50000' "
+            "(inclusive ranges where either bound can be omitted)."
+        ),
+    )
+    evm_group.addoption(
+        "--t8n-cache-dir",
+        action="store",
+        dest="t8n_cache_dir",
+        type=Path,
+        default=default_t8n_cache_directory(),
+        help=(
+            "Directory used to cache transition tool results across fill runs. Results are keyed "
+            "by the t8n request and the t8n binary and version, and are not used when collecting "
+            "traces, dumping t8n debug output or when the t8n build cannot be pinned (e.g. EELS "
+            f"resolved to a local path). Default: '{default_t8n_cache_directory()}'."
+        ),
+    )
+    evm_group.addoption(
+        "--no-t8n-cache",
+        action="store_false",
+        dest="t8n_cache",
+        default=True,
+        help="Disable the transition tool result cache.",
+    )
+    evm_group.addoption(
+        "--t8n-cache-max-size",
+        action="store",
+        dest="t8n_cache_max_size",
+        type=int,
+        default=DEFAULT_CACHE_MAX_SIZE_MB,
+        help=(
+            "Maximum size in MB of the transition tool result cache; least recently used "
+            f"results are evicted once exceeded. Default: {DEFAULT_CACHE_MAX_SIZE_MB}."
+        ),
+    )
     evm_group.addoption(
         "--verify-fixtures",
         action="store_true",
@@ -169,6 +277,18 @@ def pytest_addoption(parser: pytest.Parser):
             "Default: The first (geth) 'evm' entry in PATH."
         ),
     )
+    evm_group.addoption(
+        "--verify-fixtures-workers",
+        action="store",
+        dest="verify_fixtures_workers",
+        type=int,
+        default=1,
+        help=(
+            "Number of processes used to verify the fixture files concurrently when "
+            "--verify-fixtures is enabled; each file is verified by a single consumer call. "
+            "Default: 1."
+        ),
+    )
 
     test_group = parser.getgroup("tests", "Arguments defining filler location and output")
     test_group.addoption(
@@ -187,9 +307,10 @@ def pytest_addoption(parser: pytest.Parser):
         default=Path(default_output_directory()),
         help=(
             "Directory path to store the generated test fixtures. Must be empty if it exists. "
-            "If the specified path ends in '.tar.gz', then the specified tarball is additionally "
-            "created (the fixtures are still written to the specified path without the '.tar.gz' "
-            f"suffix). Tarball output automatically enables --generate-all-formats. "
+            "If the specified path ends in '.tar.gz' or '.tar.zst', then the specified tarball is "
+            "additionally created (the fixtures are still written to the specified path without "
+            "the tarball suffix); '.tar.zst' requires the `zstandard` package. "
+            "Tarball output automatically enables --generate-all-formats. "
             f"Can be deleted. Default: '{default_output_directory()}'."
         ),
     )
@@ -217,6 +338,17 @@ def pytest_addoption(parser: pytest.Parser):
             "file. This can be used to increase the granularity of --verify-fixtures."
         ),
     )
+    test_group.addoption(
+        "--sharded-output",
+        action="store_true",
+        dest="sharded_output",
+        default=False,
+        help=(
+            "When running with xdist, let each worker write its own shard of the fixture files "
+            "without file locks; the shards are merged into the final sorted fixture files at "
+            "the end of the session."
+        ),
+    )
     test_group.addoption(
         "--no-html",
         action="store_true",
@@ -342,6 +474,9 @@ def pytest_configure(config):
     # Initialize fixture output configuration
     config.fixture_output = FixtureOutput.from_config(config)
 
+    if config.getoption("t8n_profile"):
+        config.t8n_profile = TransitionToolProfile()
+
     if is_help_or_collectonly_mode(config):
         return
 
@@ -358,6 +493,13 @@ def pytest_configure(config):
     ):
         config.option.htmlpath = config.fixture_output.directory / default_html_report_file_path()
 
+    try:
+        config.trace_filter = TraceFilter.from_options(config.getoption("trace_filter"))
+    except ValueError as e:
+        pytest.exit(str(e), returncode=pytest.ExitCode.USAGE_ERROR)
+    if config.trace_filter is not None:
+        config.option.evm_collect_traces = True
+
     # Instantiate the transition tool here to check that the binary path/trace option is valid.
     # This ensures we only raise an error once, if appropriate, instead of for every test.
     evm_bin = config.getoption("evm_bin")
@@ -433,6 +575,10 @@ def pytest_terminal_summary(
     yield
     if config.fixture_output.is_stdout or hasattr(config, "workerinput"):  # type: ignore[attr-defined]
         return
+    if hasattr(config, "t8n_profile") and config.t8n_profile.total.evaluations:
+        terminalreporter.write_sep("=", " t8n profile ")
+        for line in config.t8n_profile.summary_lines():
+            terminalreporter.write_line(line)
     stats = terminalreporter.stats
     if "passed" in stats and stats["passed"]:
         # Custom message for Phase 1 (pre-allocation group generation)
@@ -476,6 +622,15 @@ def pytest_terminal_summary(
             )
 
 
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Merge the transition tool profile of a finished xdist worker into the session profile."""
+    if hasattr(node.config, "t8n_profile") and "t8n_profile" in node.workeroutput:
+        node.config.t8n_profile.merge(
+            TransitionToolProfile.model_validate_json(node.workeroutput["t8n_profile"])
+        )
+
+
 def pytest_metadata(metadata):
     """Add or remove metadata to/from the pytest report."""
     metadata.pop("JAVA_HOME", None)
@@ -593,6 +748,13 @@ def t8n(
         t8n = TransitionTool.default_tool(**kwargs)
     else:
         t8n = TransitionTool.from_binary_path(binary_path=evm_bin, **kwargs)
+    t8n.daemon_count = request.config.getoption("t8n_daemons")
+    if request.config.getoption("t8n_session"):
+        t8n.t8n_use_session = True
+    if hasattr(request.config, "t8n_profile"):
+        t8n.profile = request.config.t8n_profile
+    t8n.scratch_dir = request.config.getoption("t8n_scratch_dir")
+    t8n.trace_filter = request.config.trace_filter  # type: ignore[attr-defined]
     if not t8n.exception_mapper.reliable:
         warnings.warn(
             f"The t8n tool that is currently being used to fill tests ({t8n.__class__.__name__}) "
@@ -601,6 +763,18 @@ def t8n(
             "exceptions.",
             stacklevel=2,
         )
+    if request.config.getoption("t8n_cache") and t8n.tool_identity() is None:
+        warnings.warn(
+            f"The build of the t8n tool that is currently being used to fill tests "
+            f"({t8n.__class__.__name__}) cannot be pinned, e.g. because it resolves to a local "
+            "path, a branch without a commit or an editable install. Its results are not cached.",
+            stacklevel=2,
+        )
+    elif request.config.getoption("t8n_cache"):
+        t8n.result_cache = TransitionToolCache(
+            request.config.getoption("t8n_cache_dir"),
+            max_size=request.config.getoption("t8n_cache_max_size") * 1024**2,
+        )
     yield t8n
     t8n.shutdown()
 
@@ -809,11 +983,19 @@ def fixture_collector(
         single_fixture_per_file=fixture_output.single_fixture_per_file,
         filler_path=filler_path,
         base_dump_dir=base_dump_dir,
+        shard_dir=(
+            fixture_output.get_shard_dir(request.config.workerinput["workerid"])  # type: ignore[attr-defined]
+            if fixture_output.sharded_output and hasattr(request.config, "workerinput")
+            else None
+        ),
     )
     yield fixture_collector
     fixture_collector.dump_fixtures()
     if do_fixture_verification:
-        fixture_collector.verify_fixture_files(evm_fixture_verification)
+        fixture_collector.verify_fixture_files(
+            evm_fixture_verification,
+            workers=request.config.getoption("verify_fixtures_workers"),
+        )
 
 
 @pytest.fixture(autouse=True, scope="session")
@@ -866,6 +1048,42 @@ def fixture_source_url(
     return github_url
 
 
+@pytest.fixture(scope="session")
+def built_chains() -> OrderedDict[str, Dict[str, Any]]:
+    """
+    Return the worker's memo of chains built by blockchain-based tests.
+
+    Chains are grouped by test parametrization (excluding the fixture format), so that all the
+    fixture formats filled for the same test and fork can share the blocks built by the t8n.
+    Only the most recently used parametrizations are kept.
+    """
+    return OrderedDict()
+
+
+def built_chains_for_node(
+    built_chains: OrderedDict[str, Dict[str, Any]], node: pytest.Item, spec_type: Type[BaseTest]
+) -> Dict[str, Any]:
+    """Return the built chains memo for the parametrization of the given node."""
+    format_ids = {
+        labeled_format_parameter_set(fixture_format).id
+        for fixture_format in spec_type.supported_fixture_formats
+    }
+    name, _, node_parameter_ids = node.nodeid.partition("[")
+    parameter_ids = [
+        parameter_id
+        for parameter_id in node_parameter_ids.removesuffix("]").split("-")
+        if parameter_id not in format_ids
+    ]
+    node_key = f"{name}[{'-'.join(parameter_ids)}]"
+    if node_key in built_chains:
+        built_chains.move_to_end(node_key)
+    else:
+        built_chains[node_key] = {}
+        while len(built_chains) > MAX_BUILT_CHAIN_TESTS:
+            built_chains.popitem(last=False)
+    return built_chains[node_key]
+
+
 def base_test_parametrizer(cls: Type[BaseTest]):
     """
     Generate pytest.fixture for a given BaseTest subclass.
@@ -889,6 +1107,7 @@ def base_test_parametrizer(cls: Type[BaseTest]):
         fixture_collector: FixtureCollector,
         test_case_description: str,
         fixture_source_url: str,
+        built_chains: OrderedDict[str, Dict[str, Any]],
     ):
         """
         Fixture used to instantiate an auto-fillable BaseTest object from within
@@ -916,6 +1135,14 @@ def base_test_parametrizer(cls: Type[BaseTest]):
                     kwargs["pre"] = pre
                 super(BaseTestWrapper, self).__init__(*args, **kwargs)
                 self._request = request
+                t8n.profile_test_id = request.node.nodeid
+                # Blocks can only be shared among formats if the t8n doesn't have to produce
+                # traces or debug output for each of them.
+                if (
+                    not request.config.getoption("evm_collect_traces")
+                    and dump_dir_parameter_level is None
+                ):
+                    self._built_chains = built_chains_for_node(built_chains, request.node, cls)
 
                 # Phase 1: Generate pre-allocation groups
                 if fixture_format is BlockchainEngineXFixture and request.config.getoption(
@@ -1150,9 +1377,11 @@ def pytest_sessionfinish(session: pytest.Session, exitstatus: int):
     Perform session finish tasks.
 
     - Save pre-allocation groups (phase 1)
+    - Write the transition tool profile, if enabled.
+    - Merge the fixture shards of the workers, if sharded output is enabled.
     - Remove any lock files that may have been created.
     - Generate index file for all produced fixtures.
-    - Create tarball of the output directory if the output is a tarball.
+    - Stream the fixture files into the tarball if the output is a tarball.
     """
     # Save pre-allocation groups after phase 1
     fixture_output = session.config.fixture_output  # type: ignore[attr-defined]
@@ -1165,11 +1394,26 @@ def pytest_sessionfinish(session: pytest.Session, exitstatus: int):
         return
 
     if xdist.is_xdist_worker(session):
+        if hasattr(session.config, "t8n_profile"):
+            session.config.workeroutput["t8n_profile"] = (  # type: ignore[attr-defined]
+                session.config.t8n_profile.model_dump_json()
+            )
         return
 
     if fixture_output.is_stdout or is_help_or_collectonly_mode(session.config):
         return
 
+    # Write the transition tool profile of all workers.
+    if hasattr(session.config, "t8n_profile"):
+        with open(fixture_output.metadata_dir / "t8n_profile.json", "w") as f:
+            f.write(session.config.t8n_profile.model_dump_json(by_alias=True, indent=2))
+
+    # Stream the fixture files into the tarball, if the output is a tarball, as they are merged.
+    tarball = fixture_output.open_tarball()
+
+    # Merge the fixture shards written by the workers.
+    fixture_output.merge_fixture_shards(on_merged=tarball.add if tarball is not None else None)
+
     # Remove any lock files that may have been created.
     for file in fixture_output.directory.rglob("*.lock"):
         file.unlink()
@@ -1182,5 +1426,6 @@ def pytest_sessionfinish(session: pytest.Session, exitstatus: int):
             fixture_output.directory, quiet_mode=True, force_flag=False, disable_infer_format=False
         )
 
-    # Create tarball of the output directory if the output is a tarball.
-    fixture_output.create_tarball()
+    # Add the remaining files, including the index, and finish the tarball.
+    if tarball is not None:
+        tarball.close()
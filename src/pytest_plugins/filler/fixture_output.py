@@ -1,13 +1,21 @@
 """Fixture output configuration for generated test fixtures."""
 
 import shutil
-import tarfile
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
+from typing import Callable, Dict, List, Optional
 
 import pytest
 from pydantic import BaseModel, Field
 
+from ethereum_test_fixtures.archive import (
+    FixtureTarballWriter,
+    import_zstandard,
+    strip_tarball_suffix,
+)
 from ethereum_test_fixtures.blockchain import BlockchainEngineXFixture
+from ethereum_test_fixtures.file import merge_fixture_shards
 
 
 class FixtureOutput(BaseModel):
@@ -41,6 +49,13 @@ class FixtureOutput(BaseModel):
         default=False,
         description="Generate all fixture formats including BlockchainEngineXFixture.",
     )
+    sharded_output: bool = Field(
+        default=False,
+        description=(
+            "Let each xdist worker write its own shard of the fixture files without locking and "
+            "merge the shards at the end of the session."
+        ),
+    )
 
     @property
     def directory(self) -> Path:
@@ -54,11 +69,19 @@ class FixtureOutput(BaseModel):
             return self.directory
         return self.directory / ".meta"
 
+    @property
+    def shards_dir(self) -> Path:
+        """Return the directory where the workers write their fixture shards."""
+        return self.directory / ".shards"
+
+    def get_shard_dir(self, worker_id: str) -> Path:
+        """Return the directory of the fixture shards of a single worker."""
+        return self.shards_dir / worker_id
+
     @property
     def is_tarball(self) -> bool:
-        """Return True if the output should be packaged as a tarball."""
-        path = self.output_path
-        return path.suffix == ".gz" and path.with_suffix("").suffix == ".tar"
+        """Return True if the output should be packaged as a `.tar.gz` or `.tar.zst` tarball."""
+        return self.is_tarball_path(self.output_path)
 
     @property
     def is_stdout(self) -> bool:
@@ -76,11 +99,16 @@ class FixtureOutput(BaseModel):
         """Check if all formats should be auto-enabled due to tarball output."""
         return self.is_tarball
 
+    @staticmethod
+    def is_tarball_path(path: Path) -> bool:
+        """Return True if the path ends in '.tar.gz' or '.tar.zst'."""
+        return path.suffix in {".gz", ".zst"} and path.with_suffix("").suffix == ".tar"
+
     @staticmethod
     def strip_tarball_suffix(path: Path) -> Path:
-        """Strip the '.tar.gz' suffix from the output path."""
-        if str(path).endswith(".tar.gz"):
-            return path.with_suffix("").with_suffix("")
+        """Strip the '.tar.gz' or '.tar.zst' suffix from the output path."""
+        if FixtureOutput.is_tarball_path(path):
+            return path.with_name(strip_tarball_suffix(path.name))
         return path
 
     def is_directory_empty(self) -> bool:
@@ -197,16 +225,57 @@ class FixtureOutput(BaseModel):
         if self.generate_pre_alloc_groups:
             self.pre_alloc_groups_folder_path.parent.mkdir(parents=True, exist_ok=True)
 
-    def create_tarball(self) -> None:
-        """Create tarball of the output directory if configured to do so."""
-        if not self.is_tarball:
+    def merge_fixture_shards(
+        self,
+        max_workers: int | None = None,
+        on_merged: Optional[Callable[[Path], None]] = None,
+    ) -> None:
+        """
+        Merge the fixture shards written by the workers into the final fixture files, merging
+        different files in parallel, and remove the shards.
+
+        `on_merged` is called with the path of each fixture file as soon as it is merged.
+        """
+        if not self.shards_dir.exists():
             return
+        shards: Dict[Path, List[Path]] = defaultdict(list)
+        for worker_dir in sorted(self.shards_dir.iterdir()):
+            for shard_path in sorted(worker_dir.rglob("*.json")):
+                shards[self.directory / shard_path.relative_to(worker_dir)].append(shard_path)
+        for file_path in shards:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+        if len(shards) > 1 and max_workers != 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(merge_fixture_shards, shard_paths, file_path): file_path
+                    for file_path, shard_paths in shards.items()
+                }
+                for future in as_completed(futures):
+                    future.result()
+                    if on_merged is not None:
+                        on_merged(futures[future])
+        else:
+            for file_path, shard_paths in shards.items():
+                merge_fixture_shards(shard_paths, file_path)
+                if on_merged is not None:
+                    on_merged(file_path)
+        shutil.rmtree(self.shards_dir)
+
+    def open_tarball(self, threads: int | None = None) -> Optional["FixtureTarballStream"]:
+        """
+        Start streaming the fixture files into the tarball, if configured to do so.
 
-        with tarfile.open(self.output_path, "w:gz") as tar:
-            for file in self.directory.rglob("*"):
-                if file.suffix in {".json", ".ini"}:
-                    arcname = Path("fixtures") / file.relative_to(self.directory)
-                    tar.add(file, arcname=arcname)
+        The tarball is compressed by `threads` threads while the fixture files are added.
+        """
+        if not self.is_tarball:
+            return None
+        return FixtureTarballStream(self, FixtureTarballWriter(self.output_path, threads=threads))
+
+    def create_tarball(self, threads: int | None = None) -> None:
+        """Create tarball of the output directory if configured to do so."""
+        tarball = self.open_tarball(threads=threads)
+        if tarball is not None:
+            tarball.close()
 
     @classmethod
     def from_config(cls, config: pytest.Config) -> "FixtureOutput":
@@ -215,9 +284,11 @@ class FixtureOutput(BaseModel):
         should_generate_all_formats = config.getoption("generate_all_formats")
 
         # Auto-enable --generate-all-formats for tarball output
-        # Use same logic as is_tarball property
-        if output_path.suffix == ".gz" and output_path.with_suffix("").suffix == ".tar":
+        if cls.is_tarball_path(output_path):
             should_generate_all_formats = True
+        # Fail before filling, not when the tarball is written, if zstd is unavailable
+        if output_path.name.endswith(".tar.zst"):
+            import_zstandard()
 
         return cls(
             output_path=output_path,
@@ -227,4 +298,35 @@ class FixtureOutput(BaseModel):
             generate_pre_alloc_groups=config.getoption("generate_pre_alloc_groups"),
             use_pre_alloc_groups=config.getoption("use_pre_alloc_groups"),
             should_generate_all_formats=should_generate_all_formats,
+            sharded_output=config.getoption("sharded_output"),
         )
+
+
+class FixtureTarballStream:
+    """
+    Add the files of a fixture output directory to its tarball as they are finished.
+
+    Files can be added in any order and each file is only added once; `close` adds the files
+    that were not added yet and finishes the tarball.
+    """
+
+    def __init__(self, fixture_output: FixtureOutput, writer: FixtureTarballWriter):
+        """Stream the files of `fixture_output` with the given tarball writer."""
+        self.fixture_output = fixture_output
+        self.writer = writer
+        self.added: set[Path] = set()
+
+    def add(self, file: Path) -> None:
+        """Add a finished fixture file, or metadata file, to the tarball."""
+        if file in self.added or file.suffix not in {".json", ".ini", ".sqlite"}:
+            return
+        self.added.add(file)
+        arcname = Path("fixtures") / file.relative_to(self.fixture_output.directory)
+        self.writer.add(file, arcname=arcname)
+
+    def close(self) -> None:
+        """Add all the remaining files of the output directory and finish the tarball."""
+        for file in sorted(self.fixture_output.directory.rglob("*")):
+            if self.fixture_output.shards_dir not in file.parents:
+                self.add(file)
+        self.writer.close()
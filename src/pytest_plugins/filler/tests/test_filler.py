@@ -554,7 +554,7 @@ def test_fixture_output_based_on_command_line_args(
     args.append("-v")
     args.append("--no-html")
     args.append("--t8n-server-url")
-    args.append(default_t8n.server_url)
+    args.append(default_t8n.managed_server_url)
 
     result = testdir.runpytest(*args)
     result.assert_outcomes(
@@ -608,7 +608,7 @@ def test_fixture_output_based_on_command_line_args(
     assert ini_file is not None, f"No {expected_ini_file} file was found in {meta_dir}"
     config = configparser.ConfigParser()
     ini_file_text = ini_file.read_text()
-    ini_file_text = ini_file_text.replace(default_t8n.server_url, "t8n_server_path")
+    ini_file_text = ini_file_text.replace(default_t8n.managed_server_url, "t8n_server_path")
     config.read_string(ini_file_text)
 
     if "--skip-index" not in args:
@@ -695,7 +695,7 @@ def test_fill_variables(
     args.append("state_test")
     args.append("--no-html")
     args.append("--t8n-server-url")
-    args.append(default_t8n.server_url)
+    args.append(default_t8n.managed_server_url)
     result = testdir.runpytest(*args)
     result.assert_outcomes(
         passed=1,
@@ -748,7 +748,7 @@ def test_fill_variables(
     assert ini_file is not None, f"No {expected_ini_file} file was found in {meta_dir}"
     config = configparser.ConfigParser()
     ini_file_text = ini_file.read_text()
-    ini_file_text = ini_file_text.replace(default_t8n.server_url, "t8n_server_path")
+    ini_file_text = ini_file_text.replace(default_t8n.managed_server_url, "t8n_server_path")
     config.read_string(ini_file_text)
 
     if "--skip-index" not in args:
@@ -1,12 +1,15 @@
 """Test the filler plugin's output directory handling."""
 
+import json
 from pathlib import Path
+from typing import List
 from unittest.mock import patch
 
 import pytest
 from pytest import TempPathFactory
 
 from ethereum_clis import TransitionTool
+from ethereum_test_fixtures.archive import open_fixture_tarball
 from pytest_plugins.filler.fixture_output import FixtureOutput
 
 
@@ -52,7 +55,7 @@ def run_fill(
             f"--from={fill_fork_from}",
             f"--until={fill_fork_until}",
             f"--output={str(output_dir)}",
-            f"--t8n-server-url={default_t8n.server_url}",
+            f"--t8n-server-url={default_t8n.managed_server_url}",
             str(test_path.name),
         ]
         if clean:
@@ -276,3 +279,61 @@ def test_stdout_skips_directory_operations_regardless_of_master():
         mock_exists.assert_not_called()
         mock_mkdir.assert_not_called()
         mock_rmtree.assert_not_called()
+
+
+def test_merge_fixture_shards(tmp_path: Path):
+    """Test that the shards of all workers are merged into the fixture files and removed."""
+    fixture_output = FixtureOutput(output_path=tmp_path / "fixtures", sharded_output=True)
+    module_file = Path("state_tests") / "cancun" / "test_module.json"
+    other_file = Path("state_tests") / "cancun" / "test_other.json"
+    for worker_id, names in [("gw0", ["a", "c"]), ("gw1", ["b"])]:
+        shard = fixture_output.get_shard_dir(worker_id) / module_file
+        shard.parent.mkdir(parents=True)
+        shard.write_text(json.dumps({name: {"name": name} for name in names}, indent=4))
+    other_shard = fixture_output.get_shard_dir("gw1") / other_file
+    other_shard.write_text(json.dumps({"d": {}}, indent=4))
+
+    fixture_output.merge_fixture_shards(max_workers=2)
+
+    assert not fixture_output.shards_dir.exists()
+    assert json.loads((fixture_output.directory / module_file).read_text()) == {
+        "a": {"name": "a"},
+        "b": {"name": "b"},
+        "c": {"name": "c"},
+    }
+    assert json.loads((fixture_output.directory / other_file).read_text()) == {"d": {}}
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_tarball_streams_merged_fixture_files(tmp_path: Path, max_workers: int):
+    """Test that the merged fixture files and the metadata files are all added to the tarball."""
+    fixture_output = FixtureOutput(output_path=tmp_path / "fixtures.tar.gz", sharded_output=True)
+    fixture_output.create_directories(is_master=True)
+    module_files = [Path("state_tests") / f"test_module_{i}.json" for i in range(3)]
+    for worker_id in ["gw0", "gw1"]:
+        for module_file in module_files:
+            shard = fixture_output.get_shard_dir(worker_id) / module_file
+            shard.parent.mkdir(parents=True, exist_ok=True)
+            shard.write_text(json.dumps({worker_id: {}}, indent=4))
+    tarball = fixture_output.open_tarball(threads=2)
+    assert tarball is not None
+
+    merged_files: List[Path] = []
+    fixture_output.merge_fixture_shards(
+        max_workers=max_workers, on_merged=lambda path: merged_files.append(path)
+    )
+    for file_path in merged_files:
+        tarball.add(file_path)
+    (fixture_output.metadata_dir / "index.json").write_text("{}")
+    (fixture_output.metadata_dir / "index.sqlite").write_bytes(b"")
+    tarball.close()
+
+    assert sorted(merged_files) == [fixture_output.directory / f for f in module_files]
+    with open(fixture_output.output_path, "rb") as f, open_fixture_tarball(f) as tar:
+        members = {member.name: tar.extractfile(member).read() for member in tar.getmembers()}  # type: ignore[union-attr]
+    assert sorted(members) == sorted(
+        [f"fixtures/{module_file}" for module_file in module_files]
+        + ["fixtures/.meta/index.json", "fixtures/.meta/index.sqlite"]
+    )
+    for module_file in module_files:
+        assert json.loads(members[f"fixtures/{module_file}"]) == {"gw0": {}, "gw1": {}}
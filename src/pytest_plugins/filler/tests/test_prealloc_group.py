@@ -330,8 +330,8 @@ def test_state_tests_pre_alloc_grouping(
         "--fork=Cancun",
         "--t8n-server-url",
     ]
-    assert default_t8n.server_url is not None
-    args.append(default_t8n.server_url)
+    assert default_t8n.managed_server_url is not None
+    args.append(default_t8n.managed_server_url)
     result = pytester.runpytest(*args)
     result.assert_outcomes(
         passed=len(environment_definitions),
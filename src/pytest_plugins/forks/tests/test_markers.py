@@ -146,6 +146,6 @@ def test_fork_markers(
         "-v",
         *pytest_args,
         "--t8n-server-url",
-        default_t8n.server_url,
+        default_t8n.managed_server_url,
     )
     result.assert_outcomes(**outcomes)